@@ -0,0 +1,80 @@
+#!/usr/bin/python
+
+# Comparação entre as formulações do termo RD (relação x distância entre disciplinas) e entre os solvers: a formulação
+# quadrática original (X[i][j]*X[ii][jj], MIQP binário não convexo) e a formulação linear (MILP) de
+# curriculumbalancing.modelo, em cada backend de curriculumbalancing.solvers (Gurobi e HiGHS; o HiGHS resolve apenas a
+# formulação linear). Para cada curso, solver e formulação, o modelo é construído uma vez e resolvido para um conjunto
+# de pesos; são registrados o tempo de construção, o tempo de resolução, o valor da função objetivo e os valores de C,
+# IR e RD.
+#
+# Uso: python benchmarkFormulacaoRD.py [limite de tempo por resolução em segundos] [--solvers gurobi highs]
+
+import argparse
+import os
+import time
+from datetime import datetime
+
+from curriculumbalancing import ModeloBalanceamento, formulacoesRD
+from curriculumbalancing.instancia import carregarInstancia
+from curriculumbalancing.solvers import GurobiError, solvers
+
+cursos = ['CCUFMG', 'ESIUFMG', 'SINUFMG', 'SINUFVJM']
+
+#diretório dos arquivos de instância
+diretorioInstancias = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instancias')
+
+#pesos (carga, retenção, relação) avaliados em cada formulação
+pesosBenchmark = [(0.0, 0.0, 1.0), (0.3, 0.3, 0.4), (0.5, 0.5, 0.0)]
+
+
+#Resolve o curso em um solver e uma formulação para todos os pesos e retorna uma linha de resultado por peso
+def executarFormulacao(curso, dados, solver, formulacaoRD, limiteTempo):
+    linhas = []
+    try:
+        inicio = time.perf_counter()
+        balanceamento = ModeloBalanceamento(dados, formulacaoRD, solver=solver)
+        tempoConstrucao = time.perf_counter() - inicio
+        modelo = balanceamento.modelo
+        if limiteTempo is not None:
+            modelo.parametro('limiteTempo', limiteTempo)
+        for pesoCarga, pesoRetencao, pesoRelacao in pesosBenchmark:
+            balanceamento.definirPesos(pesoCarga, pesoRetencao, pesoRelacao)
+            modelo.resolver()
+            linhas.append([curso, solver, formulacaoRD, pesoCarga, pesoRetencao, pesoRelacao,
+                           modelo.quantidadeVariaveis, modelo.quantidadeRestricoes, '%.3f' % tempoConstrucao,
+                           '%.3f' % modelo.tempo, modelo.status, '%g' % modelo.objetivo,
+                           round(modelo.valor(balanceamento.C)), round(modelo.valor(balanceamento.IR)),
+                           round(modelo.valor(balanceamento.RD)), ''])
+    except GurobiError as e:
+        linhas.append([curso, solver, formulacaoRD, '', '', '', '', '', '', '', '', '', '', '', '',
+                       'Error code ' + str(e.errno) + ": " + str(e)])
+    except (ImportError, ValueError) as e:
+        #solver não instalado ou formulação não suportada pelo solver
+        linhas.append([curso, solver, formulacaoRD, '', '', '', '', '', '', '', '', '', '', '', '', str(e)])
+    return linhas
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Comparação das formulações do termo RD e dos solvers')
+    parser.add_argument('limiteTempo', nargs='?', type=float, default=None,
+                        help='limite de tempo por resolução em segundos')
+    parser.add_argument('--solvers', nargs='+', choices=solvers, default=list(solvers),
+                        help='backends avaliados (padrão: todos)')
+    args = parser.parse_args()
+
+    cabecalho = ['curso', 'solver', 'formulacao', 'pesoCarga', 'pesoRetencao', 'pesoRelacao', 'variaveis',
+                 'restricoes', 'tempoConstrucao', 'tempoResolucao', 'status', 'objetivo', 'C', 'IR', 'RD', 'erro']
+    resultados = [cabecalho]
+    for curso in cursos:
+        dados = carregarInstancia(os.path.join(diretorioInstancias, curso + '.json'))
+        for solver in args.solvers:
+            for formulacaoRD in formulacoesRD:
+                for linha in executarFormulacao(curso, dados, solver, formulacaoRD, args.limiteTempo):
+                    print(';'.join(str(valor) for valor in linha))
+                    resultados.append(linha)
+
+    data_e_hora_em_texto = str(datetime.now()).replace(":", "_").replace(" ", "_")
+    os.makedirs("resultadosBenchmark", exist_ok=True)
+    arquivo = open("resultadosBenchmark/formulacaoRD " + data_e_hora_em_texto + ".txt", "a", encoding='utf-8')
+    arquivo.writelines(';'.join(str(valor) for valor in linha) + '\n' for linha in resultados)
+    arquivo.close()
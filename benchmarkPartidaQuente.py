@@ -0,0 +1,72 @@
+#!/usr/bin/python
+
+# Comparação da varredura de pesos com e sem partida quente. Sem partida quente, as combinações são resolvidas na ordem
+# original de gerarPesos, cada uma a partir do zero; com partida quente, são resolvidas em ordem serpentina sobre o
+# simplex de pesos e cada resolução recebe como solução inicial a alocação ótima da combinação anterior. Para cada curso
+# e modo são registrados o tempo de resolução de cada combinação e o tempo total da varredura.
+#
+# Uso: python benchmarkPartidaQuente.py [--formulacao-rd linear] [--solver gurobi] [--cursos CCUFMG ...]
+
+import argparse
+import os
+from datetime import datetime
+
+from curriculumbalancing import executarVarredura, formulacoesRD, gerarPesos
+from curriculumbalancing.instancia import carregarInstancia
+from curriculumbalancing.solvers import GurobiError, solvers
+
+cursos = ['CCUFMG', 'ESIUFMG', 'SINUFMG', 'SINUFVJM']
+
+#diretório dos arquivos de instância
+diretorioInstancias = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instancias')
+
+
+#Resolve a varredura completa do curso com ou sem partida quente e retorna uma linha por combinação e o tempo total
+def executarModo(curso, dados, solver, formulacaoRD, partidaQuente):
+    linhas = []
+    resultados = executarVarredura(dados, gerarPesos(), 1, 1, formulacaoRD, solver=solver,
+                                   partidaQuente=partidaQuente)
+    for resultado in resultados:
+        linhas.append([curso, solver, formulacaoRD, 'sim' if partidaQuente else 'nao', resultado['combinacao'],
+                       resultado['pesoCarga'], resultado['pesoRetencao'], resultado['pesoRelacao'],
+                       'sim' if resultado['partidaQuente'] else 'nao', '%.3f' % resultado['runtime'],
+                       resultado['status'], '%g' % resultado['objetivo']])
+    return linhas, sum(resultado['runtime'] for resultado in resultados)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Comparação da varredura de pesos com e sem partida quente')
+    parser.add_argument('--formulacao-rd', choices=formulacoesRD, default='linear',
+                        help="formulação do termo RD (padrão: 'linear')")
+    parser.add_argument('--solver', choices=solvers, default='gurobi', help='backend do solver')
+    parser.add_argument('--cursos', nargs='+', choices=cursos, default=cursos, help='cursos avaliados (padrão: todos)')
+    args = parser.parse_args()
+
+    cabecalho = ['curso', 'solver', 'formulacao', 'partidaQuente', 'combinacao', 'pesoCarga', 'pesoRetencao',
+                 'pesoRelacao', 'solucaoInicial', 'tempoResolucao', 'status', 'objetivo']
+    resultados = [cabecalho]
+    totais = [['curso', 'tempoSemPartidaQuente', 'tempoComPartidaQuente', 'aceleracao']]
+    for curso in cursos:
+        if curso not in args.cursos:
+            continue
+        dados = carregarInstancia(os.path.join(diretorioInstancias, curso + '.json'))
+        try:
+            tempos = {}
+            for partidaQuente in (False, True):
+                linhas, tempos[partidaQuente] = executarModo(curso, dados, args.solver, args.formulacao_rd,
+                                                             partidaQuente)
+                for linha in linhas:
+                    print(';'.join(str(valor) for valor in linha))
+                resultados.extend(linhas)
+            totais.append([curso, '%.3f' % tempos[False], '%.3f' % tempos[True],
+                           '%.2f' % (tempos[False] / tempos[True]) if tempos[True] > 0 else ''])
+        except GurobiError as e:
+            print(curso + ': Error code ' + str(e.errno) + ": " + str(e))
+
+    print('\n' + '\n'.join(';'.join(linha) for linha in totais))
+
+    data_e_hora_em_texto = str(datetime.now()).replace(":", "_").replace(" ", "_")
+    os.makedirs("resultadosBenchmark", exist_ok=True)
+    arquivo = open("resultadosBenchmark/partidaQuente " + data_e_hora_em_texto + ".txt", "a", encoding='utf-8')
+    arquivo.writelines(';'.join(str(valor) for valor in linha) + '\n' for linha in resultados + [[]] + totais)
+    arquivo.close()
@@ -0,0 +1,179 @@
+#!/usr/bin/python
+
+# Suíte de benchmark do balanceamento de currículo. Para cada instância (os quatro cursos e, opcionalmente, instâncias
+# adicionais, como as sintéticas), cada solver e cada formulação do termo RD, mede separadamente o tempo de cada fase:
+# leitura da instância, criação das variáveis, construção de RD, construção das restrições, resolução das combinações
+# de pesos, extração das soluções e gravação dos resultados; mede também o pico de memória do processo. Cada caso roda
+# em um processo próprio, para que o pico de memória (incluindo a do solver) seja apenas o do caso. As estatísticas do
+# solver de cada resolução (nós, iterações simplex, gap, trabalho, tamanho após o presolve) acompanham os tempos.
+# Os resultados são gravados em JSON Lines (uma linha por caso, com o commit do repositório), de forma que execuções
+# em commits diferentes possam ser comparadas.
+#
+# Instâncias sintéticas (gerarInstanciasSinteticas.py) podem ser geradas pela própria suíte com --sinteticas.
+#
+# Uso: python benchmarkSuite.py [--solvers gurobi highs] [--formulacoes linear quadratica] [--pesos benchmark]
+#                               [--limite-tempo segundos] [--instancias instância.json ou diretório ...]
+#                               [--sinteticas 100 500 1000 --periodos-sinteticas 10]
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+
+from curriculumbalancing import ModeloBalanceamento, formulacoesRD, gerarPesos
+from curriculumbalancing.armazenamento import RegistroResultados, linhaResultado
+from curriculumbalancing.instancia import carregarInstancia
+from curriculumbalancing.solvers import GurobiError, solvers
+from gerarInstanciasSinteticas import gravarInstancias
+
+cursos = ['CCUFMG', 'ESIUFMG', 'SINUFMG', 'SINUFVJM']
+
+#diretório dos arquivos de instância
+diretorioInstancias = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instancias')
+
+#conjuntos de pesos (carga, retenção, relação): os três pesos de benchmarkFormulacaoRD ou a grade completa
+conjuntosPesos = {'benchmark': [(0.0, 0.0, 1.0), (0.3, 0.3, 0.4), (0.5, 0.5, 0.0)], 'completo': gerarPesos()}
+
+#fases medidas, na ordem em que ocorrem
+fases = ('leitura', 'variaveis', 'RD', 'restricoes', 'resolucao', 'extracao', 'gravacao')
+
+
+#Pico de memória residente do processo corrente em MiB (ru_maxrss é dado em KiB no Linux e em bytes no macOS)
+def picoMemoria():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+#Executa um caso (instância, solver, formulação) e retorna o registro com os tempos de cada fase
+def executarCaso(caminho, solver, formulacaoRD, nomePesos, limiteTempo):
+    tempos = dict.fromkeys(fases, 0.0)
+    registro = {'instancia': os.path.splitext(os.path.basename(caminho))[0], 'solver': solver,
+                'formulacao': formulacaoRD, 'pesos': nomePesos, 'limiteTempo': limiteTempo}
+    try:
+        inicio = time.perf_counter()
+        dados = carregarInstancia(caminho)
+        tempos['leitura'] = time.perf_counter() - inicio
+        registro['disciplinas'] = len(dados['creditos'])
+        registro['periodos'] = dados['quantidadePeriodos']
+
+        balanceamento = ModeloBalanceamento(dados, formulacaoRD, solver=solver, threads=1)
+        tempos.update(balanceamento.temposConstrucao)
+        modelo = balanceamento.modelo
+        registro['variaveis'] = modelo.quantidadeVariaveis
+        registro['restricoes'] = modelo.quantidadeRestricoes
+        registro['variaveisXRemovidas'] = balanceamento.quantidadeVariaveisXRemovidas
+        registro['contagemRestricoes'] = balanceamento.contagemRestricoes
+        if limiteTempo is not None:
+            modelo.parametro('limiteTempo', limiteTempo)
+
+        resultados = []
+        statusResolucoes = []
+        estatisticas = []
+        for pesoCarga, pesoRetencao, pesoRelacao in conjuntosPesos[nomePesos]:
+            balanceamento.definirPesos(pesoCarga, pesoRetencao, pesoRelacao)
+            inicio = time.perf_counter()
+            modelo.resolver()
+            tempos['resolucao'] += time.perf_counter() - inicio
+            statusResolucoes.append(modelo.status)
+            estatisticas.append(modelo.estatisticas())
+
+            inicio = time.perf_counter()
+            resultados.append({'pesoCarga': pesoCarga, 'pesoRetencao': pesoRetencao, 'pesoRelacao': pesoRelacao,
+                               'runtime': modelo.tempo, 'status': modelo.status, 'objetivo': modelo.objetivo,
+                               'C': modelo.valor(balanceamento.C), 'IR': modelo.valor(balanceamento.IR),
+                               'RD': modelo.valor(balanceamento.RD), 'alocacao': balanceamento.alocacao()})
+            tempos['extracao'] += time.perf_counter() - inicio
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            inicio = time.perf_counter()
+            with RegistroResultados(os.path.join(diretorio, 'resultados'), ('csv', 'jsonl')) as gravacao:
+                for c, resultado in enumerate(resultados):
+                    gravacao.registrar(linhaResultado(registro['instancia'], c, resultado))
+            tempos['gravacao'] = time.perf_counter() - inicio
+
+        registro['resolucoes'] = len(resultados)
+        registro['status'] = statusResolucoes
+        registro['estatisticas'] = estatisticas
+        registro['objetivos'] = [resultado['objetivo'] for resultado in resultados]
+        registro['erro'] = ''
+    except GurobiError as e:
+        registro['erro'] = 'Error code ' + str(e.errno) + ": " + str(e)
+    except (ImportError, ValueError, RuntimeError) as e:
+        #solver não instalado, formulação não suportada pelo solver ou instância inválida
+        registro['erro'] = str(e)
+    registro['tempos'] = tempos
+    registro['tempoTotal'] = sum(tempos.values())
+    registro['picoMemoriaMiB'] = round(picoMemoria(), 1)
+    return registro
+
+
+#Executa o caso em um processo novo, para que o pico de memória medido seja apenas o do caso
+def executarCasoIsolado(*argumentos):
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        return executor.submit(executarCaso, *argumentos).result()
+
+
+#Commit corrente do repositório (vazio fora de um repositório git)
+def commitAtual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ''
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Suíte de benchmark por fase do balanceamento de currículo')
+    parser.add_argument('--solvers', nargs='+', choices=solvers, default=['gurobi'],
+                        help='backends avaliados (padrão: gurobi)')
+    parser.add_argument('--formulacoes', nargs='+', choices=formulacoesRD, default=['linear'],
+                        help="formulações do termo RD avaliadas (padrão: 'linear')")
+    parser.add_argument('--pesos', choices=sorted(conjuntosPesos), default='benchmark',
+                        help="'benchmark': 3 combinações de pesos; 'completo': as 66 combinações da varredura")
+    parser.add_argument('--limite-tempo', type=float, default=None, help='limite de tempo por resolução em segundos')
+    parser.add_argument('--cursos', nargs='*', choices=cursos, default=cursos,
+                        help='cursos reais avaliados (padrão: todos)')
+    parser.add_argument('--instancias', nargs='+', default=[],
+                        help='instâncias adicionais (.json) ou diretórios com instâncias, por exemplo sintéticas')
+    parser.add_argument('--sinteticas', nargs='+', type=int, default=[],
+                        help='quantidades de disciplinas das instâncias sintéticas geradas para a suíte')
+    parser.add_argument('--periodos-sinteticas', type=int, default=10,
+                        help='quantidade de períodos das instâncias sintéticas (padrão: 10)')
+    args = parser.parse_args()
+
+    caminhos = [os.path.join(diretorioInstancias, curso + '.json') for curso in args.cursos]
+    for caminho in args.instancias:
+        if os.path.isdir(caminho):
+            caminhos.extend(sorted(os.path.join(caminho, nome) for nome in os.listdir(caminho)
+                                   if nome.endswith('.json')))
+        else:
+            caminhos.append(caminho)
+    #instâncias sintéticas com semente fixa, idênticas entre execuções
+    caminhos.extend(gravarInstancias(args.sinteticas, os.path.join("resultadosBenchmark", "instanciasSinteticas"),
+                                     args.periodos_sinteticas))
+
+    data_e_hora_em_texto = str(datetime.now()).replace(":", "_").replace(" ", "_")
+    commit = commitAtual()
+    os.makedirs("resultadosBenchmark", exist_ok=True)
+    arquivo = open("resultadosBenchmark/suite " + data_e_hora_em_texto + ".jsonl", "a", encoding='utf-8')
+
+    print(';'.join(['instancia', 'solver', 'formulacao'] + list(fases) + ['tempoTotal', 'picoMemoriaMiB', 'erro']))
+    for caminho in caminhos:
+        for solver in args.solvers:
+            for formulacaoRD in args.formulacoes:
+                registro = executarCasoIsolado(caminho, solver, formulacaoRD, args.pesos, args.limite_tempo)
+                registro['commit'] = commit
+                registro['data'] = data_e_hora_em_texto
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+                arquivo.flush()
+                print(';'.join([registro['instancia'], solver, formulacaoRD] +
+                               ['%.3f' % registro['tempos'][fase] for fase in fases] +
+                               ['%.3f' % registro['tempoTotal'], str(registro['picoMemoriaMiB']), registro['erro']]))
+    arquivo.close()
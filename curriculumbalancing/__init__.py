@@ -0,0 +1,15 @@
+# Núcleo reutilizável do Problema do Balanceamento de Currículo: construção do modelo a partir dos dados de uma
+# instância (créditos, índices de retenção, pré-requisitos, relações entre disciplinas e limites), independente
+# do curso ao qual a instância se refere.
+
+from curriculumbalancing.avaliador import (AvaliadorIncremental, HeapMaximoIndexado)
+from curriculumbalancing.cache import CacheResolucoes
+from curriculumbalancing.heuristica import (InstanciaHeuristica, executarVarreduraHeuristica, recozimentoSimulado)
+from curriculumbalancing.modelo import (ModeloBalanceamento, construirRD, construirRDLinear, formulacoesRD)
+from curriculumbalancing.payoff import (TabelaPayoffIncompleta, calcularTabelaPayoff, hashInstancia,
+                                        limitesNormalizacao)
+from curriculumbalancing.relacoes import (RelacoesDisciplinas, comoRelacoes)
+from curriculumbalancing.restricoes import MontagemRestricoes
+from curriculumbalancing.pareto import (filtrarNaoDominados, fronteiraEpsilonRestrito)
+from curriculumbalancing.solvers import (SolverGurobi, SolverHighs, criarSolver, solvers)
+from curriculumbalancing.varredura import (executarVarredura, gerarPesos, ordemSerpentina)
@@ -0,0 +1,154 @@
+# Armazenamento estruturado dos resultados de uma execução: uma linha por resolução com os pesos, C, IR, RD, o valor
+# da função objetivo, status, gap, tempo de resolução e a matriz de alocação compactada (bits empacotados em base64).
+# As linhas são gravadas em CSV e/ou JSONL (e, opcionalmente, em Parquet quando pyarrow está instalado) por uma thread
+# em segundo plano, de forma que a escrita em disco se sobreponha à resolução seguinte.
+
+import base64
+import csv
+import json
+import queue
+import threading
+
+import numpy as np
+
+#formatos de saída disponíveis
+formatosResultados = ('csv', 'jsonl', 'parquet')
+
+#colunas de cada resolução, na ordem em que são gravadas
+colunasResultados = ('curso', 'combinacao', 'pesoCarga', 'pesoRetencao', 'pesoRelacao', 'C', 'IR', 'RD', 'objetivo',
+                     'status', 'gap', 'runtime', 'disciplinas', 'periodos', 'alocacao')
+
+
+#Compacta a matriz de alocação (disciplinas x períodos, 0/1) em texto base64 com 1 bit por posição
+def empacotarAlocacao(alocacao):
+    return base64.b64encode(np.packbits(np.asarray(alocacao, dtype=np.uint8)).tobytes()).decode('ascii')
+
+
+#Reconstrói a matriz de alocação a partir do texto gerado por empacotarAlocacao
+def desempacotarAlocacao(texto, disciplinas, periodos):
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(texto), dtype=np.uint8), count=disciplinas * periodos)
+    return bits.reshape(disciplinas, periodos).astype(np.int8)
+
+
+#Converte o resultado de uma resolução (dicionário produzido pela varredura ou pelo epsilon-restrito) em uma linha
+def linhaResultado(curso, combinacao, resultado):
+    alocacao = np.asarray(resultado['alocacao'])
+    return {
+        'curso': curso,
+        'combinacao': combinacao,
+        'pesoCarga': resultado.get('pesoCarga'),
+        'pesoRetencao': resultado.get('pesoRetencao'),
+        'pesoRelacao': resultado.get('pesoRelacao'),
+        'C': int(round(resultado['C'])),
+        'IR': int(round(resultado['IR'])),
+        'RD': int(round(resultado['RD'])),
+        'objetivo': resultado.get('objetivo'),
+        'status': resultado['status'],
+        'gap': resultado.get('gap'),
+        'runtime': resultado['runtime'],
+        'disciplinas': alocacao.shape[0],
+        'periodos': alocacao.shape[1],
+        'alocacao': empacotarAlocacao(alocacao)
+    }
+
+
+class RegistroResultados:
+    """Gravador das linhas de resultado em <caminhoBase>.<formato> para cada formato pedido.
+
+    ``registrar`` apenas enfileira a linha; a thread de escrita acumula até ``tamanhoLote`` linhas antes de gravá-las
+    e descarrega o restante em ``fechar``. Texto livre (relatório legível) pode ser enfileirado com ``registrarTexto``
+    e é gravado em <caminhoBase>.txt. Pode ser usado como gerenciador de contexto.
+    """
+
+    def __init__(self, caminhoBase, formatos=('csv', 'jsonl'), tamanhoLote=16):
+        for formato in formatos:
+            if formato not in formatosResultados:
+                raise ValueError("formato deve ser um de %s: %r" % (formatosResultados, formato))
+        if 'parquet' in formatos:
+            #dependência opcional, verificada antes de iniciar a execução
+            import pyarrow  # noqa: F401
+
+        self.caminhoBase = caminhoBase
+        self.formatos = tuple(formatos)
+        self.tamanhoLote = tamanhoLote
+        self._fila = queue.Queue()
+        self._colunas = {coluna: [] for coluna in colunasResultados}
+        self._erro = None
+        self._arquivos = {}
+        if 'csv' in self.formatos:
+            self._arquivos['csv'] = open(caminhoBase + '.csv', 'w', encoding='utf-8', newline='')
+            self._escritorCsv = csv.DictWriter(self._arquivos['csv'], fieldnames=colunasResultados, delimiter=';')
+            self._escritorCsv.writeheader()
+        if 'jsonl' in self.formatos:
+            self._arquivos['jsonl'] = open(caminhoBase + '.jsonl', 'w', encoding='utf-8')
+        self._thread = threading.Thread(target=self._escrever, name='RegistroResultados', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    #Enfileira uma linha (ver linhaResultado)
+    def registrar(self, linha):
+        self._fila.put(('linha', linha))
+
+    #Enfileira um trecho de texto do relatório legível
+    def registrarTexto(self, texto):
+        self._fila.put(('texto', texto))
+
+    #Aguarda a gravação de tudo o que foi enfileirado e fecha os arquivos
+    def fechar(self):
+        if self._thread is None:
+            return
+        self._fila.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._erro is not None:
+            raise self._erro
+
+    def _escrever(self):
+        linhas = []
+        textos = []
+        try:
+            while True:
+                item = self._fila.get()
+                if item is not None:
+                    tipo, conteudo = item
+                    (linhas if tipo == 'linha' else textos).append(conteudo)
+                if item is None or len(linhas) + len(textos) >= self.tamanhoLote:
+                    self._gravarLote(linhas, textos)
+                    linhas = []
+                    textos = []
+                if item is None:
+                    break
+            if 'parquet' in self.formatos:
+                self._gravarParquet()
+        except Exception as e:
+            self._erro = e
+        finally:
+            for arquivo in self._arquivos.values():
+                arquivo.close()
+
+    def _gravarLote(self, linhas, textos):
+        if 'csv' in self._arquivos:
+            self._escritorCsv.writerows(linhas)
+            self._arquivos['csv'].flush()
+        if 'jsonl' in self._arquivos:
+            self._arquivos['jsonl'].writelines(json.dumps(linha, ensure_ascii=False) + '\n' for linha in linhas)
+            self._arquivos['jsonl'].flush()
+        if textos:
+            if 'txt' not in self._arquivos:
+                self._arquivos['txt'] = open(self.caminhoBase + '.txt', 'w', encoding='utf-8')
+            self._arquivos['txt'].writelines(textos)
+            self._arquivos['txt'].flush()
+        if 'parquet' in self.formatos:
+            for linha in linhas:
+                for coluna in colunasResultados:
+                    self._colunas[coluna].append(linha[coluna])
+
+    def _gravarParquet(self):
+        import pyarrow
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(pyarrow.table(self._colunas), self.caminhoBase + '.parquet')
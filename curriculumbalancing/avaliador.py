@@ -0,0 +1,204 @@
+# Avaliação incremental de C, IR e RD para movimentos de disciplinas entre períodos.
+# O avaliador mantém, para a solução corrente (período de cada disciplina), as cargas, retenções e quantidades de
+# disciplinas por período, heaps de máximo indexados das cargas e das retenções e a adjacência de relações de cada
+# disciplina. Um movimento (lista de pares (disciplina, novo período), por exemplo uma realocação ou uma troca) é
+# avaliado sem ser aplicado, em tempo proporcional à soma dos graus das disciplinas movidas: os totais mudam apenas
+# nos períodos envolvidos, o novo máximo é lido do topo do heap e a variação de RD percorre apenas as relações das
+# disciplinas movidas.
+
+import math
+
+from curriculumbalancing.relacoes import comoRelacoes
+
+
+class HeapMaximoIndexado:
+    """Heap binário de máximo sobre valores indexados por chave (0..n-1), com atualização de valor em O(log n)."""
+
+    def __init__(self, valores):
+        self.valores = list(valores)
+        self.heap = sorted(range(len(self.valores)), key=lambda chave: -self.valores[chave])
+        self.posicao = [0] * len(self.valores)
+        for indice, chave in enumerate(self.heap):
+            self.posicao[chave] = indice
+
+    def maximo(self):
+        return self.valores[self.heap[0]]
+
+    def atualizar(self, chave, valor):
+        anterior = self.valores[chave]
+        self.valores[chave] = valor
+        if valor > anterior:
+            self._subir(self.posicao[chave])
+        elif valor < anterior:
+            self._descer(self.posicao[chave])
+
+    #Maior valor entre as chaves fora de excluidas. O maior elemento não excluído só pode estar abaixo de elementos
+    #excluídos, de modo que a busca desce apenas por eles (no máximo 2*len(excluidas) + 1 nós visitados)
+    def maximoExceto(self, excluidas):
+        heap, valores = self.heap, self.valores
+        melhor = -math.inf
+        pendentes = [0] if heap else []
+        while pendentes:
+            indice = pendentes.pop()
+            chave = heap[indice]
+            if chave in excluidas:
+                for filho in (2 * indice + 1, 2 * indice + 2):
+                    if filho < len(heap):
+                        pendentes.append(filho)
+            elif valores[chave] > melhor:
+                melhor = valores[chave]
+        return melhor
+
+    def _trocar(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.posicao[heap[i]] = i
+        self.posicao[heap[j]] = j
+
+    def _subir(self, indice):
+        valores, heap = self.valores, self.heap
+        while indice > 0:
+            pai = (indice - 1) // 2
+            if valores[heap[pai]] >= valores[heap[indice]]:
+                break
+            self._trocar(indice, pai)
+            indice = pai
+
+    def _descer(self, indice):
+        valores, heap = self.valores, self.heap
+        tamanho = len(heap)
+        while True:
+            maior = indice
+            for filho in (2 * indice + 1, 2 * indice + 2):
+                if filho < tamanho and valores[heap[filho]] > valores[heap[maior]]:
+                    maior = filho
+            if maior == indice:
+                break
+            self._trocar(indice, maior)
+            indice = maior
+
+
+class AvaliadorIncremental:
+    """Estado avaliável de uma solução: ``periodo`` (período de cada disciplina), totais por período, heaps de máximo
+    de cargas e retenções, RD corrente e violação corrente dos limites de carga e de quantidade por período.
+
+    ``avaliar`` devolve C, IR, RD e a variação da violação dos limites após um movimento, sem aplicá-lo; ``aplicar``
+    efetiva o movimento. Ambos custam O(soma dos graus das disciplinas movidas + log(períodos)).
+    """
+
+    def __init__(self, dados, periodo):
+        self.creditos = [int(credito) for credito in dados['creditos']]
+        self.indicesRetencao = [int(indice) for indice in dados['indicesRetencao']]
+        self.distancia = [list(linha) for linha in dados['distanciaSemestres']]
+        quantidadePeriodos = dados['quantidadePeriodos']
+        self.cargaMinima = dados['cargaMinimaPorPeriodo']
+        self.cargaMaxima = math.inf if dados['cargaMaximaPorPeriodo'] is None else dados['cargaMaximaPorPeriodo']
+        self.quantidadeMinima = dados['quantidadeMinimaDisciplinasPorPeriodo']
+        self.quantidadeMaxima = dados['quantidadeMaximaDisciplinasPorPeriodo']
+
+        #adjacência: (outra disciplina, grau, True quando a disciplina é a origem da relação)
+        relacoes = comoRelacoes(dados['relacaoRelacaoDisciplinas'])
+        self.adjacencia = [[] for _ in self.creditos]
+        for origem, destino, grau in relacoes.arestas():
+            if origem != destino:
+                self.adjacencia[origem].append((destino, grau, True))
+                self.adjacencia[destino].append((origem, grau, False))
+
+        self.periodo = list(periodo)
+        self.cargas = [0] * quantidadePeriodos
+        self.retencoes = [0] * quantidadePeriodos
+        self.quantidades = [0] * quantidadePeriodos
+        for i, j in enumerate(self.periodo):
+            self.cargas[j] += self.creditos[i]
+            self.retencoes[j] += self.indicesRetencao[i]
+            self.quantidades[j] += 1
+        self.heapCargas = HeapMaximoIndexado(self.cargas)
+        self.heapRetencoes = HeapMaximoIndexado(self.retencoes)
+        self.RD = sum(grau * self.distancia[self.periodo[origem]][self.periodo[destino]]
+                      for origem, destino, grau in relacoes.arestas() if origem != destino)
+        self.violacao = sum(self._violacaoPeriodo(carga, quantidade)
+                            for carga, quantidade in zip(self.cargas, self.quantidades))
+
+    @property
+    def C(self):
+        return self.heapCargas.maximo()
+
+    @property
+    def IR(self):
+        return self.heapRetencoes.maximo()
+
+    def _violacaoPeriodo(self, carga, quantidade):
+        return (max(0, self.cargaMinima - carga) + max(0, carga - self.cargaMaxima) +
+                max(0, self.quantidadeMinima - quantidade) + max(0, quantidade - self.quantidadeMaxima))
+
+    #Variações de carga, retenção e quantidade por período provocadas pelo movimento
+    def _variacoesPorPeriodo(self, movimento):
+        variacoes = {}
+        for i, j in movimento:
+            anterior = self.periodo[i]
+            if anterior == j:
+                continue
+            for periodo, sinal in ((anterior, -1), (j, 1)):
+                carga, retencao, quantidade = variacoes.get(periodo, (0, 0, 0))
+                variacoes[periodo] = (carga + sinal * self.creditos[i], retencao + sinal * self.indicesRetencao[i],
+                                      quantidade + sinal)
+        return variacoes
+
+    #Variação de RD: cada relação com ao menos uma disciplina movida é contada uma vez
+    def _variacaoRD(self, movimento):
+        novos = dict(movimento)
+        periodo, distancia = self.periodo, self.distancia
+        variacao = 0
+        for i, j in novos.items():
+            anterior = periodo[i]
+            for outra, grau, origem in self.adjacencia[i]:
+                if outra in novos:
+                    if outra < i:
+                        continue
+                    novoOutra = novos[outra]
+                else:
+                    novoOutra = periodo[outra]
+                if origem:
+                    variacao += grau * (distancia[j][novoOutra] - distancia[anterior][periodo[outra]])
+                else:
+                    variacao += grau * (distancia[novoOutra][j] - distancia[periodo[outra]][anterior])
+        return variacao
+
+    #Avalia o movimento (lista de pares (disciplina, novo período)) sem aplicá-lo.
+    #Retorna (C, IR, RD, variação da violação dos limites de carga e de quantidade)
+    def avaliar(self, movimento):
+        variacoes = self._variacoesPorPeriodo(movimento)
+        C = self.heapCargas.maximoExceto(variacoes)
+        IR = self.heapRetencoes.maximoExceto(variacoes)
+        variacaoViolacao = 0
+        for j, (carga, retencao, quantidade) in variacoes.items():
+            C = max(C, self.cargas[j] + carga)
+            IR = max(IR, self.retencoes[j] + retencao)
+            variacaoViolacao += (self._violacaoPeriodo(self.cargas[j] + carga, self.quantidades[j] + quantidade) -
+                                 self._violacaoPeriodo(self.cargas[j], self.quantidades[j]))
+        return C, IR, self.RD + self._variacaoRD(movimento), variacaoViolacao
+
+    #Realocação da disciplina i para o período j
+    def avaliarRealocacao(self, i, j):
+        return self.avaliar([(i, j)])
+
+    #Troca de períodos entre as disciplinas i e k
+    def avaliarTroca(self, i, k):
+        return self.avaliar([(i, self.periodo[k]), (k, self.periodo[i])])
+
+    #Aplica o movimento e retorna o movimento inverso
+    def aplicar(self, movimento):
+        inverso = [(i, self.periodo[i]) for i, _ in movimento]
+        variacoes = self._variacoesPorPeriodo(movimento)
+        self.RD += self._variacaoRD(movimento)
+        for j, (carga, retencao, quantidade) in variacoes.items():
+            self.violacao -= self._violacaoPeriodo(self.cargas[j], self.quantidades[j])
+            self.cargas[j] += carga
+            self.retencoes[j] += retencao
+            self.quantidades[j] += quantidade
+            self.violacao += self._violacaoPeriodo(self.cargas[j], self.quantidades[j])
+            self.heapCargas.atualizar(j, self.cargas[j])
+            self.heapRetencoes.atualizar(j, self.retencoes[j])
+        for i, j in movimento:
+            self.periodo[i] = j
+        return inverso
@@ -0,0 +1,90 @@
+# Cache persistente das resoluções da varredura de pesos. Cada resolução é guardada em um arquivo JSON cujo nome é o
+# hash canônico da instância (hashInstancia: créditos, retenções, pré-requisitos, relações, limites e quantidade de
+# períodos), dos limites de normalização, da formulação do termo RD, do solver e dos seus parâmetros e dos pesos.
+# O arquivo contém os valores de C, IR e RD, o valor da função objetivo, o status, o gap, o tempo da resolução original
+# e a matriz de alocação compactada, o suficiente para regenerar os relatórios sem resolver o modelo novamente.
+# Quando o tamanho total do diretório passa de tamanhoMaximo bytes, as entradas usadas há mais tempo são removidas.
+
+import hashlib
+import json
+import os
+
+from curriculumbalancing.armazenamento import desempacotarAlocacao, empacotarAlocacao
+from curriculumbalancing.payoff import hashInstancia
+
+#limites de normalização, que alteram a função objetivo ponderada mas não o conjunto de soluções viáveis
+_chavesLimites = ('minCarga', 'maxCarga', 'minRetencao', 'maxRetencao', 'minRelacao', 'maxRelacao')
+
+#campos de um resultado guardados no cache, além da alocação
+_camposResultado = ('pesoCarga', 'pesoRetencao', 'pesoRelacao', 'runtime', 'status', 'objetivo', 'C', 'IR', 'RD',
+                    'quantidadeTermosRD')
+
+
+class CacheResolucoes:
+    """Cache em disco (diretorio/<chave>.json) das resoluções de combinações de pesos, com remoção das entradas menos
+    recentemente usadas quando o total ultrapassa ``tamanhoMaximo`` bytes."""
+
+    def __init__(self, diretorio='cacheResolucoes', tamanhoMaximo=256 * 1024 * 1024):
+        self.diretorio = diretorio
+        self.tamanhoMaximo = tamanhoMaximo
+        os.makedirs(diretorio, exist_ok=True)
+        self._tamanho = sum(entrada.stat().st_size for entrada in os.scandir(diretorio)
+                            if entrada.name.endswith('.json'))
+
+    #Prefixo da chave de uma instância resolvida com uma formulação, um solver e parâmetros do solver (dicionário);
+    #calculado uma vez e combinado com os pesos de cada resolução em chave
+    def prefixo(self, dados, formulacaoRD, solver, parametros=None):
+        canonico = {'instancia': hashInstancia(dados), 'limites': [dados.get(chave) for chave in _chavesLimites],
+                    'formulacaoRD': formulacaoRD, 'solver': solver, 'parametros': parametros or {}}
+        return json.dumps(canonico, sort_keys=True, separators=(',', ':'))
+
+    def chave(self, prefixo, pesos):
+        texto = prefixo + json.dumps([float(peso) for peso in pesos])
+        return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+    def _arquivo(self, chave):
+        return os.path.join(self.diretorio, chave + '.json')
+
+    #Resultado guardado para os pesos (carga, retenção, relação) ou None; a entrada lida passa a ser a mais recente
+    def obter(self, prefixo, pesos):
+        arquivo = self._arquivo(self.chave(prefixo, pesos))
+        try:
+            with open(arquivo, encoding='utf-8') as entrada:
+                conteudo = json.load(entrada)
+            os.utime(arquivo)
+        except (OSError, ValueError):
+            return None
+        resultado = {campo: conteudo[campo] for campo in _camposResultado}
+        resultado['alocacao'] = desempacotarAlocacao(conteudo['alocacao'], conteudo['disciplinas'],
+                                                     conteudo['periodos'])
+        #entradas gravadas antes do registro do gap não o possuem
+        resultado['gap'] = conteudo.get('gap')
+        resultado['cache'] = True
+        return resultado
+
+    #Guarda o resultado de uma resolução (dicionário produzido pela varredura)
+    def guardar(self, prefixo, pesos, resultado):
+        conteudo = {campo: resultado[campo] for campo in _camposResultado}
+        conteudo['C'], conteudo['IR'], conteudo['RD'] = (float(resultado[criterio]) for criterio in ('C', 'IR', 'RD'))
+        conteudo['gap'] = resultado.get('gap')
+        conteudo['disciplinas'], conteudo['periodos'] = resultado['alocacao'].shape
+        conteudo['alocacao'] = empacotarAlocacao(resultado['alocacao'])
+        arquivo = self._arquivo(self.chave(prefixo, pesos))
+        temporario = arquivo + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as saida:
+            json.dump(conteudo, saida)
+        anterior = os.path.getsize(arquivo) if os.path.exists(arquivo) else 0
+        os.replace(temporario, arquivo)
+        self._tamanho += os.path.getsize(arquivo) - anterior
+        if self._tamanho > self.tamanhoMaximo:
+            self._remover()
+
+    #Remove as entradas menos recentemente usadas até o total voltar a caber em tamanhoMaximo
+    def _remover(self):
+        entradas = sorted((entrada.stat().st_mtime, entrada.stat().st_size, entrada.path)
+                          for entrada in os.scandir(self.diretorio) if entrada.name.endswith('.json'))
+        for _, tamanho, caminho in entradas:
+            if self._tamanho <= self.tamanhoMaximo:
+                break
+            os.remove(caminho)
+            self._tamanho -= tamanho
@@ -0,0 +1,324 @@
+# Busca local (simulated annealing) para o Problema do Balanceamento de Currículo, para currículos grandes demais para
+# o modelo exato. Trabalha sobre os mesmos dados de instância (creditos, indicesRetencao, prerequisitos,
+# relacaoRelacaoDisciplinas, distanciaSemestres e limites) e minimiza a mesma função objetivo ponderada de
+# ModeloBalanceamento.definirPesos.
+# A solução é o período de cada disciplina. Os movimentos são a realocação de uma disciplina para outro período e a
+# troca de períodos entre duas disciplinas; só são aplicados movimentos que mantêm a solução viável (posições fixas,
+# pré-requisitos, restrições de posicionamento por grau de relação e limites mínimos/máximos de carga e de quantidade
+# de disciplinas por período). A solução inicial é construída pelo menor período compatível com as precedências e
+# reparada, com os mesmos movimentos, até respeitar os limites de carga e de quantidade. Cada movimento sorteado é
+# avaliado incrementalmente (AvaliadorIncremental) e só é aplicado se for aceito.
+
+import math
+import random
+import time
+
+import numpy as np
+
+from curriculumbalancing.avaliador import AvaliadorIncremental
+from curriculumbalancing.modelo import relacaoNivel3, relacaoNivel9
+from curriculumbalancing.precedencias import janelasPeriodos, reducaoTransitiva
+from curriculumbalancing.relacoes import comoRelacoes
+from curriculumbalancing.solvers import INVIAVEL, LIMITE_TEMPO
+
+#probabilidade de sortear uma troca em vez de uma realocação
+probabilidadeTroca = 0.5
+#fração do tempo disponível reservada à reparação da solução inicial
+fracaoReparacao = 0.5
+#temperatura final do resfriamento, relativa à temperatura inicial
+temperaturaFinalRelativa = 1e-3
+#temperatura da reparação da solução inicial (em unidades de violação: créditos e disciplinas)
+temperaturaReparacao = 1.0
+#quantidade máxima de disciplinas deslocadas por uma realocação em cadeia
+tamanhoCadeia = 8
+
+
+class InstanciaHeuristica:
+    """Dados de uma instância em vetores NumPy, com os intervalos de períodos admissíveis de cada disciplina e as
+    restrições de diferença de períodos entre pares de disciplinas, usados pela busca local."""
+
+    def __init__(self, dados):
+        self.dados = dados
+        self.creditos = np.asarray(dados['creditos'], dtype=np.int64)
+        self.indicesRetencao = np.asarray(dados['indicesRetencao'], dtype=np.int64)
+        self.quantidadeDisciplinas = quantidadeDisciplinas = len(self.creditos)
+        self.quantidadePeriodos = quantidadePeriodos = dados['quantidadePeriodos']
+        self.distancia = np.asarray(dados['distanciaSemestres'], dtype=np.int64)
+
+        relacoes = comoRelacoes(dados['relacaoRelacaoDisciplinas'])
+        arestas = [(origem, destino, grau) for origem, destino, grau in relacoes.arestas() if origem != destino]
+        self.origens = np.array([origem for origem, _, _ in arestas], dtype=np.int64)
+        self.destinos = np.array([destino for _, destino, _ in arestas], dtype=np.int64)
+        self.graus = np.array([grau for _, _, grau in arestas], dtype=np.int64)
+
+        #intervalo [minimo, maximo] de períodos admissíveis de cada disciplina: as janelas de períodos das posições fixas
+        #estreitadas pelas precedências (as mesmas do modelo exato)
+        self.minimo, self.maximo = janelasPeriodos(dados, relacaoNivel3, relacaoNivel9)
+        self.moveis = [i for i in range(quantidadeDisciplinas) if self.minimo[i] < self.maximo[i]]
+
+        #pares[a] contém (b, minimo, maximo): minimo <= periodo[b] - periodo[a] <= maximo
+        self.pares = [[] for _ in range(quantidadeDisciplinas)]
+        for i, requisitos in reducaoTransitiva(dados['prerequisitos'], quantidadeDisciplinas).items():
+            for pr in requisitos:
+                self._adicionarPar(pr, i, 1, math.inf)
+        for origem, destino, grau in arestas:
+            minimo = dados['diferencaMinimaPeriodosRelacaoNivel3'] if grau >= relacaoNivel3 else -math.inf
+            maximo = dados['diferencaMaximaPeriodosRelacaoNivel9'] if grau == relacaoNivel9 else math.inf
+            if minimo != -math.inf or maximo != math.inf:
+                self._adicionarPar(origem, destino, minimo, maximo)
+
+        self.cargaMinima = dados['cargaMinimaPorPeriodo']
+        self.cargaMaxima = math.inf if dados['cargaMaximaPorPeriodo'] is None else dados['cargaMaximaPorPeriodo']
+        self.quantidadeMinima = dados['quantidadeMinimaDisciplinasPorPeriodo']
+        self.quantidadeMaxima = dados['quantidadeMaximaDisciplinasPorPeriodo']
+
+    def _adicionarPar(self, a, b, minimo, maximo):
+        self.pares[a].append((b, minimo, maximo))
+        self.pares[b].append((a, -maximo, -minimo))
+
+    #Indica se a disciplina i pode ocupar o período j dadas as posições atuais das demais; a disciplina outra, quando
+    #informada, é considerada no período periodoOutra (troca)
+    def posicaoAdmissivel(self, periodo, i, j, outra=None, periodoOutra=None):
+        if j < self.minimo[i] or j > self.maximo[i]:
+            return False
+        for b, minimo, maximo in self.pares[i]:
+            diferenca = (periodoOutra if b == outra else periodo[b]) - j
+            if diferenca < minimo or diferenca > maximo:
+                return False
+        return True
+
+    #Menor período de cada disciplina compatível com os intervalos e as restrições entre pares (ponto fixo das
+    #restrições de limite inferior); retorna None quando as precedências não admitem solução
+    def periodosMaisCedo(self):
+        periodo = list(self.minimo)
+        for _ in range(self.quantidadeDisciplinas + 1):
+            alterado = False
+            for a in range(self.quantidadeDisciplinas):
+                for b, minimo, _ in self.pares[a]:
+                    if periodo[a] + minimo > periodo[b]:
+                        periodo[b] = periodo[a] + minimo
+                        alterado = True
+            if not alterado:
+                break
+        if any(periodo[i] > self.maximo[i] for i in range(self.quantidadeDisciplinas)):
+            return None
+        if not all(self.posicaoAdmissivel(periodo, i, periodo[i]) for i in range(self.quantidadeDisciplinas)):
+            return None
+        return periodo
+
+    #Valores de C, IR e RD de uma solução (vetor com o período de cada disciplina)
+    def criterios(self, periodo):
+        periodo = np.asarray(periodo)
+        cargas = np.bincount(periodo, weights=self.creditos, minlength=self.quantidadePeriodos)
+        retencoes = np.bincount(periodo, weights=self.indicesRetencao, minlength=self.quantidadePeriodos)
+        RD = int(np.dot(self.graus, self.distancia[periodo[self.origens], periodo[self.destinos]]))
+        return int(cargas.max()), int(retencoes.max()), RD
+
+    #Função objetivo ponderada com a normalização de ModeloBalanceamento.definirPesos
+    def objetivo(self, C, IR, RD, pesoCarga, pesoRetencao, pesoRelacao):
+        dados = self.dados
+        return (pesoCarga * (C - dados['minCarga']) / (dados['maxCarga'] - dados['minCarga']) +
+                pesoRetencao * (IR - dados['minRetencao']) / (dados['maxRetencao'] - dados['minRetencao']) +
+                pesoRelacao * (RD - dados['minRelacao']) / (dados['maxRelacao'] - dados['minRelacao']))
+
+    def alocacao(self, periodo):
+        alocacao = np.zeros((self.quantidadeDisciplinas, self.quantidadePeriodos), dtype=np.int8)
+        alocacao[np.arange(self.quantidadeDisciplinas), periodo] = 1
+        return alocacao
+
+
+class _Estado:
+    """Solução corrente: avaliador incremental (períodos, totais por período, RD e violação dos limites) e disciplinas
+    móveis de cada período."""
+
+    def __init__(self, instancia, periodo):
+        self.instancia = instancia
+        self.avaliador = AvaliadorIncremental(instancia.dados, periodo)
+        self.periodo = self.avaliador.periodo
+        #disciplinas móveis de cada período (lista com remoção em O(1) pela posição guardada em indiceMembro)
+        self.membros = [[] for _ in range(instancia.quantidadePeriodos)]
+        self.indiceMembro = {}
+        for i, j in enumerate(self.periodo):
+            self._incluir(i, j)
+
+    def _incluir(self, i, j):
+        if self.instancia.minimo[i] == self.instancia.maximo[i]:
+            return
+        self.indiceMembro[i] = len(self.membros[j])
+        self.membros[j].append(i)
+
+    def _excluir(self, i, j):
+        if self.instancia.minimo[i] == self.instancia.maximo[i]:
+            return
+        membros = self.membros[j]
+        ultimo = membros.pop()
+        if ultimo != i:
+            membros[self.indiceMembro[i]] = ultimo
+            self.indiceMembro[ultimo] = self.indiceMembro[i]
+
+    #Sorteia um movimento que respeita as precedências, na forma de uma lista de pares (disciplina, novo período):
+    #  - troca: duas disciplinas de períodos distintos trocam de período;
+    #  - realocação em cadeia: a disciplina vai para um período da sua faixa [minimo, maximo] e as disciplinas ligadas
+    #    a ela por restrições de pares que deixarem de ser respeitadas são empurradas para o período mais próximo que
+    #    as respeite, recursivamente (até tamanhoCadeia disciplinas).
+    #Retorna None quando o sorteio não produz um movimento admissível
+    def sortearMovimento(self, gerador):
+        instancia = self.instancia
+        periodo = self.periodo
+        i = gerador.choice(instancia.moveis)
+        a = periodo[i]
+        inferior, superior = instancia.minimo[i], instancia.maximo[i]
+        j = gerador.randint(inferior, superior - 1)
+        j = j + 1 if j >= a else j
+        if gerador.random() < probabilidadeTroca:
+            if not self.membros[j]:
+                return None
+            k = gerador.choice(self.membros[j])
+            if instancia.posicaoAdmissivel(periodo, i, j, k, a) and instancia.posicaoAdmissivel(periodo, k, a, i, j):
+                return [(i, j), (k, a)]
+            return None
+        return self._cadeia(i, j)
+
+    def _cadeia(self, i, j):
+        instancia = self.instancia
+        periodo = self.periodo
+        novos = {i: j}
+        pendentes = [i]
+        while pendentes:
+            x = pendentes.pop()
+            px = novos[x]
+            for b, minimo, maximo in instancia.pares[x]:
+                diferenca = novos.get(b, periodo[b]) - px
+                if minimo <= diferenca <= maximo:
+                    continue
+                alvo = px + minimo if diferenca < minimo else px + maximo
+                if b in novos or alvo < instancia.minimo[b] or alvo > instancia.maximo[b] or \
+                        len(novos) >= tamanhoCadeia:
+                    return None
+                novos[b] = alvo
+                pendentes.append(b)
+        return list(novos.items())
+
+    #Aplica o movimento e retorna o movimento inverso
+    def aplicar(self, movimento):
+        for i, j in movimento:
+            self._excluir(i, self.periodo[i])
+            self._incluir(i, j)
+        return self.avaliador.aplicar(movimento)
+
+
+#Constrói uma solução viável: períodos mais cedo compatíveis com as precedências, reparados pelos mesmos movimentos
+#da busca (aceitando pioras da violação dos limites de carga e quantidade com probabilidade exp(-piora /
+#temperaturaReparacao)). Retorna o estado ou None se o prazo terminar antes
+def _solucaoInicial(instancia, gerador, prazo, periodoInicial=None):
+    if periodoInicial is None:
+        periodoInicial = instancia.periodosMaisCedo()
+        if periodoInicial is None:
+            return None
+    estado = _Estado(instancia, periodoInicial)
+    avaliador = estado.avaliador
+    iteracao = 0
+    while avaliador.violacao > 0:
+        iteracao += 1
+        if iteracao % 256 == 0 and time.perf_counter() > prazo:
+            return None
+        movimento = estado.sortearMovimento(gerador)
+        if movimento is None:
+            continue
+        piora = avaliador.avaliar(movimento)[3]
+        if piora <= 0 or gerador.random() < math.exp(-piora / temperaturaReparacao):
+            estado.aplicar(movimento)
+    return estado
+
+
+#Resolve uma combinação de pesos por simulated annealing dentro de tempoLimite segundos. periodoInicial (período de
+#cada disciplina) permite partir de uma solução viável conhecida, por exemplo a melhor da combinação anterior.
+#Retorna um dicionário com as mesmas chaves dos resultados da varredura, acrescido de 'periodo' e 'iteracoes'
+def recozimentoSimulado(instancia, pesoCarga, pesoRetencao, pesoRelacao, tempoLimite=10.0, semente=0,
+                        periodoInicial=None):
+    inicio = time.perf_counter()
+    prazo = inicio + tempoLimite
+    gerador = random.Random(semente)
+    pesos = (pesoCarga, pesoRetencao, pesoRelacao)
+
+    estado = _solucaoInicial(instancia, gerador, inicio + tempoLimite * fracaoReparacao, periodoInicial)
+    if estado is None:
+        return {'pesoCarga': pesoCarga, 'pesoRetencao': pesoRetencao, 'pesoRelacao': pesoRelacao,
+                'runtime': time.perf_counter() - inicio, 'status': INVIAVEL, 'iteracoes': 0}
+
+    avaliador = estado.avaliador
+    atual = instancia.objetivo(avaliador.C, avaliador.IR, avaliador.RD, *pesos)
+    melhor, melhorPeriodo = atual, list(estado.periodo)
+
+    #temperatura inicial: variação média de objetivo de movimentos viáveis sorteados
+    variacoes = []
+    for _ in range(64):
+        movimento = estado.sortearMovimento(gerador)
+        if movimento is None:
+            continue
+        C, IR, RD, violacao = avaliador.avaliar(movimento)
+        if violacao == 0:
+            variacoes.append(abs(instancia.objetivo(C, IR, RD, *pesos) - atual))
+    temperaturaInicial = max(sum(variacoes) / len(variacoes) if variacoes else 0.0, 1e-9)
+    temperatura = temperaturaInicial
+    inicioRecozimento = time.perf_counter()
+    duracao = max(prazo - inicioRecozimento, 1e-9)
+
+    iteracoes = 0
+    while True:
+        iteracoes += 1
+        if iteracoes % 128 == 0:
+            agora = time.perf_counter()
+            if agora >= prazo:
+                break
+            temperatura = temperaturaInicial * temperaturaFinalRelativa ** ((agora - inicioRecozimento) / duracao)
+        movimento = estado.sortearMovimento(gerador)
+        if movimento is None:
+            continue
+        C, IR, RD, violacao = avaliador.avaliar(movimento)
+        #apenas movimentos que mantêm os limites de carga e de quantidade
+        if violacao > 0:
+            continue
+        valor = instancia.objetivo(C, IR, RD, *pesos)
+        variacao = valor - atual
+        if variacao <= 0 or gerador.random() < math.exp(-variacao / temperatura):
+            estado.aplicar(movimento)
+            atual = valor
+            if atual < melhor:
+                melhor, melhorPeriodo = atual, list(estado.periodo)
+
+    C, IR, RD = instancia.criterios(melhorPeriodo)
+    return {
+        'pesoCarga': pesoCarga,
+        'pesoRetencao': pesoRetencao,
+        'pesoRelacao': pesoRelacao,
+        'runtime': time.perf_counter() - inicio,
+        'status': LIMITE_TEMPO,
+        'objetivo': melhor,
+        'C': C,
+        'IR': IR,
+        'RD': RD,
+        'quantidadeTermosRD': len(instancia.graus),
+        'alocacao': instancia.alocacao(melhorPeriodo),
+        'periodo': melhorPeriodo,
+        'iteracoes': iteracoes
+    }
+
+
+#Varredura de pesos pela busca local, com tempoPorCombinacao segundos por combinação; cada combinação parte da melhor
+#solução da anterior. aoResolver é chamado com cada resultado, como em executarVarredura
+def executarVarreduraHeuristica(dados, pesos, tempoPorCombinacao=10.0, semente=0, aoResolver=None):
+    instancia = InstanciaHeuristica(dados)
+    resultados = []
+    periodo = None
+    for c, (pesoCarga, pesoRetencao, pesoRelacao) in enumerate(pesos):
+        resultado = recozimentoSimulado(instancia, pesoCarga, pesoRetencao, pesoRelacao, tempoPorCombinacao,
+                                        semente + c, periodo)
+        resultado['combinacao'] = c
+        if resultado['status'] == INVIAVEL:
+            raise RuntimeError("busca local: nenhuma solução viável encontrada em %g s" % tempoPorCombinacao)
+        periodo = resultado['periodo']
+        if aoResolver is not None:
+            aoResolver(resultado)
+        resultados.append(resultado)
+    return resultados
@@ -0,0 +1,66 @@
+# Leitura de instâncias do Problema do Balanceamento de Currículo a partir de arquivos JSON (ver instancias/).
+# O arquivo usa os mesmos nomes de parâmetros consumidos por ModeloBalanceamento; as diferenças em relação ao
+# dicionário de dados em memória são:
+#   - codigosDisciplinasTraducao é uma lista [código, nome] indexada pela disciplina;
+#   - prerequisitos é um objeto cujas chaves são os índices das disciplinas em texto;
+#   - relacaoRelacaoDisciplinas é uma lista de arestas [origem, destino, grau] (apenas graus não nulos), carregada
+#     em formato esparso (RelacoesDisciplinas) sem passar por uma matriz densa.
+
+import glob
+import json
+import os
+
+from curriculumbalancing.relacoes import RelacoesDisciplinas
+
+#parâmetros obrigatórios de uma instância
+chavesObrigatorias = ('codigosDisciplinasTraducao', 'creditos', 'indicesRetencao', 'prerequisitos',
+                      'disciplinasNivelamento', 'disciplinasPenultimoPeriodo', 'disciplinasUltimoPeriodo',
+                      'quantidadePeriodos', 'quantidadeMinimaDisciplinasPorPeriodo',
+                      'quantidadeMaximaDisciplinasPorPeriodo', 'cargaMinimaPorPeriodo', 'cargaMaximaPorPeriodo',
+                      'minCarga', 'maxCarga', 'minRetencao', 'maxRetencao', 'minRelacao', 'maxRelacao',
+                      'diferencaMinimaPeriodosRelacaoNivel3', 'diferencaMaximaPeriodosRelacaoNivel9',
+                      'distanciaSemestres', 'relacaoRelacaoDisciplinas')
+
+
+#Converte o conteúdo de um arquivo de instância no dicionário de dados consumido pelo modelo
+def converterInstancia(conteudo, origem='<instância>'):
+    faltantes = [chave for chave in chavesObrigatorias if chave not in conteudo]
+    if faltantes:
+        raise ValueError("%s: parâmetros ausentes: %s" % (origem, ', '.join(faltantes)))
+
+    dados = dict(conteudo)
+    quantidadeDisciplinas = len(dados['creditos'])
+    if len(dados['indicesRetencao']) != quantidadeDisciplinas or \
+            len(dados['codigosDisciplinasTraducao']) != quantidadeDisciplinas:
+        raise ValueError("%s: creditos, indicesRetencao e codigosDisciplinasTraducao devem ter o mesmo tamanho"
+                         % origem)
+    if len(dados['distanciaSemestres']) != dados['quantidadePeriodos']:
+        raise ValueError("%s: distanciaSemestres deve ter quantidadePeriodos linhas" % origem)
+
+    dados['codigosDisciplinasTraducao'] = dict(enumerate(dados['codigosDisciplinasTraducao']))
+    dados['prerequisitos'] = {int(disciplina): requisitos
+                              for disciplina, requisitos in dados['prerequisitos'].items()}
+    try:
+        dados['relacaoRelacaoDisciplinas'] = RelacoesDisciplinas(quantidadeDisciplinas,
+                                                                 dados['relacaoRelacaoDisciplinas'])
+    except ValueError as e:
+        raise ValueError("%s: %s" % (origem, e))
+    return dados
+
+
+#Lê um arquivo de instância (JSON)
+def carregarInstancia(caminho):
+    with open(caminho, encoding='utf-8') as arquivo:
+        conteudo = json.load(arquivo)
+    conteudo.setdefault('curso', os.path.splitext(os.path.basename(caminho))[0])
+    return converterInstancia(conteudo, caminho)
+
+
+#Caminhos dos arquivos de instância (*.json) de um diretório, em ordem de nome
+def caminhosInstancias(diretorio):
+    return sorted(glob.glob(os.path.join(diretorio, '*.json')))
+
+
+#Lê todas as instâncias de um diretório (arquivos *.json), em ordem de nome
+def carregarInstancias(diretorio):
+    return [carregarInstancia(caminho) for caminho in caminhosInstancias(diretorio)]
@@ -0,0 +1,89 @@
+# Métricas de execução da varredura de pesos. Cada combinação resolvida gera um registro com o tempo de parede de cada
+# fase (leitura da instância, construção do modelo, definição da função objetivo e da solução inicial, resolução,
+# extração da solução e gravação) e as estatísticas do solver (solvers.camposEstatisticas: nós, iterações simplex,
+# gap, limitante, trabalho, tamanho após o presolve e status). Os registros são gravados em JSON Lines à medida que
+# chegam e resumidos em uma tabela ao final, para mostrar onde a varredura gasta o tempo.
+# A leitura e a construção são atribuídas à primeira combinação em que ocorrem (a construção, uma vez por processo).
+
+import json
+
+#fases medidas, na ordem em que ocorrem
+fasesMetricas = ('leitura', 'construcao', 'objetivo', 'resolucao', 'extracao', 'gravacao')
+
+
+#Registro de métricas de uma combinação: curso, combinação, pesos, tempos por fase (segundos; fases ausentes valem 0)
+#e estatísticas do solver (None quando não houve resolução, por exemplo em resultados lidos do cache), com o motivo da
+#interrupção da resolução por uma regra de parada (progresso.AcompanhamentoResolucao), quando houver
+def registroMetricas(curso, combinacao, resultado, tempos):
+    return {
+        'curso': curso,
+        'combinacao': combinacao,
+        'pesoCarga': resultado.get('pesoCarga'),
+        'pesoRetencao': resultado.get('pesoRetencao'),
+        'pesoRelacao': resultado.get('pesoRelacao'),
+        'cache': resultado.get('cache', False),
+        'tempos': {fase: tempos.get(fase, 0.0) for fase in fasesMetricas},
+        'estatisticas': resultado.get('estatisticas'),
+        'motivoParada': resultado.get('motivoParada')
+    }
+
+
+class RegistroMetricas:
+    """Gravador dos registros de métricas em ``caminho`` (JSON Lines), com ``resumo`` dos registros recebidos.
+    Pode ser usado como gerenciador de contexto."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.registros = []
+        self._arquivo = open(caminho, 'w', encoding='utf-8')
+
+    def registrar(self, registro):
+        self.registros.append(registro)
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        self._arquivo.flush()
+
+    def fechar(self):
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    #Tabela com o total, a média e o máximo de cada fase e a sua fração do tempo total, seguida dos totais das
+    #estatísticas do solver; retorna o texto da tabela
+    def resumo(self):
+        linhas = ['%-12s %12s %12s %12s %7s' % ('fase', 'total (s)', 'média (s)', 'máximo (s)', '%')]
+        totais = {fase: sum(registro['tempos'][fase] for registro in self.registros) for fase in fasesMetricas}
+        tempoTotal = sum(totais.values()) or 1.0
+        quantidade = len(self.registros) or 1
+        for fase in fasesMetricas:
+            maximo = max((registro['tempos'][fase] for registro in self.registros), default=0.0)
+            linhas.append('%-12s %12.3f %12.4f %12.4f %6.1f%%' % (fase, totais[fase], totais[fase] / quantidade, maximo,
+                                                                  100 * totais[fase] / tempoTotal))
+        linhas.append('%-12s %12.3f' % ('total', sum(totais.values())))
+
+        estatisticas = [registro['estatisticas'] for registro in self.registros if registro['estatisticas']]
+        status = {}
+        for estatistica in estatisticas:
+            status[estatistica['status']] = status.get(estatistica['status'], 0) + 1
+        linhas.append('Resoluções: %d (lidas do cache: %d) - status: %s' % (
+            len(estatisticas), sum(registro['cache'] for registro in self.registros),
+            ', '.join('%s x%d' % (codigo, vezes) for codigo, vezes in sorted(status.items())) or '-'))
+        somas = []
+        for campo, rotulo in (('nos', 'nós'), ('iteracoesSimplex', 'iterações simplex'), ('trabalho', 'trabalho')):
+            valores = [estatistica[campo] for estatistica in estatisticas if estatistica[campo] is not None]
+            if valores:
+                somas.append('%s: %g' % (rotulo, sum(valores)))
+        gaps = [estatistica['gap'] for estatistica in estatisticas if estatistica['gap'] is not None]
+        if gaps:
+            somas.append('maior gap: %.4g' % max(gaps))
+        presolve = [(estatistica['linhasPresolve'], estatistica['colunasPresolve']) for estatistica in estatisticas
+                    if estatistica['linhasPresolve'] is not None]
+        if presolve:
+            somas.append('após presolve (última resolução): %d linhas x %d colunas' % presolve[-1])
+        if somas:
+            linhas.append(' - '.join(somas))
+        return '\n'.join(linhas)
+
@@ -0,0 +1,326 @@
+# Construção do modelo do Problema do Balanceamento de Currículo.
+# As variáveis e restrições são criadas uma única vez por instância; a varredura de pesos apenas substitui a função
+# objetivo por meio de ModeloBalanceamento.definirPesos. O solver é escolhido entre os backends de
+# curriculumbalancing.solvers.
+
+import math
+import time
+
+import numpy as np
+
+from curriculumbalancing.precedencias import diferencasPrerequisitos, janelasPeriodos, reducaoTransitiva
+from curriculumbalancing.relacoes import comoRelacoes
+from curriculumbalancing.restricoes import MontagemRestricoes
+from curriculumbalancing.simetria import orbitasDisciplinas
+from curriculumbalancing.solvers import BINARIA, CONTINUA, INTEIRA, criarSolver
+
+#números que indicam os 'graus' de relação entre as disciplinas utilizados pelas restrições de posicionamento
+relacaoNivel3 = 3
+relacaoNivel9 = 9#apenas para pré-requisitos
+
+#formulações disponíveis para o termo RD da função objetivo
+formulacoesRD = ('quadratica', 'linear')
+
+
+#Método que constrói o somatório RD percorrendo apenas os pares de disciplinas com grau de relação não nulo
+#(relacoes: RelacoesDisciplinas); retorna a expressão quadrática e a quantidade de termos construídos.
+#janelas (opcional) dá os períodos admissíveis de cada disciplina, os únicos em que X[i][j] existe
+def construirRD(modelo, X, periodos, relacoes, distanciaSemestres, janelas=None):
+    coeficientes = []
+    variaveis1 = []
+    variaveis2 = []
+    for ii, i, relacao in relacoes.arestas():
+        if i == ii:
+            continue
+        for jj in (periodos if janelas is None else janelas[ii]):
+            for j in (periodos if janelas is None else janelas[i]):
+                if distanciaSemestres[jj][j] != 0:
+                    coeficientes.append(relacao * distanciaSemestres[jj][j])
+                    variaveis1.append(X[i][j])
+                    variaveis2.append(X[ii][jj])
+    return modelo.expressaoQuadratica(coeficientes, variaveis1, variaveis2), len(coeficientes)
+
+
+#Indica se a disciplina relacionada (ii -> i) pode estar no período j quando ii está no período jj, de acordo com as
+#restrições de posicionamento por grau de relação
+def periodosAdmissiveis(relacao, jj, j, diferencaMinimaPeriodosRelacaoNivel3, diferencaMaximaPeriodosRelacaoNivel9):
+    if relacao >= relacaoNivel3 and j - jj < diferencaMinimaPeriodosRelacaoNivel3:
+        return False
+    if relacao == relacaoNivel9 and j - jj > diferencaMaximaPeriodosRelacaoNivel9:
+        return False
+    return True
+
+
+#Método que constrói o somatório RD em formulação linear. Para cada par relacionado (ii -> i) são criadas variáveis
+#contínuas Y[jj][j] que representam o produto X[ii][jj]*X[i][j], ligadas a X por restrições de transporte
+#(soma em j de Y[jj][j] == X[ii][jj] e soma em jj de Y[jj][j] == X[i][j]). Com X binário, Y reproduz exatamente o
+#produto, e a relaxação linear é mais forte que a da linearização clássica Y >= X[ii][jj] + X[i][j] - 1.
+#Pares de períodos proibidos pelas restrições de posicionamento não recebem variável.
+#Retorna a expressão linear, a quantidade de termos e a quantidade de variáveis auxiliares criadas.
+#janelas (opcional) dá os períodos admissíveis de cada disciplina, os únicos em que X[i][j] existe; com restricoes
+#(MontagemRestricoes) as restrições de transporte são acumuladas nela, e sem ela são emitidas ao final
+def construirRDLinear(modelo, X, periodos, relacoes, distanciaSemestres,
+                      diferencaMinimaPeriodosRelacaoNivel3, diferencaMaximaPeriodosRelacaoNivel9, janelas=None,
+                      restricoes=None):
+    montagem = restricoes or MontagemRestricoes(modelo)
+    coeficientes = []
+    variaveis = []
+    quantidadeVariaveis = 0
+    for ii, i, relacao in relacoes.arestas():
+        if i == ii:
+            continue
+        periodosOrigem = periodos if janelas is None else janelas[ii]
+        periodosDestino = periodos if janelas is None else janelas[i]
+        Y = {}
+        for jj in periodosOrigem:
+            for j in periodosDestino:
+                if periodosAdmissiveis(relacao, jj, j, diferencaMinimaPeriodosRelacaoNivel3,
+                                       diferencaMaximaPeriodosRelacaoNivel9):
+                    Y[jj, j] = montagem.variavel(lb=0, ub=1, tipo=CONTINUA,
+                                                 nome="y" + str(ii) + "_" + str(i) + "_" + str(jj) + "_" + str(j))
+                    if distanciaSemestres[jj][j] != 0:
+                        coeficientes.append(relacao * distanciaSemestres[jj][j])
+                        variaveis.append(Y[jj, j])
+        quantidadeVariaveis += len(Y)
+        for jj in periodosOrigem:
+            termos = [Y[jj, j] for j in periodosDestino if (jj, j) in Y]
+            montagem.adicionar('RD', termos + [X[ii][jj]], [1] * len(termos) + [-1], 0, 0,
+                               nome="RDOrigem" + str(ii) + "_" + str(i) + "_" + str(jj))
+        for j in periodosDestino:
+            termos = [Y[jj, j] for jj in periodosOrigem if (jj, j) in Y]
+            montagem.adicionar('RD', termos + [X[i][j]], [1] * len(termos) + [-1], 0, 0,
+                               nome="RDDestino" + str(ii) + "_" + str(i) + "_" + str(j))
+    if restricoes is None:
+        montagem.emitir()
+    return modelo.expressaoLinear(coeficientes, variaveis), len(coeficientes), quantidadeVariaveis
+
+
+class ModeloBalanceamento:
+    """Modelo persistente de uma instância: variáveis X, C e IR, termo RD e todas as restrições.
+
+    ``dados`` é um dicionário com os parâmetros da instância, usando os mesmos nomes dos scripts
+    (``creditos``, ``indicesRetencao``, ``prerequisitos``, ``relacaoRelacaoDisciplinas``, ``distanciaSemestres``,
+    limites de carga/quantidade e os limites de normalização ``minCarga`` ... ``maxRelacao``).
+    ``formulacaoRD`` escolhe entre o termo RD quadrático original ('quadratica') e a formulação linear ('linear').
+    ``solver`` escolhe o backend ('gurobi' ou 'highs', que aceita apenas a formulação linear) e ``threads`` o número
+    de threads do solver (None mantém o padrão do backend).
+    ``temposConstrucao`` guarda o tempo, em segundos, de cada fase da construção ('variaveis', 'RD' e 'restricoes').
+    X[i][j] só é criada nos períodos da janela de cada disciplina (``janelas``, ver precedencias.janelasPeriodos);
+    fora dela X[i][j] é None e ``quantidadeVariaveisXRemovidas`` conta as variáveis não criadas.
+    As restrições passam por uma MontagemRestricoes, que descarta duplicatas e linhas dominadas;
+    ``contagemRestricoes`` guarda, por origem, as linhas recebidas, descartadas por motivo e emitidas.
+    Com ``quebrarSimetria``, as disciplinas intercambiáveis (``orbitas``, ver simetria.orbitasDisciplinas) são
+    ordenadas pelo período.
+    """
+
+    def __init__(self, dados, formulacaoRD='quadratica', nome="curriculumbalancing", solver='gurobi', threads=None,
+                 quebrarSimetria=True):
+        if formulacaoRD not in formulacoesRD:
+            raise ValueError("formulacaoRD deve ser uma de %s: %r" % (formulacoesRD, formulacaoRD))
+
+        self.dados = dados
+        self.formulacaoRD = formulacaoRD
+
+        # cria um novo modelo no backend escolhido
+        self.modelo = modelo = criarSolver(solver, nome, threads)
+        if formulacaoRD not in modelo.formulacoes:
+            raise ValueError("o solver %s não aceita a formulação %r do termo RD" % (modelo.nome, formulacaoRD))
+
+        creditos = dados['creditos']
+        indicesRetencao = dados['indicesRetencao']
+        prerequisitos = dados['prerequisitos']
+        #pré-requisitos diretos (redução transitiva, sem pares repetidos)
+        self.prerequisitosDiretos = reducaoTransitiva(prerequisitos, len(creditos))
+        self.quantidadeParesPrerequisito = sum(len(set(requisitos)) for requisitos in prerequisitos.values())
+        self.quantidadeParesPrerequisitoDiretos = sum(len(requisitos)
+                                                       for requisitos in self.prerequisitosDiretos.values())
+        #relações entre disciplinas em formato esparso (uma matriz densa também é aceita e convertida)
+        self.relacoes = relacoes = comoRelacoes(dados['relacaoRelacaoDisciplinas'])
+        distanciaSemestres = dados['distanciaSemestres']
+        quantidadePeriodos = dados['quantidadePeriodos']
+        cargaMinimaPorPeriodo = dados['cargaMinimaPorPeriodo']
+        cargaMaximaPorPeriodo = dados['cargaMaximaPorPeriodo']
+        quantidadeMinimaDisciplinasPorPeriodo = dados['quantidadeMinimaDisciplinasPorPeriodo']
+        quantidadeMaximaDisciplinasPorPeriodo = dados['quantidadeMaximaDisciplinasPorPeriodo']
+        diferencaMinimaPeriodosRelacaoNivel3 = dados['diferencaMinimaPeriodosRelacaoNivel3']
+        diferencaMaximaPeriodosRelacaoNivel9 = dados['diferencaMaximaPeriodosRelacaoNivel9']
+
+        # codigos das disciplinas
+        self.disciplinas = disciplinas = range(len(creditos))
+        # codigos dos períodos
+        self.periodos = periodos = range(quantidadePeriodos)
+        #janelas de períodos admissíveis (caminhos mais longos no grafo de pré-requisitos e relações)
+        self.maisCedo, self.maisTarde = maisCedo, maisTarde = janelasPeriodos(dados, relacaoNivel3, relacaoNivel9)
+        self.janelas = janelas = [range(maisCedo[i], maisTarde[i] + 1) for i in disciplinas]
+
+        self.temposConstrucao = {}
+        inicio = time.perf_counter()
+        #camada de montagem das restrições (canonização e descarte de duplicatas e linhas dominadas)
+        montagem = MontagemRestricoes(modelo)
+
+        #################################################### VARIÁVEIS #################################################
+
+        # X é uma lista que, para cada disciplina, tem-se uma outra lista com valores que indicam se a disciplina está em
+        # um determinado período (None fora da janela da disciplina: a variável não é criada)
+        X = []
+        for i in disciplinas:
+            X.append([None] * quantidadePeriodos)
+            for j in janelas[i]:
+                X[i][j] = montagem.variavel(lb=0, ub=1, tipo=BINARIA, nome="x" + str(i) + str(j))
+        self.X = X
+        #variáveis X existentes em ordem disciplina x período, para leitura dos valores em uma única chamada, e as
+        #posições (linha, coluna) de cada uma na matriz de alocação
+        self.variaveisX = [X[i][j] for i in disciplinas for j in janelas[i]]
+        self.linhasX = np.array([i for i in disciplinas for j in janelas[i]], dtype=np.intp)
+        self.colunasX = np.array([j for i in disciplinas for j in janelas[i]], dtype=np.intp)
+        self.quantidadeVariaveisX = len(self.variaveisX)
+        self.quantidadeVariaveisXRemovidas = len(disciplinas) * quantidadePeriodos - self.quantidadeVariaveisX
+
+        #C, IR e RD são variáveis que compõem a função objetivo
+        #cargaMaximaPorPeriodo igual a None mantém C sem limite superior
+        self.C = C = modelo.variavel(lb=cargaMinimaPorPeriodo, ub=cargaMaximaPorPeriodo, tipo=INTEIRA,
+                                     nome="maxCarga")
+        self.IR = IR = modelo.variavel(lb=0, tipo=INTEIRA, nome="indiceRetencao")
+        self.temposConstrucao['variaveis'] = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        # RD é o somátório do grau de relação entre pares de disciplinas, multiplicado pela distância entre estas
+        self.quantidadeVariaveisRD = 0
+        if formulacaoRD == 'linear':
+            self.RD, self.quantidadeTermosRD, self.quantidadeVariaveisRD = construirRDLinear(
+                modelo, X, periodos, relacoes, distanciaSemestres,
+                diferencaMinimaPeriodosRelacaoNivel3, diferencaMaximaPeriodosRelacaoNivel9, janelas, montagem)
+        else:
+            self.RD, self.quantidadeTermosRD = construirRD(modelo, X, periodos, relacoes, distanciaSemestres, janelas)
+        self.temposConstrucao['RD'] = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+
+        ################################################## RESTRIÇÕES ##################################################
+
+        # As restrições de nivelamento (disciplinas até o 2º período), de penúltimo e último período e a que impede que
+        # uma disciplina que possua pre-requisito localize-se no primeiro período são garantidas pelas janelas: as
+        # variáveis X fora delas não existem
+
+        # Adiciona restrições quanto aos pré-requisitos(pre-requisito de uma disciplina deve estar em um período
+        # anterior ao desta), apenas para os pares da redução transitiva (os demais são implicados pelas cadeias).
+        # Forma acumulada: se a disciplina está até o período j, o pré-requisito está até o período j - 1. Com as
+        # janelas, a restrição só é necessária para j entre o início da janela da disciplina e o fim da do pré-requisito
+        for i, requisitos in sorted(self.prerequisitosDiretos.items()):
+            for pr in requisitos:
+                for j in range(max(1, maisCedo[i]), min(quantidadePeriodos - 1, maisTarde[pr]) + 1):
+                    variaveisPr, coeficientesPr, constantePr = self._acumulado(pr, j - 1)
+                    variaveisI, coeficientesI, constanteI = self._acumulado(i, j)
+                    montagem.adicionar('prerequisito', variaveisPr + variaveisI,
+                                       coeficientesPr + [-coeficiente for coeficiente in coeficientesI],
+                                       constanteI - constantePr,
+                                       nome="PrerequisitoSumDe" + str(i) + "=" + str(pr) + str(j))
+
+        # Adiciona restrição de quantidade de períodos em que uma disciplina poderá estar(em apenas um período)
+        for i in disciplinas:
+            montagem.adicionar('atribuicao', [X[i][j] for j in janelas[i]], [1] * len(janelas[i]), 1, 1,
+                               nome="QuantidadeDisciplinasPeriodo[%d]" % i)
+
+        for j in periodos:
+            disciplinasPeriodo = [i for i in disciplinas if j in janelas[i]]
+            variaveisPeriodo = [X[i][j] for i in disciplinasPeriodo]
+            creditosPeriodo = [creditos[i] for i in disciplinasPeriodo]
+
+            # Adiciona restrição de carga mínima de um período
+            montagem.adicionar('carga', variaveisPeriodo, creditosPeriodo, cargaMinimaPorPeriodo,
+                               nome="CargaMinima[%d]" % j)
+
+            # Adiciona restrição de carga máxima de um período (a carga máxima de um período deve ser sempre menor ou
+            # igual ao valor máximo atual na definição dos valores de C)
+            montagem.adicionar('carga', variaveisPeriodo + [C], creditosPeriodo + [-1], superior=0,
+                               nome="CargaMaxima[%d]" % j)
+
+            # Adiciona restrições de quantidade mínima e máxima de disciplinas em um período
+            montagem.adicionar('quantidade', variaveisPeriodo, [1] * len(variaveisPeriodo),
+                               quantidadeMinimaDisciplinasPorPeriodo, nome="QuantidadeDisciplinasMinima[%d]" % j)
+            montagem.adicionar('quantidade', variaveisPeriodo, [1] * len(variaveisPeriodo),
+                               superior=quantidadeMaximaDisciplinasPorPeriodo,
+                               nome="QuantidadeDisciplinasMaxima[%d]" % j)
+
+            # Adiciona restrição de soma de índice de retenção máximo a um período (o índice de retenção de um período
+            # deve ser sempre menor ou igual ao valor máximo atual na definição dos valores de IR)
+            montagem.adicionar('retencao', variaveisPeriodo + [IR],
+                               [indicesRetencao[i] for i in disciplinasPeriodo] + [-1], superior=0,
+                               nome="IndiceRetencao[%d]" % j)
+
+        #Adiciona restrições quanto ao posicionamento das disciplinas baseado nas relações. As diferenças de períodos
+        #já garantidas pelas janelas e pelos pré-requisitos (caminho mais longo no grafo de pré-requisitos) são
+        #informadas à montagem como implicadas, e as restrições de relação que elas dominam não chegam ao solver
+        arestasPosicionamento = [(i, ii, grau) for i, ii, grau in relacoes.arestas() if grau >= relacaoNivel3]
+        diferencas = diferencasPrerequisitos(self.prerequisitosDiretos, len(creditos),
+                                             [(i, ii) for i, ii, _ in arestasPosicionamento])
+        for i, ii, grau in arestasPosicionamento:
+            variaveisII, coeficientesII = self._posicao(ii)
+            variaveisI, coeficientesI = self._posicao(i)
+            variaveis = variaveisII + variaveisI
+            coeficientes = coeficientesII + [-coeficiente for coeficiente in coeficientesI]
+            if i != ii:
+                montagem.implicada(variaveis, coeficientes,
+                                   max(maisCedo[ii] - maisTarde[i], diferencas.get((i, ii), -math.inf)),
+                                   maisTarde[ii] - maisCedo[i])
+
+            #Adiciona restrição de posicionamento anterior de disciplina (com grau de relação igual a nível 3) à outra
+            montagem.adicionar('relacao', variaveis, coeficientes, diferencaMinimaPeriodosRelacaoNivel3,
+                               nome="RelacaoMinima" + str(i) + "_" + str(ii))
+
+            # Adiciona restrição de distância entre disciplinas que possui grau 9 de relação (apenas pré-requisitos)
+            if (grau == relacaoNivel9):
+                montagem.adicionar('relacao', variaveis, coeficientes, superior=diferencaMaximaPeriodosRelacaoNivel9,
+                                   nome="RelacaoMaxima" + str(i) + "_" + str(ii))
+
+        # Quebra de simetria: as disciplinas de cada órbita são ordenadas pelo período, na forma acumulada (se a
+        # disciplina seguinte da órbita está até o período j, a anterior também está); as janelas de uma órbita são
+        # iguais e, no último período da janela, a restrição é trivial
+        self.orbitas = orbitasDisciplinas(dados) if quebrarSimetria else []
+        for orbita in self.orbitas:
+            for a, b in zip(orbita, orbita[1:]):
+                for j in range(maisCedo[b], maisTarde[a]):
+                    variaveisA, coeficientesA, constanteA = self._acumulado(a, j)
+                    variaveisB, coeficientesB, constanteB = self._acumulado(b, j)
+                    montagem.adicionar('simetria', variaveisA + variaveisB,
+                                       coeficientesA + [-coeficiente for coeficiente in coeficientesB],
+                                       constanteB - constanteA, nome="Simetria" + str(a) + "_" + str(b) + "_" + str(j))
+
+        montagem.emitir()
+        self.contagemRestricoes = montagem.contagens
+        self.totaisRestricoes = montagem.totais()
+
+        self.temposConstrucao['restricoes'] = time.perf_counter() - inicio
+
+    #Soma de X[i][jj] para jj <= j, escrita com a menor quantidade de termos: diretamente ou pelo complemento
+    #1 - soma de X[i][jj] para jj > j (equivalente, pois cada disciplina está em exatamente um período); apenas os
+    #períodos da janela da disciplina entram nas somas. Retorna (variáveis, coeficientes, constante)
+    def _acumulado(self, i, j):
+        janela = self.janelas[i]
+        if j + 1 - janela.start <= janela.stop - 1 - j:
+            periodos = range(janela.start, j + 1)
+            return [self.X[i][jj] for jj in periodos], [1] * len(periodos), 0
+        periodos = range(j + 1, janela.stop)
+        return [self.X[i][jj] for jj in periodos], [-1] * len(periodos), 1
+
+    #Período da disciplina i (soma de X[i][j] * j na janela) como (variáveis, coeficientes)
+    def _posicao(self, i):
+        return [self.X[i][j] for j in self.janelas[i]], list(self.janelas[i])
+
+    #Substitui a função objetivo pela soma ponderada dos critérios normalizados; variáveis e restrições não são alteradas
+    def definirPesos(self, pesoCarga, pesoRetencao, pesoRelacao):
+        dados = self.dados
+        self.modelo.minimizar(
+            pesoCarga * (self.C - dados['minCarga']) / (dados['maxCarga'] - dados['minCarga']) +
+            pesoRetencao * (self.IR - dados['minRetencao']) / (dados['maxRetencao'] - dados['minRetencao']) +
+            pesoRelacao * (self.RD - dados['minRelacao']) / (dados['maxRelacao'] - dados['minRelacao']))
+
+    #Informa a alocação (disciplinas x períodos, 0/1), por exemplo a solução ótima de uma combinação de pesos vizinha,
+    #como solução inicial da próxima resolução; C, IR e RD são completados pelo solver
+    def definirSolucaoInicial(self, alocacao):
+        self.modelo.solucaoInicial(self.variaveisX, np.asarray(alocacao)[self.linhasX, self.colunasX])
+
+    #Lê os valores de X da última resolução em uma única chamada ao solver e retorna a matriz de alocação
+    #(disciplinas x períodos, inteiros 0/1)
+    def alocacao(self):
+        matriz = np.zeros((len(self.disciplinas), len(self.periodos)), dtype=np.int8)
+        matriz[self.linhasX, self.colunasX] = np.rint(self.modelo.valores(self.variaveisX))
+        return matriz
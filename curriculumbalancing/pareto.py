@@ -0,0 +1,77 @@
+# Fronteira de Pareto exata por epsilon-restrito sobre os três critérios (C, IR, RD).
+# A soma ponderada da varredura de pesos só alcança os pontos suportados da fronteira e costuma repetir a mesma grade
+# para vários vetores de pesos. Aqui C é percorrido por todos os seus valores inteiros (C == c); para cada c, IR é
+# limitado a r e minimiza-se RD (desempate por IR), reduzindo r para IR* - 1 a cada ponto encontrado, até a
+# inviabilidade. Cada resolução produz um ponto distinto; ao final, os pontos dominados são descartados.
+
+from curriculumbalancing.modelo import ModeloBalanceamento
+from curriculumbalancing.solvers import OTIMO
+
+
+#Indica se o ponto a domina o ponto b (nenhum critério pior e ao menos um melhor)
+def domina(a, b):
+    return (a['C'] <= b['C'] and a['IR'] <= b['IR'] and a['RD'] <= b['RD'] and
+            (a['C'] < b['C'] or a['IR'] < b['IR'] or a['RD'] < b['RD']))
+
+
+#Mantém apenas os pontos não dominados, ordenados por C, IR e RD
+def filtrarNaoDominados(pontos):
+    naoDominados = [p for p in pontos if not any(domina(q, p) for q in pontos)]
+    return sorted(naoDominados, key=lambda p: (p['C'], p['IR'], p['RD']))
+
+
+def _ponto(balanceamento):
+    modelo = balanceamento.modelo
+    return {
+        'C': int(round(modelo.valor(balanceamento.C))),
+        'IR': int(round(modelo.valor(balanceamento.IR))),
+        'RD': int(round(modelo.valor(balanceamento.RD))),
+        'runtime': modelo.tempo,
+        'status': modelo.status,
+        'quantidadeTermosRD': balanceamento.quantidadeTermosRD,
+        'alocacao': balanceamento.alocacao()
+    }
+
+
+#Calcula a fronteira de Pareto completa pelo método epsilon-restrito. C é percorrido de seu menor valor viável até o
+#seu limite superior (cargaMaximaPorPeriodo, ou maxCarga quando C não possui limite superior).
+#Retorna a lista de pontos não dominados (dicionários com C, IR, RD, runtime, status e alocacao) e a quantidade de
+#resoluções realizadas
+def fronteiraEpsilonRestrito(dados, formulacaoRD='quadratica', solver='gurobi', threads=None):
+    balanceamento = ModeloBalanceamento(dados, formulacaoRD, solver=solver, threads=threads)
+    modelo = balanceamento.modelo
+    C = balanceamento.C
+    IR = balanceamento.IR
+    RD = balanceamento.RD
+    #o desempate por IR exige otimalidade exata da soma RD*(r+1) + IR
+    modelo.parametro('gap', 0)
+
+    # menor carga máxima viável
+    modelo.minimizar(C)
+    modelo.resolver()
+    resolucoes = 1
+    if modelo.status != OTIMO:
+        return [], resolucoes
+    cargaMinima = int(round(modelo.valor(C)))
+    cargaMaxima = dados['cargaMaximaPorPeriodo']
+    if cargaMaxima is None:
+        cargaMaxima = dados['maxCarga']
+
+    retencaoMaxima = sum(dados['indicesRetencao'])
+    pontos = []
+    for c in range(cargaMinima, int(cargaMaxima) + 1):
+        modelo.limites(C, lb=c, ub=c)
+        r = retencaoMaxima
+        while r >= 0:
+            modelo.limites(IR, ub=r)
+            #minimiza RD e, entre as soluções de mesmo RD, a de menor IR (IR <= r < r + 1)
+            modelo.minimizar(RD * (r + 1) + IR)
+            modelo.resolver()
+            resolucoes += 1
+            if modelo.status != OTIMO:
+                break
+            ponto = _ponto(balanceamento)
+            pontos.append(ponto)
+            r = ponto['IR'] - 1
+
+    return filtrarNaoDominados(pontos), resolucoes
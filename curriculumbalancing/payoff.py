@@ -0,0 +1,112 @@
+# Tabela de payoff: limites de normalização (minCarga/maxCarga, minRetencao/maxRetencao, minRelacao/maxRelacao)
+# calculados a partir da própria instância, em vez de constantes digitadas em cada script.
+# Cada critério é minimizado lexicograficamente (o critério principal e, em seguida, os demais na ordem C, IR, RD);
+# o mínimo de cada critério é o valor da diagonal e o máximo é o pior valor do critério entre as linhas da tabela.
+# Os limites são armazenados em cache por hash da instância, solver e formulação do termo RD, de forma que o custo das
+# resoluções extras é pago uma vez. Com um limite de tempo, uma tabela que não chega ao ótimo dentro dele é descartada
+# e os limites do arquivo de instância são mantidos (sem gravação no cache).
+
+import hashlib
+import json
+import os
+import time
+
+from curriculumbalancing.modelo import ModeloBalanceamento
+from curriculumbalancing.solvers import OTIMO
+
+#chaves dos dados que não influenciam o conjunto de soluções viáveis nem os critérios
+_chavesIgnoradasHash = ('curso', 'diretorioResultados', 'codigosDisciplinasTraducao', 'minCarga', 'maxCarga',
+                        'minRetencao', 'maxRetencao', 'minRelacao', 'maxRelacao')
+
+#critérios na ordem de desempate, com as chaves dos respectivos limites de normalização
+criterios = (('C', 'minCarga', 'maxCarga'), ('IR', 'minRetencao', 'maxRetencao'), ('RD', 'minRelacao', 'maxRelacao'))
+
+#gap relativo das resoluções da tabela: os limites devem ser valores ótimos, não apenas dentro do gap padrão do solver
+gapPayoff = 0.0
+
+
+class TabelaPayoffIncompleta(RuntimeError):
+    """Uma resolução da tabela de payoff terminou sem o ótimo (por exemplo, pelo limite de tempo)."""
+
+
+#Hash canônico dos dados que definem o modelo de uma instância
+def hashInstancia(dados):
+    canonico = {chave: valor for chave, valor in dados.items() if chave not in _chavesIgnoradasHash}
+    texto = json.dumps(canonico, sort_keys=True, separators=(',', ':'), default=list)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def _valores(balanceamento):
+    modelo = balanceamento.modelo
+    return {'C': int(round(modelo.valor(balanceamento.C))), 'IR': int(round(modelo.valor(balanceamento.IR))),
+            'RD': int(round(modelo.valor(balanceamento.RD)))}
+
+
+#Resolve a tabela de payoff (3 linhas, uma por critério principal, cada uma com 3 resoluções lexicográficas).
+#limiteTempo (segundos), quando informado, limita o tempo total da tabela, contado a partir desta chamada; cada
+#resolução recebe o tempo restante. Lança TabelaPayoffIncompleta se alguma resolução não chegar ao ótimo.
+#Retorna os limites de normalização e a tabela (lista de dicionários com C, IR e RD)
+def calcularTabelaPayoff(dados, formulacaoRD='quadratica', solver='gurobi', threads=None, limiteTempo=None):
+    prazo = None if limiteTempo is None else time.monotonic() + limiteTempo
+    balanceamento = ModeloBalanceamento(dados, formulacaoRD, solver=solver, threads=threads)
+    modelo = balanceamento.modelo
+    modelo.parametro('gap', gapPayoff)
+    if formulacaoRD == 'quadratica':
+        #a restrição RD <= valor é quadrática (não convexa) quando RD é o critério fixado
+        modelo.parametro('naoConvexo', 2)
+    expressoes = {'C': balanceamento.C, 'IR': balanceamento.IR, 'RD': balanceamento.RD}
+
+    tabela = []
+    for principal, _, _ in criterios:
+        ordem = [principal] + [nome for nome, _, _ in criterios if nome != principal]
+        fixados = []
+        for nome in ordem:
+            modelo.minimizar(expressoes[nome])
+            if prazo is not None:
+                restante = prazo - time.monotonic()
+                if restante <= 0:
+                    raise TabelaPayoffIncompleta("tabela de payoff: limite de tempo esgotado antes da minimização de "
+                                                 "%s" % nome)
+                modelo.parametro('limiteTempo', restante)
+            modelo.resolver()
+            if modelo.status != OTIMO:
+                raise TabelaPayoffIncompleta("tabela de payoff: minimização de %s terminou com status %d"
+                                             % (nome, modelo.status))
+            valor = int(round(modelo.valor(expressoes[nome])))
+            fixados.append(modelo.restricao(expressoes[nome] <= valor, nome="payoff" + nome))
+        tabela.append(_valores(balanceamento))
+        modelo.remover(fixados)
+
+    limites = {}
+    for indice, (nome, chaveMinimo, chaveMaximo) in enumerate(criterios):
+        limites[chaveMinimo] = tabela[indice][nome]
+        limites[chaveMaximo] = max(linha[nome] for linha in tabela)
+        # evita divisão por zero na normalização quando o critério não varia entre as linhas
+        if limites[chaveMaximo] == limites[chaveMinimo]:
+            limites[chaveMaximo] = limites[chaveMinimo] + 1
+    return limites, tabela
+
+
+#Retorna uma cópia dos dados com os limites de normalização da tabela de payoff, lidos do cache
+#(diretorioCache/<hash da instância>-<solver>-<formulação>.json) ou calculados e gravados nele. O arquivo registra o
+#solver, a formulação e o gap com que a tabela foi resolvida; se algum deles não conferir, a tabela é recalculada.
+#limiteTempo (segundos) limita o cálculo da tabela; se ela não for concluída, um aviso é impresso e os dados são
+#devolvidos com os limites do arquivo de instância
+def limitesNormalizacao(dados, formulacaoRD='quadratica', diretorioCache='cachePayoff', solver='gurobi', threads=None,
+                        limiteTempo=None):
+    arquivo = os.path.join(diretorioCache, '%s-%s-%s.json' % (hashInstancia(dados), solver, formulacaoRD))
+    configuracao = {'solver': solver, 'formulacaoRD': formulacaoRD, 'gap': gapPayoff}
+    if os.path.exists(arquivo):
+        with open(arquivo, encoding='utf-8') as entrada:
+            conteudo = json.load(entrada)
+        if all(conteudo.get(chave) == valor for chave, valor in configuracao.items()):
+            return dict(dados, **conteudo['limites'])
+    try:
+        limites, tabela = calcularTabelaPayoff(dados, formulacaoRD, solver, threads, limiteTempo)
+    except TabelaPayoffIncompleta as e:
+        print('Aviso: %s; utilizando os limites de normalização do arquivo de instância' % e)
+        return dict(dados)
+    os.makedirs(diretorioCache, exist_ok=True)
+    with open(arquivo, 'w', encoding='utf-8') as saida:
+        json.dump(dict(configuracao, limites=limites, tabela=tabela), saida, indent=1)
+    return dict(dados, **limites)
@@ -0,0 +1,135 @@
+# Pré-processamento das precedências (pré-requisitos) de uma instância.
+# Os pré-requisitos formam um grafo acíclico: um par (pr, i) cujo pré-requisito pr já precede i por meio de uma cadeia
+# de outros pré-requisitos de i é implicado pelas restrições da cadeia e não precisa de restrições próprias. A redução
+# transitiva mantém apenas os pares diretos, sem repetições; os ancestrais de cada disciplina são mantidos como
+# conjuntos de bits (inteiros), o que torna a redução O(pares x disciplinas / tamanho da palavra).
+# As janelas de períodos (primeiro e último período admissível de cada disciplina) são obtidas pelos caminhos mais
+# longos dessas precedências e das restrições de posicionamento por grau de relação.
+
+from curriculumbalancing.relacoes import comoRelacoes
+
+
+#Ordem topológica das disciplinas pelos pré-requisitos (cada pré-requisito antes das disciplinas que o exigem);
+#ValueError quando há ciclo
+def ordemTopologica(prerequisitos, quantidadeDisciplinas):
+    dependentes = [[] for _ in range(quantidadeDisciplinas)]
+    pendentes = [0] * quantidadeDisciplinas
+    for i, requisitos in prerequisitos.items():
+        for pr in set(requisitos):
+            dependentes[pr].append(i)
+            pendentes[i] += 1
+    ordem = [i for i in range(quantidadeDisciplinas) if pendentes[i] == 0]
+    for i in ordem:
+        for dependente in dependentes[i]:
+            pendentes[dependente] -= 1
+            if pendentes[dependente] == 0:
+                ordem.append(dependente)
+    if len(ordem) < quantidadeDisciplinas:
+        raise ValueError("os pré-requisitos contêm um ciclo")
+    return ordem
+
+
+#Redução transitiva dos pré-requisitos: dicionário disciplina -> lista ordenada dos pré-requisitos diretos (sem pares
+#repetidos nem pares implicados por cadeias de outros pré-requisitos). Disciplinas sem pré-requisitos não aparecem
+def reducaoTransitiva(prerequisitos, quantidadeDisciplinas):
+    ancestrais = [0] * quantidadeDisciplinas
+    diretos = {}
+    for i in ordemTopologica(prerequisitos, quantidadeDisciplinas):
+        requisitos = sorted(set(prerequisitos.get(i, ())))
+        if not requisitos:
+            continue
+        #pré-requisitos alcançáveis a partir de outro pré-requisito de i
+        implicados = 0
+        for pr in requisitos:
+            implicados |= ancestrais[pr]
+        diretos[i] = [pr for pr in requisitos if not implicados >> pr & 1]
+        for pr in requisitos:
+            ancestrais[i] |= ancestrais[pr] | 1 << pr
+    return diretos
+
+
+#Janelas de períodos admissíveis de cada disciplina: listas maisCedo e maisTarde com o primeiro e o último período que
+#a disciplina pode ocupar. Partem das posições fixas (nivelamento até o 2º período, disciplinas com pré-requisito fora
+#do 1º período, penúltimo e último períodos) e são estreitadas pelos caminhos mais longos das restrições de diferença
+#de períodos: pré-requisitos (diferença >= 1) e relações de grau >= nível 3 (diferença >= diferencaMinima...) e de
+#grau nível 9 (diferença <= diferencaMaxima...). ValueError quando alguma janela fica vazia (instância inviável)
+def janelasPeriodos(dados, relacaoNivel3=3, relacaoNivel9=9):
+    quantidadeDisciplinas = len(dados['creditos'])
+    quantidadePeriodos = dados['quantidadePeriodos']
+    maisCedo = [0] * quantidadeDisciplinas
+    maisTarde = [quantidadePeriodos - 1] * quantidadeDisciplinas
+    for i in dados['disciplinasNivelamento']:
+        maisTarde[i] = min(maisTarde[i], 1)
+    for i in dados['prerequisitos']:
+        maisCedo[i] = max(maisCedo[i], 1)
+    for i in dados['disciplinasPenultimoPeriodo']:
+        maisCedo[i] = max(maisCedo[i], quantidadePeriodos - 2)
+        maisTarde[i] = min(maisTarde[i], quantidadePeriodos - 2)
+    for i in dados['disciplinasUltimoPeriodo']:
+        maisCedo[i] = max(maisCedo[i], quantidadePeriodos - 1)
+
+    #pares (a, b, minimo, maximo): minimo <= periodo[b] - periodo[a] <= maximo (maximo None: sem limite)
+    pares = [(pr, i, 1, None) for i, requisitos in reducaoTransitiva(dados['prerequisitos'],
+                                                                      quantidadeDisciplinas).items()
+             for pr in requisitos]
+    for origem, destino, grau in comoRelacoes(dados['relacaoRelacaoDisciplinas']).arestas():
+        if origem != destino and grau >= relacaoNivel3:
+            pares.append((origem, destino, dados['diferencaMinimaPeriodosRelacaoNivel3'],
+                          dados['diferencaMaximaPeriodosRelacaoNivel9'] if grau == relacaoNivel9 else None))
+
+    #propagação até o ponto fixo; cada alteração estreita uma janela, o que limita a quantidade de passagens
+    alterado = True
+    while alterado:
+        alterado = False
+        for a, b, minimo, maximo in pares:
+            if maisCedo[a] + minimo > maisCedo[b]:
+                maisCedo[b] = maisCedo[a] + minimo
+                alterado = True
+            if maisTarde[b] - minimo < maisTarde[a]:
+                maisTarde[a] = maisTarde[b] - minimo
+                alterado = True
+            if maximo is not None:
+                if maisTarde[a] + maximo < maisTarde[b]:
+                    maisTarde[b] = maisTarde[a] + maximo
+                    alterado = True
+                if maisCedo[b] - maximo > maisCedo[a]:
+                    maisCedo[a] = maisCedo[b] - maximo
+                    alterado = True
+        vazias = [i for i in range(quantidadeDisciplinas) if maisCedo[i] > maisTarde[i]]
+        if vazias:
+            raise ValueError("nenhum período admissível para as disciplinas %s" % vazias)
+    return maisCedo, maisTarde
+
+
+#Diferença mínima de períodos entre as disciplinas de cada par (a, b) garantida pelos pré-requisitos diretos
+#(redução transitiva): o comprimento do caminho mais longo de a até b no grafo de pré-requisitos, ou 0 quando b não
+#depende de a. Retorna um dicionário par -> diferença apenas para os pares em que b depende de a
+def diferencasPrerequisitos(prerequisitosDiretos, quantidadeDisciplinas, pares):
+    ancestrais = [0] * quantidadeDisciplinas
+    for i in ordemTopologica(prerequisitosDiretos, quantidadeDisciplinas):
+        for pr in prerequisitosDiretos.get(i, ()):
+            ancestrais[i] |= ancestrais[pr] | 1 << pr
+
+    diferencas = {}
+    caminhos = {}
+    for a, b in pares:
+        if not ancestrais[b] >> a & 1:
+            continue
+        #caminho mais longo de a até cada disciplina que depende de a, percorrendo apenas as que dependem de a
+        comprimentos = caminhos.setdefault(a, {a: 0})
+        pilha = [b]
+        while pilha:
+            i = pilha[-1]
+            if i in comprimentos:
+                pilha.pop()
+                continue
+            pendentes = [pr for pr in prerequisitosDiretos[i]
+                         if (pr == a or ancestrais[pr] >> a & 1) and pr not in comprimentos]
+            if pendentes:
+                pilha.extend(pendentes)
+                continue
+            comprimentos[i] = 1 + max(comprimentos[pr] for pr in prerequisitosDiretos[i]
+                                      if pr == a or ancestrais[pr] >> a & 1)
+            pilha.pop()
+        diferencas[a, b] = comprimentos[b]
+    return diferencas
@@ -0,0 +1,129 @@
+# Acompanhamento de resoluções em andamento. O backend do solver (curriculumbalancing.solvers) informa, por callback,
+# a melhor solução (incumbente), o limitante dual e o tempo decorrido; AcompanhamentoResolucao calcula o gap, grava os
+# eventos em JSON Lines (arquivo, saída padrão ou conexão TCP) e avalia as regras de parada:
+#   - gap: interrompe quando o gap relativo chega ao valor informado;
+#   - semMelhoria: interrompe após semMelhoria segundos sem melhora do incumbente;
+#   - prazo: interrompe quando o relógio (time.time()) passa do instante informado, por exemplo o fim de uma varredura.
+# As regras só interrompem uma resolução que já tenha solução viável, de forma que toda resolução produz uma alocação;
+# a resolução interrompida termina com o status INTERROMPIDO e o motivo fica em motivoParada.
+# Cada evento é uma linha {'rotulo', 'evento', 'tempo', 'incumbente', 'limitante', 'gap', 'motivo'}, com evento
+# 'incumbente' (nova melhor solução), 'progresso' (no máximo um a cada intervalo segundos), 'parada' ou 'fim'.
+
+import json
+import math
+import socket
+import sys
+import time
+
+#prefixo dos destinos em conexão TCP (tcp://host:porta)
+_prefixoTcp = 'tcp://'
+
+
+#Gap relativo entre o incumbente e o limitante, como no Gurobi: |limitante - incumbente| / |incumbente|, 0 quando
+#ambos são nulos e infinito sem incumbente
+def gapRelativo(incumbente, limitante):
+    if incumbente is None or limitante is None or not math.isfinite(limitante):
+        return math.inf
+    if incumbente == 0:
+        return 0.0 if limitante == 0 else math.inf
+    return abs(limitante - incumbente) / abs(incumbente)
+
+
+def _finito(valor):
+    return valor if valor is not None and math.isfinite(valor) else None
+
+
+class AcompanhamentoResolucao:
+    """Recebe o progresso de cada resolução (``observar``), grava os eventos em ``destino`` e decide a interrupção.
+
+    ``destino`` é o caminho de um arquivo JSON Lines (aberto para acréscimo), '-' para a saída padrão,
+    'tcp://host:porta' para uma conexão TCP ou None para não gravar eventos. O destino é aberto no primeiro evento,
+    de forma que o objeto pode ser enviado aos processos de um pool (cada processo abre o seu)."""
+
+    def __init__(self, destino=None, gap=None, semMelhoria=None, prazo=None, intervalo=1.0):
+        self.destino = destino
+        self.gap = gap
+        self.semMelhoria = semMelhoria
+        self.prazo = prazo
+        self.intervalo = intervalo
+        self._saida = None
+        self._socket = None
+        self.iniciar()
+
+    #Prepara o acompanhamento de uma nova resolução; rotulo identifica a resolução nos eventos
+    def iniciar(self, rotulo=None):
+        self.rotulo = rotulo
+        self.incumbente = None
+        self.limitante = None
+        self.motivoParada = None
+        self._tempo = 0.0
+        self._tempoMelhoria = 0.0
+        self._ultimoProgresso = -math.inf
+
+    #Progresso informado pelo backend: tempo decorrido na resolução, valor do incumbente (None sem solução) e
+    #limitante dual. Retorna True quando a resolução deve ser interrompida
+    def observar(self, tempo, incumbente, limitante):
+        self._tempo = tempo
+        self.limitante = _finito(limitante)
+        incumbente = _finito(incumbente)
+        if incumbente is not None and (self.incumbente is None or incumbente < self.incumbente - 1e-9):
+            self.incumbente = incumbente
+            self._tempoMelhoria = tempo
+            self._gravar('incumbente')
+        elif tempo - self._ultimoProgresso >= self.intervalo:
+            self._gravar('progresso')
+
+        if self.motivoParada is not None or self.incumbente is None:
+            return self.motivoParada is not None
+        if self.gap is not None and gapRelativo(self.incumbente, self.limitante) <= self.gap:
+            self.motivoParada = 'gap'
+        elif self.semMelhoria is not None and tempo - self._tempoMelhoria >= self.semMelhoria:
+            self.motivoParada = 'semMelhoria'
+        elif self.prazo is not None and time.time() >= self.prazo:
+            self.motivoParada = 'prazo'
+        if self.motivoParada is not None:
+            self._gravar('parada')
+        return self.motivoParada is not None
+
+    #Encerra o acompanhamento da resolução corrente com os valores finais informados pelo backend
+    def finalizar(self, tempo, incumbente, limitante):
+        self._tempo = tempo
+        self.incumbente = _finito(incumbente)
+        self.limitante = _finito(limitante)
+        self._gravar('fim')
+
+    def _gravar(self, evento):
+        if evento == 'progresso' or evento == 'incumbente':
+            self._ultimoProgresso = self._tempo
+        if self.destino is None:
+            return
+        if self._saida is None:
+            self._abrir()
+        gap = gapRelativo(self.incumbente, self.limitante)
+        self._saida.write(json.dumps({'rotulo': self.rotulo, 'evento': evento, 'tempo': round(self._tempo, 3),
+                                      'incumbente': self.incumbente, 'limitante': self.limitante,
+                                      'gap': _finito(gap), 'motivo': self.motivoParada}, ensure_ascii=False) + '\n')
+        self._saida.flush()
+
+    def _abrir(self):
+        if self.destino == '-':
+            self._saida = sys.stdout
+        elif self.destino.startswith(_prefixoTcp):
+            host, _, porta = self.destino[len(_prefixoTcp):].rpartition(':')
+            self._socket = socket.create_connection((host, int(porta)))
+            self._saida = self._socket.makefile('w', encoding='utf-8')
+        else:
+            self._saida = open(self.destino, 'a', encoding='utf-8')
+
+    def fechar(self):
+        if self._saida is not None and self._saida is not sys.stdout:
+            self._saida.close()
+        if self._socket is not None:
+            self._socket.close()
+        self._saida = self._socket = None
+
+    #o destino aberto não é enviado a outros processos
+    def __getstate__(self):
+        estado = dict(self.__dict__)
+        estado['_saida'] = estado['_socket'] = None
+        return estado
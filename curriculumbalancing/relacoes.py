@@ -0,0 +1,94 @@
+# Armazenamento esparso das relações entre disciplinas (relacaoRelacaoDisciplinas).
+# A matriz de relações é quase toda nula; aqui apenas as arestas origem -> destino com grau não nulo são guardadas,
+# em formato CSR (vetor de início de cada linha, destinos e graus), com o transposto mantido para consultas pelo
+# destino. Memória e percursos custam O(arestas) em vez de O(disciplinas²).
+
+from array import array
+from bisect import bisect_left
+
+
+class RelacoesDisciplinas:
+    """Relações com grau não nulo entre disciplinas, em formato CSR.
+
+    As arestas são mantidas ordenadas por origem e, dentro de cada origem, por destino (a mesma ordem de um
+    percurso linha a linha da matriz densa).
+    """
+
+    def __init__(self, quantidadeDisciplinas, arestas):
+        porOrigem = sorted((origem, destino, grau) for origem, destino, grau in arestas if grau != 0)
+        for indice, (origem, destino, _) in enumerate(porOrigem):
+            if not (0 <= origem < quantidadeDisciplinas and 0 <= destino < quantidadeDisciplinas):
+                raise ValueError("relação (%d, %d) fora do intervalo de disciplinas [0, %d)"
+                                 % (origem, destino, quantidadeDisciplinas))
+            if indice > 0 and porOrigem[indice - 1][:2] == (origem, destino):
+                raise ValueError("relação (%d, %d) repetida" % (origem, destino))
+
+        self.quantidadeDisciplinas = quantidadeDisciplinas
+        self.inicio, self.destinos, self.graus = self._csr(quantidadeDisciplinas, porOrigem)
+        porDestino = sorted((destino, origem, grau) for origem, destino, grau in porOrigem)
+        self.inicioTransposto, self.origens, self.grausTransposto = self._csr(quantidadeDisciplinas, porDestino)
+
+    @staticmethod
+    def _csr(quantidadeDisciplinas, arestasOrdenadas):
+        inicio = array('i', [0] * (quantidadeDisciplinas + 1))
+        for linha, _, _ in arestasOrdenadas:
+            inicio[linha + 1] += 1
+        for linha in range(quantidadeDisciplinas):
+            inicio[linha + 1] += inicio[linha]
+        colunas = array('i', (coluna for _, coluna, _ in arestasOrdenadas))
+        graus = array('i', (grau for _, _, grau in arestasOrdenadas))
+        return inicio, colunas, graus
+
+    #Constrói a partir de uma matriz densa (lista de listas)
+    @classmethod
+    def deMatriz(cls, matriz):
+        return cls(len(matriz), ((origem, destino, grau) for origem, linha in enumerate(matriz)
+                                 for destino, grau in enumerate(linha) if grau != 0))
+
+    def __len__(self):
+        return len(self.destinos)
+
+    #Percorre as arestas (origem, destino, grau) em ordem de origem e destino
+    def arestas(self):
+        for origem in range(self.quantidadeDisciplinas):
+            for posicao in range(self.inicio[origem], self.inicio[origem + 1]):
+                yield origem, self.destinos[posicao], self.graus[posicao]
+
+    __iter__ = arestas
+
+    #Disciplinas relacionadas a partir da origem: lista de (destino, grau)
+    def sucessores(self, origem):
+        inicio, fim = self.inicio[origem], self.inicio[origem + 1]
+        return list(zip(self.destinos[inicio:fim], self.graus[inicio:fim]))
+
+    #Disciplinas que se relacionam com o destino: lista de (origem, grau)
+    def antecessores(self, destino):
+        inicio, fim = self.inicioTransposto[destino], self.inicioTransposto[destino + 1]
+        return list(zip(self.origens[inicio:fim], self.grausTransposto[inicio:fim]))
+
+    #Grau de relação entre origem e destino (0 quando não relacionadas)
+    def grau(self, origem, destino):
+        inicio, fim = self.inicio[origem], self.inicio[origem + 1]
+        posicao = bisect_left(self.destinos, destino, inicio, fim)
+        if posicao < fim and self.destinos[posicao] == destino:
+            return self.graus[posicao]
+        return 0
+
+    #Quantidade de relações (em qualquer sentido) de uma disciplina
+    def quantidadeRelacoes(self, disciplina):
+        return (self.inicio[disciplina + 1] - self.inicio[disciplina] +
+                self.inicioTransposto[disciplina + 1] - self.inicioTransposto[disciplina])
+
+    #Matriz densa equivalente (apenas para exibição e compatibilidade)
+    def paraMatriz(self):
+        matriz = [[0] * self.quantidadeDisciplinas for _ in range(self.quantidadeDisciplinas)]
+        for origem, destino, grau in self.arestas():
+            matriz[origem][destino] = grau
+        return matriz
+
+
+#Retorna as relações em formato esparso, convertendo uma matriz densa quando necessário
+def comoRelacoes(relacaoRelacaoDisciplinas):
+    if isinstance(relacaoRelacaoDisciplinas, RelacoesDisciplinas):
+        return relacaoRelacaoDisciplinas
+    return RelacoesDisciplinas.deMatriz(relacaoRelacaoDisciplinas)
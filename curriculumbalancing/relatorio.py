@@ -0,0 +1,119 @@
+# Impressão dos resultados de uma resolução: grade, cargas e índices de retenção por período, valores dos critérios
+# e pesos. Cada método imprime na saída padrão e acrescenta o mesmo texto à lista resultados, gravada em arquivo pelo
+# chamador. As cargas e retenções por período são calculadas uma vez por solução (totaisPorPeriodo) e repassadas.
+
+import numpy as np
+
+
+#Calcula, a partir da matriz de alocação (disciplinas x períodos), as cargas e as somas dos índices de retenção de cada
+#período como produtos matriciais; os vetores resultantes são compartilhados por todos os relatórios de uma solução
+def totaisPorPeriodo(alocacao, creditos, indicesRetencao):
+    alocacao = np.asarray(alocacao)
+    cargas = np.asarray(creditos) @ alocacao
+    retencoes = np.asarray(indicesRetencao) @ alocacao
+    return cargas, retencoes
+
+
+#Método que imprime a grade resultante
+def imprimirGrade(alocacao, periodos, codigosDisciplinasTraducao, creditos, indicesRetencao, cargas, retencoes,
+                  resultados):
+    alocacao = np.asarray(alocacao)
+    disciplinasPorPeriodo = [np.flatnonzero(alocacao[:, j]) for j in periodos]
+
+    for j in periodos:
+        print("Período " + str(j) + " - Carga: " + str(cargas[j]) + " - Retenção " + str(retencoes[j]));
+        print("\n")
+        for i in disciplinasPorPeriodo[j]:
+            print(codigosDisciplinasTraducao[i], end=' ')
+            print(' - C: ' + str(creditos[i]) + ' - IR: ' + str(indicesRetencao[i]))
+        print("\n")
+
+    for j in periodos:
+        resultados.append("Período " + str(j) + " - Carga: " + str(cargas[j]) + " - Retenção " + str(retencoes[j]));
+        resultados.append("\n")
+        for i in disciplinasPorPeriodo[j]:
+            resultados.append(str(codigosDisciplinasTraducao[i]))
+            resultados.append(' - C: ' + str(creditos[i]) + ' - IR: ' + str(indicesRetencao[i]))
+            resultados.append("\n")
+        resultados.append("\n")
+    resultados.append("\n")
+
+
+#Método que imprime a soma das cargas de cada período
+def imprimirSomatorioCargasPorPeriodo(cargas, resultados):
+
+    print("CARGA PERÍODO")
+
+    for j, carga in enumerate(cargas):
+        print("Carga Período " + str(j) + " = " + str(carga))
+
+    resultados.append("CARGA PERÍODO")
+    resultados.append('\n')
+    for j, carga in enumerate(cargas):
+        resultados.append("Carga Período " + str(j) + " = " + str(carga))
+        resultados.append('\n')
+    resultados.append("\n")
+
+
+#Método que imprime a soma dos índices de retenção de cada período
+def imprimirSomatorioIndicesRetencao(retencoes, resultados):
+
+    print("ÍNDICES RETENÇÃO")
+
+    for j, indiceRetencao in enumerate(retencoes):
+        print("Índice retenção Período " + str(j) + " = " + str(indiceRetencao))
+
+    resultados.append("ÍNDICES RETENÇÃO")
+    resultados.append('\n')
+    for j, indiceRetencao in enumerate(retencoes):
+        resultados.append("Índice retenção Período " + str(j) + " = " + str(indiceRetencao))
+        resultados.append('\n')
+    resultados.append("\n")
+
+
+#Método que imprime os valores das variáveis constantes no resultado da função objetivo
+def imprimirValoresVariaveis(resultados, C, IR, RD):
+    print('VALORES RESULTANTES DAS VARIÁVEIS')
+    print('Valor de C no resultado da função objetivo: %g' %C)
+    print('Valor de IR no resultado da função objetivo: %g' %IR)
+    print('Valor de RD no resultado da função objetivo: %g' %RD)
+
+    resultados.append('VALORES RESULTANTES DAS VARIÁVEIS')
+    resultados.append('\n')
+    resultados.append('Valor de C no resultado da função objetivo: %g' %C)
+    resultados.append('\n')
+    resultados.append('Valor de IR no resultado da função objetivo: %g' %IR)
+    resultados.append('\n')
+    resultados.append('Valor de RD no resultado da função objetivo: %g' %RD)
+    resultados.append('\n')
+    resultados.append("\n")
+
+
+#Método que imprime os valores das variáveis constantes no resultado da função objetivo
+def imprimirPesos(resultados, pesoCarga, pesoRetencao, pesoRelacao):
+    print("PESOS")
+    print('Valor Peso Carga: %g' %pesoCarga)
+    print('Valor Peso Retenção: %g' %pesoRetencao)
+    print('Valor Peso Relação: %g' %pesoRelacao)
+
+    resultados.append("PESOS")
+    resultados.append("\n")
+    resultados.append('Valor Peso Carga: %g' %pesoCarga)
+    resultados.append("\n")
+    resultados.append('Valor Peso Retenção: %g' %pesoRetencao)
+    resultados.append("\n")
+    resultados.append('Valor Peso Relação: %g' %pesoRelacao)
+    resultados.append("\n")
+    resultados.append("\n")
+
+
+#Método que imprime os valores das variáveis constantes no resultado da função objetivo
+def imprimirValoresParaFronteiraPareto(resultadosPareto, C, IR, RD, pesoCarga, pesoRetencao, pesoRelacao):
+    print('Pareto: '+str(round(C))+';'+str(round(IR))+';'+str(round(RD))+';'+str(pesoCarga)+';'+str(pesoRetencao)+';'+str(pesoRelacao))
+    resultadosPareto.append(str(round(C))+';'+str(round(IR))+';'+str(round(RD))+';'+str(pesoCarga)+';'+str(pesoRetencao)+';'+str(pesoRelacao))
+    resultadosPareto.append('\n')
+
+
+#Texto do gap relativo de uma resolução: '-' quando ele não é conhecido (sem solução ou gap não finito)
+def textoGap(gap):
+    return '-' if gap is None else '%.4g' % gap
@@ -0,0 +1,198 @@
+# Camada de montagem das restrições lineares do modelo. As linhas de todas as origens (pré-requisitos, relações entre
+# disciplinas, atribuição, carga, quantidade, retenção e transporte do termo RD linear) passam por MontagemRestricoes
+# antes de chegar ao solver. Cada linha é canonizada: termos da mesma variável somados, coeficientes nulos removidos,
+# termos em ordem de criação das variáveis e coeficientes divididos pelo máximo divisor comum (com o sinal do primeiro
+# termo positivo, trocando os limites quando necessário). Linhas com o mesmo lado esquerdo são unidas em um intervalo
+# inferior <= expressão <= superior, e são descartados:
+#   - as duplicatas exatas;
+#   - os lados dominados por um lado mais apertado de outra linha com o mesmo lado esquerdo, ou por uma desigualdade
+#     implicada informada pelo construtor (por exemplo, a diferença de períodos já garantida pelos pré-requisitos);
+#   - os lados garantidos pelos limites das variáveis (atividade mínima ou máxima da expressão).
+# Linhas com uma única variável criada pela montagem viram limites da variável. contagens registra, por origem,
+# quantas linhas foram recebidas, descartadas por cada motivo e emitidas (linhas que fornecem ao menos um lado de uma
+# restrição emitida; duas desigualdades opostas unidas em uma igualdade contam como duas emitidas).
+
+import math
+from functools import reduce
+
+from curriculumbalancing.solvers import CONTINUA
+
+#motivos de descarte, na ordem das contagens
+motivosDescarte = ('duplicada', 'dominada', 'redundante', 'limite')
+
+#tolerância das comparações de limites e atividades
+_tolerancia = 1e-9
+
+
+class MontagemRestricoes:
+    """Acumula as restrições lineares de ``modelo`` (backend de curriculumbalancing.solvers) e as emite, canonizadas e
+    sem duplicatas nem linhas dominadas, em ``emitir``. Apenas as variáveis criadas por ``variavel`` têm os limites
+    considerados; as demais (por exemplo C e IR, cujos limites o método epsilon-restrito altera) são tratadas como
+    livres."""
+
+    def __init__(self, modelo):
+        self.modelo = modelo
+        self._indices = {}
+        self._variaveis = []
+        #[inferior, superior] de cada variável; None para as variáveis não criadas pela montagem
+        self._limites = []
+        #chave canônica -> [lado inferior, lado superior]; lado é (valor, registro) ou None
+        self._linhas = {}
+        #chave canônica -> [inferior, superior] das desigualdades implicadas (não emitidas)
+        self._implicadas = {}
+        #registro de cada linha recebida: [origem, motivo do descarte, nome] (motivo None enquanto algum lado
+        #permanece); o nome de cada restrição emitida é o da linha que forneceu o lado
+        self._registros = []
+        self.contagens = {}
+
+    def _indice(self, variavel):
+        indice = self._indices.get(id(variavel))
+        if indice is None:
+            indice = self._indices[id(variavel)] = len(self._variaveis)
+            self._variaveis.append(variavel)
+            self._limites.append(None)
+        return indice
+
+    #Cria a variável no solver e registra os seus limites, usados na detecção de linhas redundantes
+    def variavel(self, lb=0, ub=None, tipo=CONTINUA, nome=''):
+        variavel = self.modelo.variavel(lb=lb, ub=ub, tipo=tipo, nome=nome)
+        self._limites[self._indice(variavel)] = [lb, math.inf if ub is None else ub]
+        return variavel
+
+    #Forma canônica de inferior <= soma(coeficientes * variaveis) <= superior: (chave, inferior, superior)
+    def _canonizar(self, variaveis, coeficientes, inferior, superior):
+        termos = {}
+        for variavel, coeficiente in zip(variaveis, coeficientes):
+            indice = self._indice(variavel)
+            termos[indice] = termos.get(indice, 0) + coeficiente
+        termos = sorted((indice, coeficiente) for indice, coeficiente in termos.items() if coeficiente != 0)
+        if not termos:
+            return (), inferior, superior
+        divisor = 1
+        if all(float(coeficiente).is_integer() for _, coeficiente in termos):
+            divisor = reduce(math.gcd, (int(abs(coeficiente)) for _, coeficiente in termos))
+        if termos[0][1] < 0:
+            divisor = -divisor
+            inferior, superior = superior, inferior
+        chave = tuple((indice, coeficiente / divisor if divisor != 1 else coeficiente) for indice, coeficiente in termos)
+        #+ 0.0 evita limites -0.0 na escrita do modelo
+        return chave, inferior / divisor + 0.0, superior / divisor + 0.0
+
+    #Adiciona a linha inferior <= soma(coeficientes * variaveis) <= superior (igualdade com inferior == superior);
+    #origem identifica a fonte da linha nas contagens
+    def adicionar(self, origem, variaveis, coeficientes, inferior=-math.inf, superior=math.inf, nome=''):
+        contagem = self.contagens.setdefault(origem, dict.fromkeys(('recebidas',) + motivosDescarte + ('emitidas',),
+                                                                   0))
+        contagem['recebidas'] += 1
+        registro = [origem, None, nome]
+        self._registros.append(registro)
+        chave, inferior, superior = self._canonizar(variaveis, coeficientes, inferior, superior)
+        linha = self._linhas.get(chave)
+        if linha is None:
+            self._linhas[chave] = [None if inferior == -math.inf else (inferior, registro),
+                                   None if superior == math.inf else (superior, registro)]
+            return
+        #une ao intervalo existente, mantendo o lado mais apertado
+        if inferior != -math.inf:
+            self._unirLado(linha, 0, inferior, registro, lambda novo, atual: novo > atual)
+        if superior != math.inf:
+            self._unirLado(linha, 1, superior, registro, lambda novo, atual: novo < atual)
+
+    def _unirLado(self, linha, lado, valor, registro, maisApertado):
+        atual = linha[lado]
+        if atual is None or maisApertado(valor, atual[0]):
+            linha[lado] = (valor, registro)
+            registro[1] = None
+            if atual is not None:
+                self._descartar(atual[1], 'dominada', linha)
+        else:
+            self._descartar(registro, 'duplicada' if valor == atual[0] else 'dominada', linha)
+
+    #Marca o registro como descartado quando nenhum dos seus lados permanece em linha
+    def _descartar(self, registro, motivo, linha):
+        if all(lado is None or lado[1] is not registro for lado in linha):
+            registro[1] = motivo
+
+    #Informa uma desigualdade inferior <= soma(coeficientes * variaveis) <= superior já garantida por outras linhas;
+    #ela não é emitida, mas descarta os lados das linhas com o mesmo lado esquerdo que não forem mais apertados
+    def implicada(self, variaveis, coeficientes, inferior=-math.inf, superior=math.inf):
+        chave, inferior, superior = self._canonizar(variaveis, coeficientes, inferior, superior)
+        implicada = self._implicadas.setdefault(chave, [-math.inf, math.inf])
+        implicada[0] = max(implicada[0], inferior)
+        implicada[1] = min(implicada[1], superior)
+
+    #Atividade mínima e máxima da expressão de chave pelos limites das variáveis
+    def _atividade(self, chave):
+        minimo = maximo = 0
+        for indice, coeficiente in chave:
+            limites = self._limites[indice]
+            if limites is None:
+                return -math.inf, math.inf
+            if coeficiente > 0:
+                minimo += coeficiente * limites[0]
+                maximo += coeficiente * limites[1]
+            else:
+                minimo += coeficiente * limites[1]
+                maximo += coeficiente * limites[0]
+        return minimo, maximo
+
+    #Emite as linhas restantes no solver e retorna a quantidade de restrições criadas
+    def emitir(self):
+        modelo = self.modelo
+        #linhas de uma única variável criada pela montagem: limites da variável
+        for chave, linha in list(self._linhas.items()):
+            if len(chave) != 1 or self._limites[chave[0][0]] is None:
+                continue
+            indice, coeficiente = chave[0]
+            limites = self._limites[indice]
+            if linha[0] is not None:
+                limites[0] = max(limites[0], linha[0][0] / coeficiente)
+            if linha[1] is not None:
+                limites[1] = min(limites[1], linha[1][0] / coeficiente)
+            modelo.limites(self._variaveis[indice], lb=limites[0], ub=limites[1])
+            for lado in linha:
+                if lado is not None:
+                    lado[1][1] = 'limite'
+            del self._linhas[chave]
+
+        quantidade = 0
+        for chave, (inferior, superior) in self._linhas.items():
+            minimo, maximo = self._atividade(chave)
+            implicada = self._implicadas.get(chave, (-math.inf, math.inf))
+            if inferior is not None and max(minimo, implicada[0]) >= inferior[0] - _tolerancia:
+                self._descartarLado(inferior, superior, 'redundante' if minimo >= inferior[0] - _tolerancia
+                                    else 'dominada')
+                inferior = None
+            if superior is not None and min(maximo, implicada[1]) <= superior[0] + _tolerancia:
+                self._descartarLado(superior, inferior, 'redundante' if maximo <= superior[0] + _tolerancia
+                                    else 'dominada')
+                superior = None
+            if inferior is None and superior is None:
+                continue
+            expressao = modelo.expressaoLinear([coeficiente for _, coeficiente in chave],
+                                               [self._variaveis[indice] for indice, _ in chave])
+            if inferior is not None and superior is not None and inferior[0] == superior[0]:
+                modelo.restricao(expressao == inferior[0], nome=inferior[1][2])
+                quantidade += 1
+                continue
+            if inferior is not None:
+                modelo.restricao(expressao >= inferior[0], nome=inferior[1][2])
+                quantidade += 1
+            if superior is not None:
+                modelo.restricao(expressao <= superior[0], nome=superior[1][2])
+                quantidade += 1
+
+        for origem, motivo, _ in self._registros:
+            self.contagens[origem][motivo or 'emitidas'] += 1
+        self._linhas = {}
+        self._registros = []
+        return quantidade
+
+    def _descartarLado(self, lado, outroLado, motivo):
+        if outroLado is None or outroLado[1] is not lado[1]:
+            lado[1][1] = motivo
+
+    #Total de linhas recebidas e descartadas, somando todas as origens
+    def totais(self):
+        return {campo: sum(contagem[campo] for contagem in self.contagens.values())
+                for campo in ('recebidas',) + motivosDescarte + ('emitidas',)}
@@ -0,0 +1,34 @@
+# Detecção de disciplinas intercambiáveis. Duas disciplinas são intercambiáveis quando a troca dos seus períodos leva
+# toda solução viável a outra solução viável com o mesmo valor de C, IR e RD: mesmos créditos e índice de retenção,
+# mesmas posições fixas (nivelamento, penúltimo e último período), mesmos pré-requisitos e dependentes e as mesmas
+# relações, com o mesmo grau e o mesmo sentido, com cada uma das demais disciplinas. As disciplinas de uma órbita (grupo
+# de disciplinas intercambiáveis entre si) podem ser ordenadas pelo período sem perda de soluções ótimas, o que evita
+# que o branch-and-bound percorra as permutações equivalentes.
+
+from curriculumbalancing.relacoes import comoRelacoes
+
+
+#Órbitas das disciplinas intercambiáveis: lista de listas ordenadas com ao menos duas disciplinas cada
+def orbitasDisciplinas(dados):
+    quantidadeDisciplinas = len(dados['creditos'])
+    vizinhanca = [set() for _ in range(quantidadeDisciplinas)]
+    for origem, destino, grau in comoRelacoes(dados['relacaoRelacaoDisciplinas']).arestas():
+        vizinhanca[origem].add((destino, grau, True))
+        vizinhanca[destino].add((origem, grau, False))
+    prerequisitos = [frozenset() for _ in range(quantidadeDisciplinas)]
+    dependentes = [set() for _ in range(quantidadeDisciplinas)]
+    for i, requisitos in dados['prerequisitos'].items():
+        prerequisitos[i] = frozenset(requisitos)
+        for pr in requisitos:
+            dependentes[pr].add(i)
+    nivelamento = set(dados['disciplinasNivelamento'])
+    penultimas = set(dados['disciplinasPenultimoPeriodo'])
+    ultimas = set(dados['disciplinasUltimoPeriodo'])
+
+    #disciplinas relacionadas entre si têm assinaturas diferentes (cada uma aparece apenas na vizinhança da outra)
+    grupos = {}
+    for i in range(quantidadeDisciplinas):
+        assinatura = (dados['creditos'][i], dados['indicesRetencao'][i], i in nivelamento, i in penultimas,
+                      i in ultimas, frozenset(vizinhanca[i]), prerequisitos[i], frozenset(dependentes[i]))
+        grupos.setdefault(assinatura, []).append(i)
+    return [grupo for grupo in grupos.values() if len(grupo) > 1]
@@ -0,0 +1,165 @@
+# Gerador de instâncias sintéticas do Problema do Balanceamento de Currículo, para estudos de escala.
+# A instância é construída a partir de uma solução de referência (o período de cada disciplina), sorteada com
+# quantidades de disciplinas equilibradas entre os períodos; pré-requisitos, relações entre disciplinas, disciplinas de
+# nivelamento e de penúltimo/último período são sorteados de forma compatível com essa solução, e os limites de carga
+# e de quantidade de disciplinas por período são derivados dela (com uma folga). Assim, toda instância gerada é viável.
+# O resultado tem o mesmo formato dos arquivos de instância (ver curriculumbalancing.instancia), acrescido da solução
+# de referência em periodosReferencia.
+
+import math
+import random
+
+from curriculumbalancing.modelo import relacaoNivel3, relacaoNivel9
+
+#distribuições padrão, próximas às dos quatro cursos reais: créditos (valor: peso) e graus das relações que não são
+#pré-requisitos (grau: peso); os pré-requisitos sempre têm grau relacaoNivel9
+distribuicaoCreditos = {2: 2, 3: 1, 4: 16, 6: 1}
+distribuicaoGraus = {3: 4, 5: 1, 6: 1, 7: 1, 8: 5}
+
+#distância entre um período e um período anterior (relação "para trás")
+penalidadeRetrocesso = 100
+
+
+#Matriz de distância entre períodos: quadrado da diferença para frente e penalidadeRetrocesso para trás
+def distanciaPeriodos(quantidadePeriodos):
+    return [[(b - a) ** 2 if b >= a else penalidadeRetrocesso for b in range(quantidadePeriodos)]
+            for a in range(quantidadePeriodos)]
+
+
+def _sortear(gerador, distribuicao):
+    valores = list(distribuicao)
+    return gerador.choices(valores, weights=[distribuicao[valor] for valor in valores])[0]
+
+
+#Gera uma instância sintética viável (dicionário no formato dos arquivos de instância).
+#  - prerequisitosPorDisciplina: média de pré-requisitos de cada disciplina que pode tê-los (densidade do DAG);
+#  - profundidadeMaxima: maior quantidade de disciplinas em uma cadeia de pré-requisitos (None: limitada apenas pelos
+#    períodos);
+#  - relacoesPorDisciplina: média de relações adicionais (não pré-requisitos) por disciplina, com graus sorteados de
+#    distribuicaoGrausRelacoes (grau: peso; graus a partir de relacaoNivel9 são reservados aos pré-requisitos);
+#  - distribuicaoCreditosDisciplinas: créditos das disciplinas (valor: peso); intervaloRetencao: índices de retenção
+#    sorteados uniformemente no intervalo fechado;
+#  - quantidadeNivelamento: disciplinas de nivelamento (entre as dos dois primeiros períodos);
+#  - folgaCarga e folgaQuantidade: folga dos limites de carga e de quantidade em relação à solução de referência;
+#    cargaMaximaLivre deixa a carga máxima por período sem limite (None), como em SINUFVJM
+def gerarInstancia(quantidadeDisciplinas, quantidadePeriodos, semente=0, prerequisitosPorDisciplina=0.8,
+                   profundidadeMaxima=None, relacoesPorDisciplina=0.4, distribuicaoGrausRelacoes=None,
+                   distribuicaoCreditosDisciplinas=None, intervaloRetencao=(0, 60), quantidadeNivelamento=None,
+                   folgaCarga=4, folgaQuantidade=2, cargaMaximaLivre=False, diferencaMinimaPeriodosRelacaoNivel3=0,
+                   diferencaMaximaPeriodosRelacaoNivel9=2):
+    if quantidadePeriodos < 3:
+        raise ValueError("quantidadePeriodos deve ser ao menos 3: %r" % quantidadePeriodos)
+    if quantidadeDisciplinas < 2 * quantidadePeriodos:
+        raise ValueError("quantidadeDisciplinas deve ser ao menos 2 * quantidadePeriodos: %r" % quantidadeDisciplinas)
+    gerador = random.Random(semente)
+    distribuicaoGrausRelacoes = distribuicaoGrausRelacoes or distribuicaoGraus
+    distribuicaoCreditosDisciplinas = distribuicaoCreditosDisciplinas or distribuicaoCreditos
+    #o modelo impõe a distância máxima a toda relação de grau relacaoNivel9, que a solução de referência só garante
+    #para os pré-requisitos
+    if max(distribuicaoGrausRelacoes) >= relacaoNivel9:
+        raise ValueError("distribuicaoGrausRelacoes deve ter apenas graus menores que %d: %r"
+                         % (relacaoNivel9, distribuicaoGrausRelacoes))
+
+    #solução de referência: quantidades equilibradas por período, disciplinas numeradas em ordem de período
+    quantidades = [quantidadeDisciplinas // quantidadePeriodos + (j < quantidadeDisciplinas % quantidadePeriodos)
+                   for j in range(quantidadePeriodos)]
+    periodo = [j for j in range(quantidadePeriodos) for _ in range(quantidades[j])]
+    porPeriodo = [[] for _ in range(quantidadePeriodos)]
+    for i, j in enumerate(periodo):
+        porPeriodo[j].append(i)
+
+    creditos = [_sortear(gerador, distribuicaoCreditosDisciplinas) for _ in range(quantidadeDisciplinas)]
+    indicesRetencao = [gerador.randint(*intervaloRetencao) for _ in range(quantidadeDisciplinas)]
+
+    #disciplinas de penúltimo e último período: uma de cada, na solução de referência
+    penultimas = [porPeriodo[quantidadePeriodos - 2][-1]]
+    ultimas = [porPeriodo[quantidadePeriodos - 1][-1]]
+
+    #nivelamento: disciplinas dos dois primeiros períodos, sem pré-requisitos
+    if quantidadeNivelamento is None:
+        quantidadeNivelamento = max(1, round(0.12 * quantidadeDisciplinas))
+    candidatasNivelamento = porPeriodo[0] + porPeriodo[1]
+    nivelamento = sorted(gerador.sample(candidatasNivelamento, min(quantidadeNivelamento, len(candidatasNivelamento))))
+    semPrerequisitos = set(nivelamento) | set(porPeriodo[0])
+
+    #pré-requisitos: de períodos anteriores, a no máximo diferencaMaximaPeriodosRelacaoNivel9 períodos
+    arestas = {}
+    prerequisitos = {}
+    profundidade = [1] * quantidadeDisciplinas
+    for i in range(quantidadeDisciplinas):
+        if i in semPrerequisitos:
+            continue
+        candidatas = [pr for j in range(max(0, periodo[i] - diferencaMaximaPeriodosRelacaoNivel9), periodo[i])
+                      for pr in porPeriodo[j]
+                      if profundidadeMaxima is None or profundidade[pr] < profundidadeMaxima]
+        quantidade = min(len(candidatas), _poisson(gerador, prerequisitosPorDisciplina))
+        if quantidade == 0:
+            continue
+        requisitos = sorted(gerador.sample(candidatas, quantidade))
+        prerequisitos[str(i)] = requisitos
+        profundidade[i] = 1 + max(profundidade[pr] for pr in requisitos)
+        for pr in requisitos:
+            arestas[(pr, i)] = relacaoNivel9
+
+    #relações adicionais, orientadas do período anterior para o posterior da solução de referência
+    for _ in range(round(relacoesPorDisciplina * quantidadeDisciplinas)):
+        a, b = gerador.sample(range(quantidadeDisciplinas), 2)
+        if periodo[a] > periodo[b]:
+            a, b = b, a
+        grau = _sortear(gerador, distribuicaoGrausRelacoes)
+        if (a, b) in arestas or (b, a) in arestas:
+            continue
+        if grau >= relacaoNivel3 and periodo[b] - periodo[a] < diferencaMinimaPeriodosRelacaoNivel3:
+            continue
+        arestas[(a, b)] = grau
+
+    #limites derivados da solução de referência
+    cargas = [sum(creditos[i] for i in porPeriodo[j]) for j in range(quantidadePeriodos)]
+    retencoes = [sum(indicesRetencao[i] for i in porPeriodo[j]) for j in range(quantidadePeriodos)]
+    distancia = distanciaPeriodos(quantidadePeriodos)
+    RD = sum(grau * distancia[periodo[a]][periodo[b]] for (a, b), grau in arestas.items())
+    cargaMinima = max(0, min(cargas) - folgaCarga)
+    cargaMaxima = None if cargaMaximaLivre else max(cargas) + folgaCarga
+    minCarga = math.ceil(sum(creditos) / quantidadePeriodos)
+    minRetencao = math.ceil(sum(indicesRetencao) / quantidadePeriodos)
+
+    return {
+        'curso': 'SINTETICO-%dx%d-%d' % (quantidadeDisciplinas, quantidadePeriodos, semente),
+        'diretorioResultados': 'resultadosSinteticos',
+        'codigosDisciplinasTraducao': [['SIN%04d' % i, 'DISCIPLINA SINTETICA %d' % i]
+                                       for i in range(quantidadeDisciplinas)],
+        'creditos': creditos,
+        'indicesRetencao': indicesRetencao,
+        'prerequisitos': prerequisitos,
+        'disciplinasNivelamento': nivelamento,
+        'disciplinasPenultimoPeriodo': penultimas,
+        'disciplinasUltimoPeriodo': ultimas,
+        'quantidadePeriodos': quantidadePeriodos,
+        'quantidadeMinimaDisciplinasPorPeriodo': max(1, min(quantidades) - folgaQuantidade),
+        'quantidadeMaximaDisciplinasPorPeriodo': max(quantidades) + folgaQuantidade,
+        'cargaMinimaPorPeriodo': cargaMinima,
+        'cargaMaximaPorPeriodo': cargaMaxima,
+        #limites de normalização: limites inferiores simples e os valores da solução de referência
+        'minCarga': minCarga,
+        'maxCarga': max(minCarga + 1, max(cargas)),
+        'minRetencao': minRetencao,
+        'maxRetencao': max(minRetencao + 1, max(retencoes)),
+        'minRelacao': 0,
+        'maxRelacao': max(1, RD),
+        'diferencaMinimaPeriodosRelacaoNivel3': diferencaMinimaPeriodosRelacaoNivel3,
+        'diferencaMaximaPeriodosRelacaoNivel9': diferencaMaximaPeriodosRelacaoNivel9,
+        'distanciaSemestres': distancia,
+        'relacaoRelacaoDisciplinas': [[a, b, grau] for (a, b), grau in sorted(arestas.items())],
+        'periodosReferencia': periodo
+    }
+
+
+#Sorteio de Poisson com média media (método de Knuth; médias pequenas)
+def _poisson(gerador, media):
+    limite = math.exp(-media)
+    quantidade = 0
+    produto = gerador.random()
+    while produto > limite:
+        quantidade += 1
+        produto *= gerador.random()
+    return quantidade
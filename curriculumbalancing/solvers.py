@@ -0,0 +1,366 @@
+# Backends de solver utilizados pela construção do modelo (ModeloBalanceamento), pela varredura de pesos, pela tabela de
+# payoff e pelo método epsilon-restrito. Cada backend expõe a mesma interface mínima (variáveis, restrições, objetivo,
+# resolução, leitura de valores, parâmetros e escrita do modelo); as expressões são as do próprio solver, montadas com
+# os operadores usuais (+, *, <=, ==, >=).
+#   - 'gurobi': gurobipy; suporta as formulações quadrática e linear do termo RD.
+#   - 'highs': highspy (HiGHS, código aberto); suporta apenas a formulação linear (MILP).
+# Os códigos de status seguem a numeração do Gurobi, para a qual os status do HiGHS são convertidos.
+# estatisticas() descreve a última resolução com as mesmas chaves nos dois backends (camposEstatisticas); valores que o
+# backend não informa ficam None. O gap é 0 nas resoluções ótimas e None sem solução ou quando não é finito (por
+# exemplo, com incumbente nulo); temSolucao indica se a última resolução encontrou uma solução viável.
+# acompanhar(acompanhamento) liga o acompanhamento das resoluções (progresso.AcompanhamentoResolucao): o callback do
+# backend informa incumbente, limitante e tempo decorrido e interrompe a resolução quando uma regra de parada é
+# satisfeita.
+
+import math
+import time
+
+import numpy as np
+
+try:
+    from gurobipy import GurobiError
+except ImportError:
+    #gurobipy é opcional quando apenas o backend HiGHS é utilizado
+    class GurobiError(Exception):
+        errno = None
+
+solvers = ('gurobi', 'highs')
+
+#códigos de status (numeração do Gurobi)
+CARREGADO = 1
+OTIMO = 2
+INVIAVEL = 3
+INVIAVEL_OU_ILIMITADO = 4
+ILIMITADO = 5
+LIMITE_ITERACOES = 7
+LIMITE_NOS = 8
+LIMITE_TEMPO = 9
+LIMITE_SOLUCOES = 10
+INTERROMPIDO = 11
+
+#estatísticas da última resolução: status, nós do branch-and-bound, iterações simplex, gap relativo, limitante dual,
+#unidades de trabalho (Gurobi) e tamanho do modelo após o presolve
+camposEstatisticas = ('status', 'nos', 'iteracoesSimplex', 'gap', 'limitante', 'trabalho', 'linhasPresolve',
+                      'colunasPresolve')
+
+#Gap relativo informado nas estatísticas: 0 quando a resolução é ótima (o backend pode informar um gap infinito com
+#objetivo nulo) e None quando não é finito
+def _gapEstatisticas(gap, status):
+    if status == OTIMO:
+        return 0.0
+    return gap if math.isfinite(gap) else None
+
+
+def _finito(valor):
+    return valor if math.isfinite(valor) else None
+
+
+#tipos de variável
+BINARIA = 'binaria'
+INTEIRA = 'inteira'
+CONTINUA = 'continua'
+
+
+class SolverGurobi:
+    """Backend gurobipy. Com ``threads`` informado, o modelo recebe um ambiente próprio com esse número de threads."""
+
+    nome = 'gurobi'
+    formulacoes = ('quadratica', 'linear')
+    _parametros = {'limiteTempo': 'TimeLimit', 'gap': 'MIPGap', 'threads': 'Threads', 'naoConvexo': 'NonConvex'}
+
+    def __init__(self, nome='curriculumbalancing', threads=None):
+        import gurobipy
+        self._gp = gurobipy
+        if threads is not None:
+            env = gurobipy.Env(empty=True)
+            env.setParam('OutputFlag', 0)
+            env.setParam('Threads', threads)
+            env.start()
+            self.nativo = gurobipy.Model(nome, env=env)
+        else:
+            self.nativo = gurobipy.Model(nome)
+        self.nativo.setParam('OutputFlag', False) # turns off solver chatter
+        self._tipos = {BINARIA: gurobipy.GRB.BINARY, INTEIRA: gurobipy.GRB.INTEGER,
+                       CONTINUA: gurobipy.GRB.CONTINUOUS}
+        self._removidasPresolve = None
+        self._acompanhamento = None
+
+    def variavel(self, lb=0, ub=None, tipo=CONTINUA, nome=''):
+        return self.nativo.addVar(lb=lb, ub=self._gp.GRB.INFINITY if ub is None else ub, vtype=self._tipos[tipo],
+                                  name=nome)
+
+    #comparacao é uma expressão do tipo expr <= valor, expr >= valor ou expr == valor
+    def restricao(self, comparacao, nome=''):
+        return self.nativo.addConstr(comparacao, name=nome)
+
+    def remover(self, restricoes):
+        self.nativo.remove(restricoes)
+
+    def soma(self, termos):
+        return self._gp.quicksum(termos)
+
+    def expressaoLinear(self, coeficientes, variaveis):
+        expressao = self._gp.LinExpr()
+        expressao.addTerms(coeficientes, variaveis)
+        return expressao
+
+    def expressaoQuadratica(self, coeficientes, variaveis1, variaveis2):
+        expressao = self._gp.QuadExpr()
+        expressao.addTerms(coeficientes, variaveis1, variaveis2)
+        return expressao
+
+    def limites(self, variavel, lb=None, ub=None):
+        if lb is not None:
+            variavel.LB = lb
+        if ub is not None:
+            variavel.UB = ub
+
+    def minimizar(self, expressao):
+        self.nativo.setObjective(expressao, self._gp.GRB.MINIMIZE)
+
+    def resolver(self):
+        self._removidasPresolve = None
+        self.nativo.optimize(self._callback)
+        if self._acompanhamento is not None:
+            estatisticas = self.estatisticas()
+            self._acompanhamento.finalizar(self.tempo, self.objetivo if self.temSolucao else None,
+                                           estatisticas['limitante'])
+
+    #acompanhamento (progresso.AcompanhamentoResolucao) das próximas resoluções; None desliga
+    def acompanhar(self, acompanhamento):
+        self._acompanhamento = acompanhamento
+
+    #callback da resolução: guarda as linhas e colunas removidas pelo presolve e informa o progresso do
+    #branch-and-bound ao acompanhamento, interrompendo a resolução quando ele pedir
+    def _callback(self, modelo, onde):
+        callback = self._gp.GRB.Callback
+        if onde == callback.PRESOLVE:
+            self._removidasPresolve = (modelo.cbGet(callback.PRE_ROWDEL), modelo.cbGet(callback.PRE_COLDEL))
+        elif self._acompanhamento is not None and (onde == callback.MIP or onde == callback.MIPSOL):
+            if onde == callback.MIP:
+                incumbente, limitante = modelo.cbGet(callback.MIP_OBJBST), modelo.cbGet(callback.MIP_OBJBND)
+            else:
+                incumbente = min(modelo.cbGet(callback.MIPSOL_OBJ), modelo.cbGet(callback.MIPSOL_OBJBST))
+                limitante = modelo.cbGet(callback.MIPSOL_OBJBND)
+            #sem incumbente ou sem limitante o Gurobi informa +-GRB.INFINITY (1e100)
+            infinito = self._gp.GRB.INFINITY
+            if self._acompanhamento.observar(modelo.cbGet(callback.RUNTIME),
+                                             incumbente if abs(incumbente) < infinito else None,
+                                             limitante if abs(limitante) < infinito else None):
+                modelo.terminate()
+
+    def parametro(self, nome, valor):
+        self.nativo.setParam(self._parametros[nome], valor)
+
+    #solução inicial (MIP start) para a próxima resolução; variáveis não informadas ficam a cargo do solver
+    def solucaoInicial(self, variaveis, valores):
+        self.nativo.setAttr('Start', variaveis, [float(valor) for valor in valores])
+
+    @property
+    def status(self):
+        return self.nativo.Status
+
+    @property
+    def tempo(self):
+        return self.nativo.Runtime
+
+    @property
+    def objetivo(self):
+        return self.nativo.ObjVal
+
+    @property
+    def temSolucao(self):
+        return self.nativo.SolCount > 0
+
+    def estatisticas(self):
+        nativo = self.nativo
+        estatisticas = dict.fromkeys(camposEstatisticas)
+        estatisticas.update(status=nativo.Status, iteracoesSimplex=int(nativo.IterCount), trabalho=nativo.Work)
+        if nativo.IsMIP:
+            estatisticas['nos'] = int(nativo.NodeCount)
+            if nativo.SolCount > 0:
+                estatisticas['gap'] = _gapEstatisticas(nativo.MIPGap, nativo.Status)
+                estatisticas['limitante'] = _finito(nativo.ObjBound)
+        if self._removidasPresolve is not None:
+            estatisticas['linhasPresolve'] = nativo.NumConstrs - self._removidasPresolve[0]
+            estatisticas['colunasPresolve'] = nativo.NumVars - self._removidasPresolve[1]
+        return estatisticas
+
+    #valor de uma variável ou expressão na última solução
+    def valor(self, expressao):
+        if isinstance(expressao, self._gp.Var):
+            return expressao.X
+        return expressao.getValue()
+
+    #valores de uma lista de variáveis em uma única chamada ao solver
+    def valores(self, variaveis):
+        return np.array(self.nativo.getAttr('X', variaveis))
+
+    @property
+    def quantidadeVariaveis(self):
+        self.nativo.update()
+        return self.nativo.NumVars
+
+    @property
+    def quantidadeRestricoes(self):
+        self.nativo.update()
+        return self.nativo.NumConstrs
+
+    #escreve o modelo; o formato é escolhido pela extensão do arquivo (.lp, .mps, com ou sem .gz)
+    def escrever(self, arquivo):
+        self.nativo.write(arquivo)
+
+
+class SolverHighs:
+    """Backend highspy (HiGHS). Apenas modelos lineares inteiros mistos; ``threads`` 0 ou None deixa a escolha ao
+    HiGHS."""
+
+    nome = 'highs'
+    formulacoes = ('linear',)
+    #naoConvexo não se aplica: o backend não aceita termos quadráticos
+    _parametros = {'limiteTempo': 'time_limit', 'gap': 'mip_rel_gap', 'threads': 'threads', 'naoConvexo': None}
+
+    def __init__(self, nome='curriculumbalancing', threads=None):
+        import highspy
+        self._hs = highspy
+        self.nativo = highspy.Highs()
+        self.nativo.silent()
+        if threads:
+            self.nativo.setOptionValue('threads', threads)
+        self._tipos = {BINARIA: highspy.HighsVarType.kInteger, INTEIRA: highspy.HighsVarType.kInteger,
+                       CONTINUA: highspy.HighsVarType.kContinuous}
+        estados = highspy.HighsModelStatus
+        self._status = {estados.kModelEmpty: OTIMO, estados.kOptimal: OTIMO, estados.kInfeasible: INVIAVEL,
+                        estados.kUnboundedOrInfeasible: INVIAVEL_OU_ILIMITADO, estados.kUnbounded: ILIMITADO,
+                        estados.kIterationLimit: LIMITE_ITERACOES, estados.kTimeLimit: LIMITE_TEMPO,
+                        estados.kSolutionLimit: LIMITE_SOLUCOES, estados.kInterrupt: INTERROMPIDO}
+        self._tempo = 0.0
+        self._acompanhamento = None
+        self._inscrito = False
+
+    def variavel(self, lb=0, ub=None, tipo=CONTINUA, nome=''):
+        if tipo == BINARIA:
+            lb, ub = max(lb, 0), 1 if ub is None else min(ub, 1)
+        return self.nativo.addVariable(lb=lb, ub=self._hs.kHighsInf if ub is None else ub, type=self._tipos[tipo],
+                                       name=nome or None)
+
+    def restricao(self, comparacao, nome=''):
+        return self.nativo.addConstr(comparacao, name=nome or None)
+
+    #as linhas são removidas em uma única chamada: cada remoção desloca os índices das linhas seguintes, o que
+    #invalidaria os índices das demais restrições da lista se elas fossem removidas uma a uma
+    def remover(self, restricoes):
+        indices = sorted({restricao.index for restricao in restricoes})
+        if not indices:
+            return
+        quantidade = self.nativo.getNumRow()
+        self.nativo.deleteRows(len(indices), np.array(indices, dtype=np.int32))
+        if self.nativo.getNumRow() != quantidade - len(indices):
+            raise RuntimeError("highs: remoção de %d restrições deixou %d linhas (esperadas %d)"
+                               % (len(indices), self.nativo.getNumRow(), quantidade - len(indices)))
+
+    def soma(self, termos):
+        return self.nativo.qsum(termos)
+
+    def expressaoLinear(self, coeficientes, variaveis):
+        return self.nativo.qsum(coeficiente * variavel for coeficiente, variavel in zip(coeficientes, variaveis))
+
+    def expressaoQuadratica(self, coeficientes, variaveis1, variaveis2):
+        raise ValueError("o backend highs aceita apenas a formulação linear do termo RD")
+
+    def limites(self, variavel, lb=None, ub=None):
+        _, _, atualLb, atualUb, _ = self.nativo.getCol(variavel.index)
+        self.nativo.changeColBounds(variavel.index, atualLb if lb is None else lb, atualUb if ub is None else ub)
+
+    def minimizar(self, expressao):
+        self.nativo.setObjective(expressao, self._hs.ObjSense.kMinimize)
+
+    def resolver(self):
+        inicio = time.perf_counter()
+        self.nativo.run()
+        self._tempo = time.perf_counter() - inicio
+        if self._acompanhamento is not None:
+            estatisticas = self.estatisticas()
+            self._acompanhamento.finalizar(self._tempo, self.objetivo if self.temSolucao else None,
+                                           estatisticas['limitante'])
+
+    #os callbacks do HiGHS são inscritos uma única vez; sem acompanhamento, _callback não faz nada
+    def acompanhar(self, acompanhamento):
+        self._acompanhamento = acompanhamento
+        if acompanhamento is not None and not self._inscrito:
+            self.nativo.cbMipImprovingSolution.subscribe(self._callback)
+            self.nativo.cbMipInterrupt.subscribe(self._callback)
+            self._inscrito = True
+
+    #callback de nova solução e de interrupção do MIP: informa o progresso e interrompe quando o acompanhamento pedir.
+    #O pedido de interrupção permanece nos dados do callback entre resoluções, por isso é sempre redefinido
+    def _callback(self, evento):
+        parar = False
+        if self._acompanhamento is not None:
+            saida = evento.data_out
+            incumbente = saida.mip_primal_bound if saida.mip_primal_bound < self._hs.kHighsInf else None
+            parar = self._acompanhamento.observar(saida.running_time, incumbente, saida.mip_dual_bound)
+        evento.interrupt(parar)
+
+    def parametro(self, nome, valor):
+        opcao = self._parametros[nome]
+        if opcao is not None:
+            self.nativo.setOptionValue(opcao, valor)
+
+    #solução inicial parcial: o HiGHS completa as variáveis não informadas antes da busca
+    def solucaoInicial(self, variaveis, valores):
+        self.nativo.setSolution(len(variaveis), np.array([variavel.index for variavel in variaveis], dtype=np.int32),
+                                np.asarray(valores, dtype=np.float64))
+
+    @property
+    def status(self):
+        return self._status.get(self.nativo.getModelStatus(), CARREGADO)
+
+    @property
+    def tempo(self):
+        return self._tempo
+
+    @property
+    def objetivo(self):
+        return self.nativo.getInfo().objective_function_value
+
+    @property
+    def temSolucao(self):
+        return self.nativo.getInfo().primal_solution_status == self._hs.SolutionStatus.kSolutionStatusFeasible
+
+    #o HiGHS não informa unidades de trabalho nem o tamanho do modelo após o presolve de uma resolução
+    def estatisticas(self):
+        informacoes = self.nativo.getInfo()
+        estatisticas = dict.fromkeys(camposEstatisticas)
+        estatisticas.update(status=self.status, nos=int(informacoes.mip_node_count),
+                            iteracoesSimplex=int(informacoes.simplex_iteration_count))
+        if self.temSolucao:
+            estatisticas['gap'] = _gapEstatisticas(informacoes.mip_gap, estatisticas['status'])
+            estatisticas['limitante'] = _finito(informacoes.mip_dual_bound)
+        return estatisticas
+
+    def valor(self, expressao):
+        return self.nativo.val(expressao)
+
+    def valores(self, variaveis):
+        return np.asarray(self.nativo.getSolution().col_value)[[variavel.index for variavel in variaveis]]
+
+    @property
+    def quantidadeVariaveis(self):
+        return self.nativo.getNumCol()
+
+    @property
+    def quantidadeRestricoes(self):
+        return self.nativo.getNumRow()
+
+    def escrever(self, arquivo):
+        self.nativo.writeModel(arquivo)
+
+
+#Cria o backend de nome solver ('gurobi' ou 'highs')
+def criarSolver(solver='gurobi', nome='curriculumbalancing', threads=None):
+    if solver == 'gurobi':
+        return SolverGurobi(nome, threads)
+    if solver == 'highs':
+        return SolverHighs(nome, threads)
+    raise ValueError("solver deve ser um de %s: %r" % (solvers, solver))
@@ -0,0 +1,359 @@
+# Varredura das combinações de pesos da função objetivo ponderada.
+# As combinações são independentes entre si: cada processo do pool constrói o seu próprio ModeloBalanceamento (com o
+# seu próprio ambiente do solver) uma única vez e resolve as combinações que lhe forem enviadas, apenas trocando a função
+# objetivo. Os resultados são devolvidos na ordem das combinações de pesos, independentemente da ordem de término.
+# A exportação do modelo para arquivo é opcional e, por padrão, fica fora do caminho crítico da varredura.
+# Com a partida quente, as combinações são resolvidas em ordem serpentina sobre o simplex de pesos (combinações
+# consecutivas são vizinhas na grade) e cada resolução recebe como solução inicial a alocação ótima da anterior,
+# resolvida no mesmo processo.
+# Com um CacheResolucoes, as combinações já resolvidas com a mesma instância, pesos, solver e parâmetros são lidas do
+# cache e apenas as demais são resolvidas (e guardadas).
+# Cada resultado resolvido traz o tempo de parede das fases da combinação ('tempos', chaves de metricas.fasesMetricas) e
+# as estatísticas do solver ('estatisticas'); a construção do modelo é atribuída à primeira combinação do processo.
+# Com um progresso.AcompanhamentoResolucao, o progresso de cada resolução é gravado enquanto ela roda e as regras de
+# parada podem interromper as resoluções (o motivo fica em 'motivoParada').
+# Com um orçamento de tempo total, as combinações são agendadas com limites de tempo por resolução: cada uma recebe a
+# sua parte do tempo restante, limitada a um múltiplo da mediana dos tempos das combinações já resolvidas até o fim
+# (as combinações muito mais difíceis que as demais são cortadas cedo, mas nunca antes da divisão uniforme do
+# orçamento), e as combinações não concluídas são revisitadas com o tempo que sobrar, a partir da sua melhor alocação.
+# Todo resultado traz o seu gap ('gap').
+
+import itertools
+import math
+import os
+import statistics
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+from curriculumbalancing.modelo import ModeloBalanceamento
+from curriculumbalancing.solvers import OTIMO
+
+#modos de exportação do modelo: uma vez por instância (com a função objetivo da primeira combinação resolvida) ou a
+#cada combinação de pesos
+modosExportacaoModelo = ('instancia', 'iteracao')
+#formatos de arquivo aceitos pelo solver na exportação (extensão do arquivo)
+formatosModelo = ('mps.gz', 'lp.gz', 'mps', 'lp')
+
+#com orçamento de tempo: múltiplo da mediana dos tempos das combinações já concluídas que limita cada resolução da
+#primeira passagem e menor limite de tempo concedido a uma resolução (segundos)
+fatorDificuldade = 4.0
+limiteMinimo = 0.1
+
+#modelo do processo corrente (criado por _inicializarProcesso), configuração da exportação (modo, arquivo, formato,
+#combinação exportada no modo 'instancia'), indicação de partida quente, alocação da última combinação resolvida no
+#processo, tempo de construção do modelo (ainda não atribuído a uma combinação), acompanhamento das resoluções e
+#indicação de modelo já exportado no modo 'instancia' (na revisita de uma combinação com orçamento de tempo, o modelo
+#não é escrito de novo)
+_balanceamento = None
+_exportacao = None
+_modeloExportado = False
+_partidaQuente = False
+_ultimaAlocacao = None
+_tempoConstrucao = None
+_acompanhamento = None
+
+
+#Gera as combinações de pesos (carga, retenção, relação) cuja soma é 1, com passo 1/divisoes, na mesma ordem
+#utilizada originalmente pelos scripts
+def gerarPesos(divisoes=10):
+    pesos = []
+    a = range(divisoes + 1)
+    for i in a:
+        for j in a:
+            for k in a:
+                if(i+j+k == divisoes):
+                    pesos.append((i/divisoes, j/divisoes, k/divisoes))
+    return pesos
+
+
+#Ordem serpentina das combinações de pesos: por peso de carga crescente e, dentro de cada peso de carga, por peso de
+#retenção alternadamente crescente e decrescente, de forma que combinações consecutivas sejam vizinhas no simplex.
+#Retorna os índices das combinações em pesos
+def ordemSerpentina(pesos):
+    linhas = {}
+    for c, (pesoCarga, pesoRetencao, _) in enumerate(pesos):
+        linhas.setdefault(pesoCarga, []).append((pesoRetencao, c))
+    ordem = []
+    for n, pesoCarga in enumerate(sorted(linhas)):
+        linha = sorted(linhas[pesoCarga], reverse=n % 2 == 1)
+        ordem.extend(c for _, c in linha)
+    return ordem
+
+
+#Cria o modelo persistente do processo corrente
+def _inicializarProcesso(dados, formulacaoRD, threadsPorProcesso, exportacao, solver, partidaQuente=False,
+                        acompanhamento=None):
+    global _balanceamento, _exportacao, _partidaQuente, _ultimaAlocacao, _tempoConstrucao, _acompanhamento
+    global _modeloExportado
+    inicio = time.perf_counter()
+    _balanceamento = ModeloBalanceamento(dados, formulacaoRD, solver=solver, threads=threadsPorProcesso)
+    _tempoConstrucao = time.perf_counter() - inicio
+    _exportacao = exportacao
+    _modeloExportado = False
+    _partidaQuente = partidaQuente
+    _ultimaAlocacao = None
+    _acompanhamento = acompanhamento
+    _balanceamento.modelo.acompanhar(acompanhamento)
+
+
+#Resolve uma combinação de pesos no modelo do processo corrente e devolve os valores necessários aos relatórios.
+#limiteTempo (segundos) limita a resolução e o limite é removido em seguida; se ela terminar sem solução viável, o
+#resultado não traz valores nem alocação (None) e a combinação fica para ser revisitada. solucaoInicial (alocação),
+#quando informada, substitui a alocação da combinação anterior como solução inicial
+def _resolverCombinacao(combinacao, limiteTempo=None, solucaoInicial=None):
+    global _ultimaAlocacao, _tempoConstrucao, _modeloExportado
+    c, (pesoCarga, pesoRetencao, pesoRelacao) = combinacao
+    balanceamento = _balanceamento
+    modelo = balanceamento.modelo
+    tempos = {}
+    if _tempoConstrucao is not None:
+        tempos['construcao'] = _tempoConstrucao
+        _tempoConstrucao = None
+
+    inicio = time.perf_counter()
+    balanceamento.definirPesos(pesoCarga, pesoRetencao, pesoRelacao)
+    if solucaoInicial is None and _partidaQuente:
+        solucaoInicial = _ultimaAlocacao
+    partidaQuente = solucaoInicial is not None
+    if partidaQuente:
+        balanceamento.definirSolucaoInicial(solucaoInicial)
+    tempos['objetivo'] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    if _acompanhamento is not None:
+        _acompanhamento.iniciar({'curso': balanceamento.dados.get('curso'), 'combinacao': c,
+                                 'pesos': [pesoCarga, pesoRetencao, pesoRelacao]})
+    if limiteTempo is not None:
+        modelo.parametro('limiteTempo', limiteTempo)
+    modelo.resolver()
+    runtime = modelo.tempo
+    if limiteTempo is not None:
+        modelo.parametro('limiteTempo', math.inf)
+    estatisticas = modelo.estatisticas()
+    solucao = limiteTempo is None or modelo.temSolucao
+    tempos['resolucao'] = time.perf_counter() - inicio
+
+    # Escreve o modelo em arquivo; cada combinação tem um nome próprio, sem disputa entre processos do pool
+    inicio = time.perf_counter()
+    if _exportacao is not None:
+        exportarModelo, arquivoModelo, formatoModelo, combinacaoExportada = _exportacao
+        if exportarModelo == 'iteracao':
+            modelo.escrever(arquivoModelo + '-' + str(c) + '.' + formatoModelo)
+        elif c == combinacaoExportada and not _modeloExportado:
+            modelo.escrever(arquivoModelo + '.' + formatoModelo)
+            _modeloExportado = True
+    tempos['gravacao'] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    alocacao = balanceamento.alocacao() if solucao else None
+    if _partidaQuente and solucao:
+        _ultimaAlocacao = alocacao
+    resultado = {
+        'combinacao': c,
+        'pesoCarga': pesoCarga,
+        'pesoRetencao': pesoRetencao,
+        'pesoRelacao': pesoRelacao,
+        'runtime': runtime,
+        'status': modelo.status,
+        'objetivo': modelo.objetivo if solucao else None,
+        'C': modelo.valor(balanceamento.C) if solucao else None,
+        'IR': modelo.valor(balanceamento.IR) if solucao else None,
+        'RD': modelo.valor(balanceamento.RD) if solucao else None,
+        'quantidadeTermosRD': balanceamento.quantidadeTermosRD,
+        'variaveisX': balanceamento.quantidadeVariaveisX,
+        'variaveisXRemovidas': balanceamento.quantidadeVariaveisXRemovidas,
+        'contagemRestricoes': balanceamento.contagemRestricoes,
+        'alocacao': alocacao,
+        'partidaQuente': partidaQuente,
+        'estatisticas': estatisticas,
+        'motivoParada': None if _acompanhamento is None else _acompanhamento.motivoParada
+    }
+    tempos['extracao'] = time.perf_counter() - inicio
+    resultado['gap'] = resultado['estatisticas']['gap']
+    resultado['tempos'] = tempos
+    return resultado
+
+
+#Executa a resolução no próprio processo, com a mesma interface de ProcessPoolExecutor.submit
+def _submeterLocal(funcao, *argumentos):
+    futuro = Future()
+    futuro.set_result(funcao(*argumentos))
+    return futuro
+
+
+#Une o resultado de uma nova tentativa de uma combinação ao da anterior: fica a melhor solução (qualquer solução é
+#melhor que nenhuma), com o tempo somado
+def _unirTentativas(anterior, novo):
+    if anterior is None:
+        novo['tentativas'] = 1
+        return novo
+    if anterior['alocacao'] is None or novo['alocacao'] is None:
+        melhor = anterior if novo['alocacao'] is None else novo
+    else:
+        melhor = novo if novo['objetivo'] <= anterior['objetivo'] else anterior
+    melhor['tentativas'] = anterior['tentativas'] + 1
+    melhor['runtime'] = anterior['runtime'] + novo['runtime']
+    melhor['tempos'] = {fase: anterior['tempos'].get(fase, 0.0) + novo['tempos'].get(fase, 0.0)
+                        for fase in anterior['tempos'].keys() | novo['tempos'].keys()}
+    return melhor
+
+
+#Agenda as combinações com um orçamento de tempo que termina em prazo (time.monotonic()), submetendo até paralelas
+#resoluções por vez. A primeira passagem percorre as combinações na ordem dada, cada uma partindo da última alocação
+#encontrada (toda alocação é viável para qualquer combinação de pesos, o que garante solução dentro do limite a partir
+#da primeira); as passagens seguintes revisitam as combinações não concluídas, primeiro as sem solução e depois por
+#gap decrescente, a partir da sua melhor alocação (ou da última encontrada), enquanto houver tempo. Produz cada
+#resultado quando ele é definitivo: concluído (ótimo ou interrompido por uma regra de parada) ou, ao final do
+#orçamento, com a melhor solução encontrada (sem alocação, se nenhuma tentativa encontrou solução)
+def _executarComOrcamento(combinacoes, prazo, submeter, paralelas):
+    fila = deque((c, peso, False) for c, peso in combinacoes)
+    cotaUniforme = (prazo - time.monotonic()) * paralelas / len(combinacoes)
+    melhores = {}
+    temposConcluidas = []
+    ultimaAlocacao = None
+    emAndamento = {}
+    while True:
+        while fila and len(emAndamento) < paralelas:
+            restante = prazo - time.monotonic()
+            c, peso, revisita = fila.popleft()
+            if revisita and restante < limiteMinimo:
+                fila.clear()
+                break
+            limite = restante * paralelas / (len(fila) + len(emAndamento) + 1)
+            if not revisita and temposConcluidas:
+                limite = min(limite, max(cotaUniforme, fatorDificuldade * statistics.median(temposConcluidas)))
+            limite = max(limiteMinimo, min(limite, restante))
+            inicial = melhores[c]['alocacao'] if revisita else None
+            if inicial is None:
+                inicial = ultimaAlocacao
+            emAndamento[submeter(_resolverCombinacao, (c, peso), limite, inicial)] = c
+        if not emAndamento:
+            pendentes = [resultado for resultado in melhores.values() if resultado is not None]
+            if not pendentes or prazo - time.monotonic() < limiteMinimo:
+                break
+            pendentes.sort(key=lambda resultado: -math.inf if resultado['gap'] is None else -resultado['gap'])
+            fila.extend((resultado['combinacao'], (resultado['pesoCarga'], resultado['pesoRetencao'],
+                                                   resultado['pesoRelacao']), True) for resultado in pendentes)
+            continue
+
+        concluidos, _ = wait(emAndamento, return_when=FIRST_COMPLETED)
+        for futuro in concluidos:
+            c = emAndamento.pop(futuro)
+            novo = futuro.result()
+            resultado = _unirTentativas(melhores.get(c), novo)
+            if novo['alocacao'] is not None and (resultado['tentativas'] == 1 or ultimaAlocacao is None):
+                ultimaAlocacao = novo['alocacao']
+            if novo['status'] == OTIMO or novo['motivoParada'] is not None:
+                if resultado['tentativas'] == 1:
+                    temposConcluidas.append(novo['runtime'])
+                melhores[c] = None
+                yield resultado
+            else:
+                melhores[c] = resultado
+
+    #orçamento esgotado: as combinações não concluídas ficam com a melhor solução encontrada, se houver
+    for resultado in melhores.values():
+        if resultado is not None:
+            yield resultado
+
+
+#Resolve todas as combinações de pesos. Com processos igual a 1 a varredura é feita no próprio processo, sobre um único
+#modelo; com processos maior que 1 (ou None, um por núcleo) as combinações são distribuídas em um pool de processos,
+#cada um com threadsPorProcesso threads do solver (0 deixa a escolha para o solver). solver escolhe o backend
+#('gurobi' ou 'highs').
+#exportarModelo ('instancia' ou 'iteracao') ativa a escrita do modelo em arquivoModelo (caminho sem extensão) no
+#formatoModelo escolhido: 'instancia' escreve <arquivoModelo>.<formato> uma vez, após a primeira combinação resolvida
+#(as lidas do cache não contam); 'iteracao' escreve <arquivoModelo>-<combinação>.<formato> após cada resolução. Por
+#padrão nada é escrito.
+#partidaQuente resolve as combinações em ordemSerpentina, cada uma partindo da alocação da anterior; no pool, cada
+#processo recebe um trecho contínuo dessa ordem.
+#cache (CacheResolucoes), quando informado, fornece os resultados das combinações já resolvidas (com 'cache' True);
+#o modelo só é construído se alguma combinação precisar ser resolvida.
+#aoResolver, quando informado, é chamado com cada resultado assim que ele está disponível (os lidos do cache primeiro,
+#depois na ordem de resolução), o que permite gravar resultados enquanto as combinações seguintes são resolvidas.
+#acompanhamento (progresso.AcompanhamentoResolucao), quando informado, recebe o progresso de cada resolução e pode
+#interrompê-la pelas suas regras de parada; no pool, cada processo grava no destino por conta própria. Resoluções
+#interrompidas não são guardadas no cache, já que não equivalem a uma resolução até o fim.
+#orcamento (segundos), quando informado, é o tempo total da varredura, contado a partir desta chamada: as combinações
+#são agendadas com limites de tempo por resolução (_executarComOrcamento) e os resultados não concluídos trazem a
+#melhor solução encontrada, com o seu gap (sem solução, 'alocacao' e os valores são None). Apenas os resultados
+#ótimos são guardados no cache.
+#Retorna a lista de resultados na ordem de pesos
+def executarVarredura(dados, pesos, processos=1, threadsPorProcesso=0, formulacaoRD='quadratica', exportarModelo=None,
+                      arquivoModelo='curriculumbalancing', formatoModelo='mps.gz', aoResolver=None, solver='gurobi',
+                      partidaQuente=True, cache=None, acompanhamento=None, orcamento=None):
+    prazo = None if orcamento is None else time.monotonic() + orcamento
+    exportacao = None
+    if exportarModelo is not None:
+        if exportarModelo not in modosExportacaoModelo:
+            raise ValueError("exportarModelo deve ser um de %s: %r" % (modosExportacaoModelo, exportarModelo))
+        if formatoModelo not in formatosModelo:
+            raise ValueError("formatoModelo deve ser um de %s: %r" % (formatosModelo, formatoModelo))
+        exportacao = (exportarModelo, arquivoModelo, formatoModelo)
+
+    ordem = ordemSerpentina(pesos) if partidaQuente else range(len(pesos))
+    combinacoes = [(c, pesos[c]) for c in ordem]
+
+    emCache = []
+    prefixo = None
+    if cache is not None:
+        prefixo = cache.prefixo(dados, formulacaoRD, solver, {'threads': threadsPorProcesso})
+        pendentes = []
+        for c, peso in combinacoes:
+            resultado = cache.obter(prefixo, peso)
+            if resultado is None:
+                pendentes.append((c, peso))
+            else:
+                resultado['combinacao'] = c
+                emCache.append(resultado)
+        combinacoes = pendentes
+    if not combinacoes:
+        return _coletar(emCache, aoResolver)
+    #no modo 'instancia', o modelo é escrito por quem resolver a primeira combinação que não veio do cache
+    if exportacao is not None:
+        exportacao += (combinacoes[0][0],)
+
+    if processos == 1:
+        _inicializarProcesso(dados, formulacaoRD, threadsPorProcesso, exportacao, solver, partidaQuente,
+                             acompanhamento)
+        if prazo is not None:
+            resolvidos = _executarComOrcamento(combinacoes, prazo, _submeterLocal, 1)
+        else:
+            resolvidos = (_resolverCombinacao(combinacao) for combinacao in combinacoes)
+        return _coletar(itertools.chain(emCache, _guardar(resolvidos, cache, prefixo)), aoResolver)
+
+    if processos is None:
+        processos = os.cpu_count()
+    #com partida quente, trechos contínuos da ordem serpentina para que cada processo resolva combinações vizinhas
+    tamanhoTrecho = math.ceil(len(combinacoes) / processos) if partidaQuente else 1
+    with ProcessPoolExecutor(max_workers=processos, mp_context=get_context('spawn'),
+                             initializer=_inicializarProcesso,
+                             initargs=(dados, formulacaoRD, threadsPorProcesso, exportacao, solver,
+                                       partidaQuente, acompanhamento)) as executor:
+        if prazo is not None:
+            resolvidos = _executarComOrcamento(combinacoes, prazo, executor.submit, processos)
+        else:
+            resolvidos = executor.map(_resolverCombinacao, combinacoes, chunksize=tamanhoTrecho)
+        return _coletar(itertools.chain(emCache, _guardar(resolvidos, cache, prefixo)), aoResolver)
+
+
+#Guarda no cache (quando houver) cada resultado resolvido, à medida que é produzido; apenas os resultados ótimos são
+#guardados (não os interrompidos por uma regra de parada ou pelo limite de tempo)
+def _guardar(resultados, cache, prefixo):
+    for resultado in resultados:
+        if cache is not None and resultado['status'] == OTIMO:
+            cache.guardar(prefixo, (resultado['pesoCarga'], resultado['pesoRetencao'], resultado['pesoRelacao']),
+                          resultado)
+        yield resultado
+
+
+def _coletar(resultados, aoResolver):
+    lista = []
+    for resultado in resultados:
+        if aoResolver is not None:
+            aoResolver(resultado)
+        lista.append(resultado)
+    lista.sort(key=lambda resultado: resultado['combinacao'])
+    return lista
@@ -0,0 +1,297 @@
+#!/usr/bin/python
+
+# Copyright 2019, Gurobi Optimization, LLC
+
+# O Problema do Balanceamento de Currículo consiste em atribuir disciplinas a periodos de forma que a carga acadêmica
+# de cada período seja balanceada o quanto for possível, respeitando relações de precedência(pre-requisitos) entre as
+# disciplinas.
+# O objetivo inicial é minimizar o maior valor dentre todos os valores de cargas dos períodos.
+# Neste modelo, são adicionadas ainda dois objetivos: reduzir a possibilidade de, quanto maiores forem as retenções históricas
+# das disciplinas, que estas não localizem-se em um mesmo período (realização de um melhor balanceio de dificuldades);
+# e também diminuir a distância entre disciplinas relacionadas por meio do grau de relação entre estas.
+# Assim, são definidas as variáveis (C) e (IR); e um somatório que representa o produto da relação entre as disciplinas e as distâncias entre as mesmas,
+# influenciados pelas localizações das disciplinas ao longo dos períodos.
+#
+# Os dados de cada curso ficam em arquivos de instância (instancias/*.json); o mesmo código de construção do modelo
+# (pacote curriculumbalancing) é utilizado para todos os cursos de uma execução.
+#
+# Uso: python curriculumbalancingMonoObjectivePonderado.py instancias/CCUFMG.json [outras instâncias ou diretórios]
+
+import argparse
+import os
+import time
+from datetime import datetime
+
+from curriculumbalancing import executarVarredura, formulacoesRD, fronteiraEpsilonRestrito, gerarPesos, \
+    limitesNormalizacao
+from curriculumbalancing.armazenamento import RegistroResultados, formatosResultados, linhaResultado
+from curriculumbalancing.cache import CacheResolucoes
+from curriculumbalancing.heuristica import executarVarreduraHeuristica
+from curriculumbalancing.instancia import caminhosInstancias, carregarInstancia
+from curriculumbalancing.metricas import RegistroMetricas, registroMetricas
+from curriculumbalancing.progresso import AcompanhamentoResolucao
+from curriculumbalancing.relatorio import imprimirGrade, imprimirPesos, imprimirSomatorioCargasPorPeriodo, \
+    imprimirSomatorioIndicesRetencao, imprimirValoresParaFronteiraPareto, imprimirValoresVariaveis, textoGap, \
+    totaisPorPeriodo
+from curriculumbalancing.restricoes import motivosDescarte
+from curriculumbalancing.solvers import LIMITE_TEMPO, GurobiError, solvers
+from curriculumbalancing.varredura import formatosModelo, modosExportacaoModelo
+
+#com orçamento de tempo no modo ponderado, fração do orçamento concedida à tabela de payoff; o que ela não usar fica
+#para a varredura
+fracaoOrcamentoPayoff = 0.25
+
+
+#Executa o balanceamento de uma instância e grava os resultados no diretório de resultados da instância: uma linha
+#estruturada por resolução (resultados <data>.csv/.jsonl/.parquet), o relatório legível (resultados <data>.txt), os
+#valores de C, IR, RD e pesos de cada solução para a fronteira de Pareto (dadosPareto <data>.txt) e as métricas de
+#cada resolução (metricas <data>.jsonl: tempo de cada fase e estatísticas do solver), resumidas ao final.
+#tempoLeitura é o tempo de leitura do arquivo de instância, atribuído à primeira resolução; acompanhamento
+#(AcompanhamentoResolucao) grava o progresso das resoluções do modo ponderado e aplica as regras de parada;
+#orcamento é o tempo total (segundos) do modo ponderado, contado a partir da tabela de payoff: ela recebe até
+#fracaoOrcamentoPayoff dele (se não terminar, ficam os limites do arquivo de instância) e o restante é distribuído entre
+#as combinações
+def executarInstancia(dados, modo, formulacaoRD, limitesPayoff, processos, threadsPorProcesso, exportarModelo=None,
+                      formatoModelo='mps.gz', formatosResultados=('csv', 'jsonl'), solver='gurobi',
+                      tempoHeuristica=10.0, semente=0, partidaQuente=True, cache=None, tempoLeitura=0.0,
+                      acompanhamento=None, orcamento=None):
+    resultados = list()
+    resultadosPareto = list()
+
+    codigosDisciplinasTraducao = dados['codigosDisciplinasTraducao']
+    creditos = dados['creditos']
+    indicesRetencao = dados['indicesRetencao']
+    # codigos dos períodos
+    periodos = range(dados['quantidadePeriodos'])
+    diretorioResultados = dados.get('diretorioResultados', 'resultados' + dados['curso'])
+    os.makedirs(diretorioResultados, exist_ok=True)
+    data_e_hora_em_texto = str(datetime.now()).replace(":", "_").replace(" ", "_")
+
+    print('Curso: ' + dados['curso'])
+
+################################################## FUNÇÃO OBJETIVO #####################################################
+
+    #pesos para os termos da função objetivo
+    pesos = gerarPesos()
+    runtime = 0
+    c = 0
+    lidosCache = 0
+
+############################################## IMPRESSÃO DOS RESULTADOS ################################################
+
+    registro = RegistroResultados(os.path.join(diretorioResultados, "resultados " + data_e_hora_em_texto),
+                                  formatosResultados)
+    metricas = RegistroMetricas(os.path.join(diretorioResultados, "metricas " + data_e_hora_em_texto + ".jsonl"))
+
+    #Imprime o resultado de uma resolução e o envia ao registro, que grava em segundo plano
+    def registrarResultado(resultado):
+        nonlocal runtime, c, lidosCache
+        if c == 0:
+            print('Termos em RD: ' + str(resultado['quantidadeTermosRD']))
+            #resultados lidos do cache não trazem a contagem de variáveis
+            if 'variaveisXRemovidas' in resultado:
+                print('Variáveis X: %d (%d fora das janelas de períodos não criadas)'
+                      % (resultado['variaveisX'], resultado['variaveisXRemovidas']))
+                for origem, contagem in resultado['contagemRestricoes'].items():
+                    print('Restrições de %s: %d recebidas, %d emitidas (%s)'
+                          % (origem, contagem['recebidas'], contagem['emitidas'],
+                             ', '.join('%d %ss' % (contagem[motivo], motivo) for motivo in motivosDescarte)))
+        pesoCarga = resultado.get('pesoCarga', '')
+        pesoRetencao = resultado.get('pesoRetencao', '')
+        pesoRelacao = resultado.get('pesoRelacao', '')
+        alocacao = resultado['alocacao']
+        runtime = runtime + resultado['runtime']
+        lidosCache += resultado.get('cache', False)
+        print('runtime is', runtime)
+        #com orçamento de tempo, uma combinação pode terminar sem solução: só as métricas são registradas
+        if alocacao is None:
+            print('Combinação %d sem solução viável no orçamento de tempo (%d tentativas)'
+                  % (resultado['combinacao'], resultado['tentativas']))
+            tempos = dict(resultado['tempos'], leitura=tempoLeitura if c == 0 else 0.0)
+            metricas.registrar(registroMetricas(dados['curso'], resultado['combinacao'], resultado, tempos))
+            c = c + 1
+            return
+        cargas, retencoes = totaisPorPeriodo(alocacao, creditos, indicesRetencao)
+        if resultado.get('motivoParada'):
+            print('Resolução interrompida (%s) com gap %s' % (resultado['motivoParada'], textoGap(resultado['gap'])))
+        elif resultado.get('tentativas') and resultado['status'] == LIMITE_TEMPO:
+            print('Resolução não concluída no orçamento de tempo (%d tentativas) com gap %s'
+                  % (resultado['tentativas'], textoGap(resultado['gap'])))
+
+        #impressão dos resultados
+        print("\n")
+        print("Solução: "+ str(c))
+        print("\n")
+        resultados.append("Solução: "+ str(c))
+        resultados.append("\n")
+        resultados.append("\n")
+        if modo != 'epsilon':
+            imprimirPesos(resultados, pesoCarga, pesoRetencao, pesoRelacao)
+            print("\n")
+        imprimirValoresVariaveis(resultados, resultado['C'], resultado['IR'], resultado['RD'])
+        print("\n")
+        imprimirSomatorioCargasPorPeriodo(cargas, resultados)
+        print("\n")
+        imprimirSomatorioIndicesRetencao(retencoes, resultados)
+        print("\n")
+        imprimirGrade(alocacao, periodos, codigosDisciplinasTraducao, creditos, indicesRetencao, cargas, retencoes,
+                      resultados)
+        imprimirValoresParaFronteiraPareto(resultadosPareto, resultado['C'], resultado['IR'], resultado['RD'],
+                                           pesoCarga, pesoRetencao, pesoRelacao)
+
+        if modo != 'epsilon':
+            print('Valor função objetivo: %g' % resultado['objetivo'])
+            resultados.append('Valor função objetivo: %g' % resultado['objetivo'])
+        resultados.append("\n\n")
+
+        inicio = time.perf_counter()
+        registro.registrar(linhaResultado(dados['curso'], resultado.get('combinacao', c), resultado))
+        registro.registrarTexto(''.join(resultados))
+        resultados.clear()
+
+        #tempos das fases medidas na varredura, mais a leitura da instância (primeira resolução) e a gravação
+        tempos = dict(resultado.get('tempos', {}))
+        if c == 0:
+            tempos['leitura'] = tempoLeitura
+        tempos['gravacao'] = tempos.get('gravacao', 0.0) + time.perf_counter() - inicio
+        metricas.registrar(registroMetricas(dados['curso'], resultado.get('combinacao', c), resultado, tempos))
+        c = c + 1
+
+############################################### EXECUÇÃO DA FUNÇÃO OBJETIVO ############################################
+
+    try:
+        if modo == 'epsilon':
+            #Calcula a fronteira de Pareto completa; os pontos não possuem pesos associados
+            resultadosVarredura, resolucoes = fronteiraEpsilonRestrito(dados, formulacaoRD, solver)
+            print('Resoluções: ' + str(resolucoes) + ' - Pontos não dominados: ' + str(len(resultadosVarredura)))
+            for resultado in resultadosVarredura:
+                registrarResultado(resultado)
+        else:
+            inicioOrcamento = time.monotonic()
+            if limitesPayoff:
+                #a tabela de payoff usa o modelo exato; para currículos grandes, use os limites do arquivo de instância
+                limiteTempoPayoff = None
+                if orcamento is not None and modo == 'ponderado':
+                    limiteTempoPayoff = fracaoOrcamentoPayoff * orcamento
+                dados = limitesNormalizacao(dados, formulacaoRD, solver=solver, limiteTempo=limiteTempoPayoff)
+                print('Limites de normalização (payoff): C ' + str(dados['minCarga']) + '-' + str(dados['maxCarga']) +
+                      ' - IR ' + str(dados['minRetencao']) + '-' + str(dados['maxRetencao']) +
+                      ' - RD ' + str(dados['minRelacao']) + '-' + str(dados['maxRelacao']))
+
+            if modo == 'heuristico':
+                #Busca local com tempo fixo por combinação de pesos; cada combinação parte da melhor solução anterior
+                executarVarreduraHeuristica(dados, pesos, tempoHeuristica, semente, aoResolver=registrarResultado)
+            else:
+                #Realiza o balanceamento para todas as combinações de pesos; o modelo (variáveis e restrições) é
+                #construído uma única vez em cada processo e a cada combinação apenas a função objetivo é substituída.
+                #Cada resultado é registrado assim que fica disponível, enquanto as combinações seguintes são
+                #resolvidas. O modelo exportado fica no diretório de resultados, com nome distinto a cada execução.
+                #Com partida quente, as combinações são resolvidas em ordem serpentina, cada uma a partir da anterior.
+                #As combinações presentes no cache de resoluções não são resolvidas novamente. O orçamento de tempo
+                #da varredura é o que sobrou após a tabela de payoff
+                if orcamento is not None:
+                    orcamento = max(0.0, orcamento - (time.monotonic() - inicioOrcamento))
+                executarVarredura(dados, pesos, processos, threadsPorProcesso, formulacaoRD, exportarModelo,
+                                  os.path.join(diretorioResultados, "modelo " + data_e_hora_em_texto), formatoModelo,
+                                  aoResolver=registrarResultado, solver=solver, partidaQuente=partidaQuente,
+                                  cache=cache, acompanhamento=acompanhamento, orcamento=orcamento)
+                print('Tempo total de resolução (%s partida quente): %.3f s' %
+                      ('com' if partidaQuente else 'sem', runtime))
+                if lidosCache:
+                    print('Resultados lidos do cache de resoluções: %d de %d' % (lidosCache, c))
+        with open(os.path.join(diretorioResultados, "dadosPareto " + data_e_hora_em_texto + ".txt"), "w",
+                  encoding='utf-8') as arquivoPareto:
+            arquivoPareto.writelines(resultadosPareto)
+        resumo = metricas.resumo()
+        print('\nTempo por fase e estatísticas do solver:\n' + resumo)
+        registro.registrarTexto('Tempo por fase e estatísticas do solver:\n' + resumo + '\n')
+    finally:
+        metricas.fechar()
+        registro.fechar()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Balanceamento de currículo por soma ponderada, epsilon-restrito ou busca local')
+    parser.add_argument('instancias', nargs='+',
+                        help='arquivos de instância (.json) ou diretórios com arquivos de instância')
+    parser.add_argument('--modo', choices=('ponderado', 'epsilon', 'heuristico'), default='ponderado',
+                        help="'ponderado': varredura da grade de pesos; 'epsilon': fronteira de Pareto exata pelo "
+                             "método epsilon-restrito sobre C, IR e RD; 'heuristico': varredura da grade de pesos "
+                             "por busca local (simulated annealing), para currículos grandes")
+    parser.add_argument('--formulacao-rd', choices=formulacoesRD, default='quadratica',
+                        help="formulação do termo RD: 'quadratica' (original) ou 'linear' (MILP)")
+    parser.add_argument('--limites-manuais', action='store_true',
+                        help='utiliza os limites de normalização do arquivo de instância em vez da tabela de payoff')
+    parser.add_argument('--processos', type=int, default=None,
+                        help='processos da varredura de pesos (padrão: um por núcleo; 1 = sem paralelismo)')
+    parser.add_argument('--threads', type=int, default=1,
+                        help='threads do solver em cada processo (0 = escolha automática do solver)')
+    parser.add_argument('--exportar-modelo', choices=('nenhum',) + modosExportacaoModelo, default='nenhum',
+                        help="escrita do modelo no diretório de resultados: 'nenhum' (padrão), 'instancia' (uma vez) "
+                             "ou 'iteracao' (a cada combinação de pesos)")
+    parser.add_argument('--formato-modelo', choices=formatosModelo, default='mps.gz',
+                        help='formato do modelo exportado (padrão: MPS comprimido)')
+    parser.add_argument('--formatos-resultados', nargs='+', choices=formatosResultados, default=['csv', 'jsonl'],
+                        help="formatos do registro estruturado dos resultados ('parquet' requer pyarrow)")
+    parser.add_argument('--solver', choices=solvers, default='gurobi',
+                        help="backend do solver: 'gurobi' ou 'highs' (código aberto; apenas --formulacao-rd linear)")
+    parser.add_argument('--tempo-heuristica', type=float, default=10.0,
+                        help='segundos de busca local por combinação de pesos no modo heuristico')
+    parser.add_argument('--semente', type=int, default=0,
+                        help='semente do gerador de números aleatórios da busca local')
+    parser.add_argument('--sem-partida-quente', action='store_true',
+                        help='resolve as combinações de pesos na ordem original, sem solução inicial (modo ponderado)')
+    parser.add_argument('--cache-resolucoes', default='cacheResolucoes',
+                        help="diretório do cache de resoluções do modo ponderado ('nenhum' desativa o cache)")
+    parser.add_argument('--tamanho-cache', type=float, default=256,
+                        help='tamanho máximo do cache de resoluções em MiB (as entradas mais antigas são removidas)')
+    parser.add_argument('--progresso', default=None,
+                        help="destino do progresso das resoluções do modo ponderado em JSON Lines: arquivo, '-' "
+                             "(saída padrão) ou tcp://host:porta")
+    parser.add_argument('--parar-gap', type=float, default=None,
+                        help='interrompe cada resolução quando o gap relativo chega a este valor')
+    parser.add_argument('--parar-sem-melhoria', type=float, default=None,
+                        help='interrompe cada resolução após estes segundos sem melhora da melhor solução')
+    parser.add_argument('--prazo', type=float, default=None,
+                        help='segundos a partir do início da execução após os quais as resoluções são interrompidas '
+                             'assim que tiverem uma solução viável')
+    parser.add_argument('--orcamento', type=float, default=None,
+                        help='tempo total em segundos de cada instância no modo ponderado, incluindo a tabela de '
+                             'payoff (que recebe até a fração %g dele): as combinações recebem limites de tempo e as '
+                             'não concluídas são revisitadas com o tempo que sobrar' % fracaoOrcamentoPayoff)
+    args = parser.parse_args()
+    inicioExecucao = time.time()
+
+    try:
+        #cada instância é lida uma única vez; o código de construção do modelo é o mesmo para todas
+        instancias = []
+        for caminho in args.instancias:
+            for arquivo in caminhosInstancias(caminho) if os.path.isdir(caminho) else [caminho]:
+                inicio = time.perf_counter()
+                dados = carregarInstancia(arquivo)
+                instancias.append((dados, time.perf_counter() - inicio))
+
+        cache = None
+        if args.cache_resolucoes != 'nenhum':
+            cache = CacheResolucoes(args.cache_resolucoes, int(args.tamanho_cache * 1024 * 1024))
+
+        acompanhamento = None
+        if args.progresso is not None or args.parar_gap is not None or args.parar_sem_melhoria is not None or \
+                args.prazo is not None:
+            acompanhamento = AcompanhamentoResolucao(args.progresso, args.parar_gap, args.parar_sem_melhoria,
+                                                     None if args.prazo is None else inicioExecucao + args.prazo)
+
+        for dados, tempoLeitura in instancias:
+            executarInstancia(dados, args.modo, args.formulacao_rd, not args.limites_manuais, args.processos,
+                              args.threads, None if args.exportar_modelo == 'nenhum' else args.exportar_modelo,
+                              args.formato_modelo, args.formatos_resultados, args.solver, args.tempo_heuristica,
+                              args.semente, not args.sem_partida_quente, cache, tempoLeitura, acompanhamento,
+                              args.orcamento)
+        if acompanhamento is not None:
+            acompanhamento.fechar()
+
+    except GurobiError as e:
+        print('Error code ' + str(e.errno) + ": " + str(e))
+
+    except AttributeError:
+        print('Encountered an attribute error')
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+
+# Gera instâncias sintéticas viáveis (curriculumbalancing.sintetico) no formato dos arquivos de instância, para estudos
+# de escala com curriculumbalancingMonoObjectivePonderado.py e benchmarkSuite.py.
+#
+# Uso: python gerarInstanciasSinteticas.py 100 500 1000 [--periodos 10] [--semente 0] [--diretorio instanciasSinteticas]
+#      [--creditos 2:2 4:16] [--graus 3:4 8:5]
+
+import argparse
+import json
+import os
+
+from curriculumbalancing.modelo import relacaoNivel9
+from curriculumbalancing.sintetico import distribuicaoCreditos, distribuicaoGraus, gerarInstancia
+
+
+#Par valor:peso de uma distribuição informada na linha de comando
+def _valorPeso(texto):
+    valor, separador, peso = texto.partition(':')
+    try:
+        return int(valor), float(peso) if separador else 1.0
+    except ValueError:
+        raise argparse.ArgumentTypeError("esperado valor:peso (por exemplo 4:16): %r" % texto)
+
+
+def _formatarDistribuicao(distribuicao):
+    return ' '.join('%d:%g' % item for item in distribuicao.items())
+
+
+#Gera e grava uma instância por quantidade de disciplinas; retorna os caminhos dos arquivos
+def gravarInstancias(quantidades, diretorio, quantidadePeriodos, semente=0, **opcoes):
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = []
+    for quantidadeDisciplinas in quantidades:
+        conteudo = gerarInstancia(quantidadeDisciplinas, quantidadePeriodos, semente, **opcoes)
+        caminho = os.path.join(diretorio, conteudo['curso'] + '.json')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(conteudo, arquivo, ensure_ascii=False)
+        caminhos.append(caminho)
+    return caminhos
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Geração de instâncias sintéticas de balanceamento de currículo')
+    parser.add_argument('quantidades', nargs='+', type=int, help='quantidades de disciplinas das instâncias')
+    parser.add_argument('--periodos', type=int, default=10, help='quantidade de períodos (padrão: 10)')
+    parser.add_argument('--semente', type=int, default=0, help='semente do gerador de números aleatórios')
+    parser.add_argument('--diretorio', default='instanciasSinteticas', help='diretório das instâncias geradas')
+    parser.add_argument('--prerequisitos', type=float, default=0.8,
+                        help='média de pré-requisitos por disciplina (densidade do DAG)')
+    parser.add_argument('--profundidade', type=int, default=None,
+                        help='maior quantidade de disciplinas em uma cadeia de pré-requisitos')
+    parser.add_argument('--relacoes', type=float, default=0.4,
+                        help='média de relações adicionais (não pré-requisitos) por disciplina')
+    parser.add_argument('--graus', type=_valorPeso, nargs='+', default=None, metavar='GRAU:PESO',
+                        help='distribuição dos graus das relações adicionais, menores que %d (padrão: %s)'
+                             % (relacaoNivel9, _formatarDistribuicao(distribuicaoGraus)))
+    parser.add_argument('--creditos', type=_valorPeso, nargs='+', default=None, metavar='CREDITOS:PESO',
+                        help='distribuição dos créditos das disciplinas (padrão: %s)'
+                             % _formatarDistribuicao(distribuicaoCreditos))
+    parser.add_argument('--retencao', type=int, nargs=2, default=(0, 60), metavar=('MIN', 'MAX'),
+                        help='intervalo dos índices de retenção')
+    parser.add_argument('--nivelamento', type=int, default=None,
+                        help='quantidade de disciplinas de nivelamento (padrão: 12%% das disciplinas)')
+    parser.add_argument('--folga-carga', type=int, default=4,
+                        help='folga dos limites de carga por período em relação à solução de referência')
+    parser.add_argument('--folga-quantidade', type=int, default=2,
+                        help='folga dos limites de quantidade de disciplinas por período')
+    parser.add_argument('--carga-maxima-livre', action='store_true', help='sem limite de carga máxima por período')
+    args = parser.parse_args()
+
+    try:
+        caminhos = gravarInstancias(args.quantidades, args.diretorio, args.periodos, args.semente,
+                                    prerequisitosPorDisciplina=args.prerequisitos,
+                                    profundidadeMaxima=args.profundidade, relacoesPorDisciplina=args.relacoes,
+                                    distribuicaoGrausRelacoes=args.graus and dict(args.graus),
+                                    distribuicaoCreditosDisciplinas=args.creditos and dict(args.creditos),
+                                    intervaloRetencao=tuple(args.retencao), quantidadeNivelamento=args.nivelamento,
+                                    folgaCarga=args.folga_carga, folgaQuantidade=args.folga_quantidade,
+                                    cargaMaximaLivre=args.carga_maxima_livre)
+    except ValueError as e:
+        parser.error(str(e))
+    for caminho in caminhos:
+        print(caminho)